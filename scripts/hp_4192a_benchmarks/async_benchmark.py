@@ -0,0 +1,159 @@
+"""
+Offline throughput benchmark for `AsyncHP4192A`.
+
+Purpose
+-------
+Show how measurement throughput scales when one event loop drives several
+HP 4192A analyzers behind one LAN/GPIB gateway.
+
+What this script does
+---------------------
+- creates N `HP4192AEmulator` analyzers that share one emulated GPIB bus
+- each bus transaction (write or read) holds the shared bus for
+  `--bus-latency-ms`; the driver settle sleeps do not hold the bus
+- runs `--points` `measure()` calls per analyzer, first one analyzer after
+  another with the blocking `HP4192A`, then all at once with `AsyncHP4192A`
+- prints total throughput and speedup for each N
+
+No instrument is needed. Throughput should grow close to linearly with N until
+the shared bus is busy all the time.
+
+How to use
+----------
+Run from the repo root:
+
+   python scripts/hp_4192a_benchmarks/async_benchmark.py
+
+Optional:
+
+   python scripts/hp_4192a_benchmarks/async_benchmark.py --analyzers 1 2 4 8 --points 20
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import asyncio
+import sys
+import threading
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments import AsyncHP4192A, HP4192A, HP4192AEmulator  # noqa: E402
+
+
+DEFAULT_ANALYZERS = [1, 2, 4, 8]
+DEFAULT_POINTS = 10
+DEFAULT_BUS_LATENCY_MS = 2.0
+
+
+class SharedBusEmulator(HP4192AEmulator):
+    """
+    Emulated analyzer that holds a shared bus lock for the duration of each
+    write or read transaction.
+    """
+
+    def __init__(self, resource_name: str, bus_lock: threading.Lock, bus_latency_s: float):
+        super().__init__(
+            resource_name=resource_name,
+            write_latency_s=bus_latency_s,
+            read_latency_s=bus_latency_s,
+        )
+        self._bus_lock = bus_lock
+
+    def write(self, message: str) -> None:
+        with self._bus_lock:
+            super().write(message)
+
+    def read(self) -> str:
+        with self._bus_lock:
+            return super().read()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare blocking and asyncio HP 4192A throughput on emulated analyzers."
+    )
+    parser.add_argument(
+        "--analyzers",
+        type=int,
+        nargs="+",
+        default=DEFAULT_ANALYZERS,
+        help=f"Analyzer counts to test. Default: {DEFAULT_ANALYZERS}.",
+    )
+    parser.add_argument(
+        "--points",
+        type=int,
+        default=DEFAULT_POINTS,
+        help=f"measure() calls per analyzer. Default: {DEFAULT_POINTS}.",
+    )
+    parser.add_argument(
+        "--bus-latency-ms",
+        type=float,
+        default=DEFAULT_BUS_LATENCY_MS,
+        help=f"Bus time per write or read. Default: {DEFAULT_BUS_LATENCY_MS}.",
+    )
+    return parser.parse_args()
+
+
+def build_meters(count: int, bus_latency_s: float) -> list[HP4192A]:
+    bus_lock = threading.Lock()
+    return [
+        HP4192A(
+            SharedBusEmulator(
+                f"TCPIP0::127.0.0.1::gpib0,{address}::INSTR",
+                bus_lock,
+                bus_latency_s,
+            )
+        )
+        for address in range(1, count + 1)
+    ]
+
+
+def run_blocking(meters: list[HP4192A], points: int) -> float:
+    started_at = time.perf_counter()
+    for meter in meters:
+        for _ in range(points):
+            meter.measure()
+    return time.perf_counter() - started_at
+
+
+async def run_async(meters: list[HP4192A], points: int) -> float:
+    async_meters = [AsyncHP4192A(meter) for meter in meters]
+
+    async def run_one(meter: AsyncHP4192A) -> None:
+        for _ in range(points):
+            await meter.measure()
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(run_one(meter) for meter in async_meters))
+    return time.perf_counter() - started_at
+
+
+def main() -> None:
+    args = parse_args()
+    bus_latency_s = args.bus_latency_ms / 1000.0
+
+    print("HP 4192A async_benchmark")
+    print("------------------------")
+    print(f"Points per analyzer: {args.points}")
+    print(f"Bus latency per transaction: {args.bus_latency_ms:g} ms")
+    print()
+    print(f"{'analyzers':>9} {'blocking pts/s':>15} {'async pts/s':>12} {'speedup':>8}")
+
+    for count in args.analyzers:
+        total_points = count * args.points
+        blocking_s = run_blocking(build_meters(count, bus_latency_s), args.points)
+        async_s = asyncio.run(run_async(build_meters(count, bus_latency_s), args.points))
+        print(
+            f"{count:>9} {total_points / blocking_s:>15.1f} "
+            f"{total_points / async_s:>12.1f} {blocking_s / async_s:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
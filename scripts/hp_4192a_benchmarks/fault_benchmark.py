@@ -0,0 +1,239 @@
+"""
+Offline benchmark of the HP 4192A retry paths under injected faults.
+
+Purpose
+-------
+The driver retries readbacks because the real gateway sometimes returns empty,
+stale, or wrong-state output. This script measures what those retries cost, so
+a retry-policy change can be judged by numbers.
+
+What this script does
+---------------------
+- runs `configure()` and `get()` of the spot frequency, spot bias, and
+  oscillator level against `HP4192AEmulator` once per fault profile (clean,
+  empty, stale, wrong-state, and a mixed gateway profile); the bias and
+  oscillator-level recalls are where wrong-state readbacks show up
+- times every call
+- prints, per profile and operation: throughput, p50 / p95 / p99 / max latency,
+  failed calls, the number of faults the emulator injected, and the number of
+  readback retries the driver made
+- flags every faulty-profile row in which no fault was injected, because its
+  numbers then only show the clean path; raise `--calls` when that happens
+
+No instrument is needed. The driver's own settle and retry sleeps are real, so
+this takes a while with the default call count.
+
+How to use
+----------
+Run from the repo root:
+
+   python scripts/hp_4192a_benchmarks/fault_benchmark.py
+
+Optional:
+
+   python scripts/hp_4192a_benchmarks/fault_benchmark.py --calls 50 --seed 3
+   python scripts/hp_4192a_benchmarks/fault_benchmark.py --profile stale
+"""
+
+from __future__ import annotations
+
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+import argparse
+import statistics
+import sys
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments import (  # noqa: E402
+    HP4192A,
+    HP4192AEmulator,
+    HP4192AFaultProfile,
+    HP4192ALatencyDistribution,
+)
+from instruments.hp_4192a_profile import percentile  # noqa: E402
+
+
+DEFAULT_CALLS = 40
+# At the 2-5 % fault rates below, fewer calls often inject no fault at all.
+MIN_CALLS = 20
+DEFAULT_SEED = 1
+
+# Gateway latency seen on the bench: a few milliseconds per transaction with
+# an occasional slow one.
+GATEWAY_LATENCY = HP4192ALatencyDistribution(
+    median_s=0.003,
+    jitter=0.4,
+    tail_rate=0.02,
+    tail_s=0.05,
+)
+
+FAULT_PROFILES = [
+    HP4192AFaultProfile(name="clean"),
+    HP4192AFaultProfile(name="empty", empty_rate=0.05),
+    HP4192AFaultProfile(name="stale", stale_rate=0.05),
+    HP4192AFaultProfile(name="wrong_state", wrong_state_rate=0.05),
+    HP4192AFaultProfile(
+        name="gateway",
+        empty_rate=0.02,
+        stale_rate=0.02,
+        wrong_state_rate=0.02,
+        write_latency=GATEWAY_LATENCY,
+        read_latency=GATEWAY_LATENCY,
+    ),
+]
+
+# configure() keyword -> values cycled through, one per call.
+CONFIGURE_VALUES = {
+    "frequency_hz": [1_000.0, 10_000.0, 100_000.0],
+    "bias_voltage_v": [0.5, -0.5, 1.0],
+    "osc_level_v": [0.1, 0.5, 1.0],
+}
+
+# Operation name -> (driver call, parameter).
+OPERATIONS = {
+    "cfg_freq": ("configure", "frequency_hz"),
+    "cfg_bias": ("configure", "bias_voltage_v"),
+    "cfg_osc": ("configure", "osc_level_v"),
+    "get_freq": ("get", "frequency_hz"),
+    "get_bias": ("get", "bias_voltage_v"),
+    "get_osc": ("get", "osc_level_v"),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark HP 4192A configure()/get() under injected readback faults."
+    )
+    parser.add_argument(
+        "--calls",
+        type=int,
+        default=DEFAULT_CALLS,
+        help=(
+            f"Calls per operation and profile, at least {MIN_CALLS}. "
+            f"Default: {DEFAULT_CALLS}."
+        ),
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Fault random seed. Default: {DEFAULT_SEED}.",
+    )
+    parser.add_argument(
+        "--profile",
+        choices=[profile.name for profile in FAULT_PROFILES],
+        action="append",
+        help="Run only this profile. Can be given more than once.",
+    )
+    args = parser.parse_args()
+    if args.calls < MIN_CALLS:
+        parser.error(f"--calls must be at least {MIN_CALLS}")
+    return args
+
+
+def time_calls(call, calls: int) -> dict[str, object]:
+    durations_s: list[float] = []
+    failures = 0
+    started_at = time.perf_counter()
+    for index in range(calls):
+        call_started_at = time.perf_counter()
+        try:
+            with redirect_stdout(StringIO()):
+                call(index)
+        except Exception:  # noqa: BLE001
+            failures += 1
+        durations_s.append(time.perf_counter() - call_started_at)
+    total_s = time.perf_counter() - started_at
+
+    durations_s.sort()
+    return {
+        "calls_per_s": calls / total_s if total_s > 0.0 else float("nan"),
+        "p50_ms": 1000.0 * percentile(durations_s, 0.50),
+        "p95_ms": 1000.0 * percentile(durations_s, 0.95),
+        "p99_ms": 1000.0 * percentile(durations_s, 0.99),
+        "max_ms": 1000.0 * durations_s[-1],
+        "mean_ms": 1000.0 * statistics.fmean(durations_s),
+        "failures": failures,
+    }
+
+
+def run_profile(profile: HP4192AFaultProfile, *, calls: int, seed: int) -> list[dict[str, object]]:
+    results: list[dict[str, object]] = []
+
+    for operation, (method, parameter) in OPERATIONS.items():
+        emulator = HP4192AEmulator(faults=profile, seed=seed)
+        meter = HP4192A(emulator, trace_enabled=True, trace_categories={"READTRY"})
+
+        if method == "configure":
+            values = CONFIGURE_VALUES[parameter]
+
+            def call(index: int) -> None:
+                meter.configure(**{parameter: values[index % len(values)]})
+        else:
+            def call(index: int) -> None:
+                meter.get(parameter)
+
+        result = time_calls(call, calls)
+        result["profile"] = profile.name
+        result["operation"] = operation
+        result["faults"] = sum(emulator.fault_counts.values())
+        result["retries"] = sum(
+            1
+            for event in meter.get_trace_events()
+            if event.duration_s is None and " failed " in event.message
+        )
+        results.append(result)
+
+    return results
+
+
+def main() -> None:
+    args = parse_args()
+    profiles = [
+        profile
+        for profile in FAULT_PROFILES
+        if args.profile is None or profile.name in args.profile
+    ]
+
+    print("HP 4192A fault_benchmark")
+    print("------------------------")
+    print(f"Calls per operation: {args.calls}")
+    print(f"Seed: {args.seed}")
+    print()
+    print(
+        f"{'profile':<12} {'operation':<10} {'calls/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'failed':>7} {'faults':>7} {'retries':>7}"
+    )
+
+    fault_free_rows = 0
+    for profile in profiles:
+        injects_faults = profile.empty_rate + profile.stale_rate + profile.wrong_state_rate > 0.0
+        for result in run_profile(profile, calls=args.calls, seed=args.seed):
+            flag = ""
+            if injects_faults and result["faults"] == 0:
+                flag = "  no faults injected"
+                fault_free_rows += 1
+            print(
+                f"{result['profile']:<12} {result['operation']:<10} "
+                f"{result['calls_per_s']:>8.2f} {result['p50_ms']:>8.1f} "
+                f"{result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f} "
+                f"{result['max_ms']:>8.1f} {result['failures']:>7} {result['faults']:>7} "
+                f"{result['retries']:>7}{flag}"
+            )
+
+    if fault_free_rows:
+        print()
+        print(
+            f"{fault_free_rows} faulty-profile row(s) injected no fault and only time the "
+            "clean path. Run again with a larger --calls."
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Offline benchmark of the HP 4192A driver hot paths with JSON output.
+
+Purpose
+-------
+Time the code the driver runs on every call, so a regression in parsing,
+command building, or the call paths shows up between commits. No instrument is
+needed; the driver calls run against `HP4192AEmulator`.
+
+What this script times
+----------------------
+Pure functions, per call:
+
+- `_parse_output_snapshot()` on an ``F1`` output string
+- `_parse_display_pair()` on an ``F0`` output string
+- `_format_spot_frequency_set_command()`, `_format_spot_bias_set_command()`,
+  `_format_osc_level_set_command()`
+- `_build_configure_request()` for a full configure request
+
+Driver calls, per call:
+
+- `configure()` including verification
+- `measure()`
+- `ping(show=False)`
+
+Parameters
+----------
+- `--settle-scale` multiplies the driver settle and retry sleeps
+  (`_HP4192A_TRIGGER_SETTLE_S` and friends). The default `0` removes them, so
+  the driver numbers show pure code and transport cost.
+- `--transport-latency-ms` sets the emulator write and read latency.
+
+How to use
+----------
+Run from the repo root:
+
+   python scripts/hp_4192a_benchmarks/hot_path_benchmark.py --output before.json
+   # change the driver
+   python scripts/hp_4192a_benchmarks/hot_path_benchmark.py --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments import HP4192A, HP4192AEmulator  # noqa: E402
+from instruments import hp_4192a  # noqa: E402
+from instruments.hp_4192a_profile import percentile  # noqa: E402
+
+
+DEFAULT_ITERATIONS = 20_000
+DEFAULT_CALLS = 200
+DEFAULT_SETTLE_SCALE = 0.0
+DEFAULT_TRANSPORT_LATENCY_MS = 0.0
+
+F1_OUTPUT = "NZFN+0012.34E+00,NTDN-045.0E+00,K+0010.000000"
+F0_OUTPUT = "NZFN+0012.34E+00,NTDN-045.0E+00"
+
+FULL_CONFIGURE_KWARGS = {
+    "frequency_hz": 12_345.678,
+    "bias_voltage_v": 0.5,
+    "osc_level_v": 0.1,
+    "bias_enabled": True,
+    "trigger_mode": "hold",
+    "measurement_mode": "normal",
+    "zy_range": "auto",
+    "circuit_mode": "series",
+    "display_a": "impedance",
+    "display_b": "phase_deg",
+}
+
+SLEEP_CONSTANTS = (
+    "_HP4192A_TRIGGER_SETTLE_S",
+    "_HP4192A_POST_CONFIG_SETTLE_S",
+    "_HP4192A_READBACK_RETRY_DELAY_S",
+    "_HP4192A_VERIFY_RETRY_DELAY_S",
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time HP 4192A driver hot paths offline and write JSON results."
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help=f"Iterations per pure-function benchmark. Default: {DEFAULT_ITERATIONS}.",
+    )
+    parser.add_argument(
+        "--calls",
+        type=int,
+        default=DEFAULT_CALLS,
+        help=f"Calls per driver benchmark. Default: {DEFAULT_CALLS}.",
+    )
+    parser.add_argument(
+        "--settle-scale",
+        type=float,
+        default=DEFAULT_SETTLE_SCALE,
+        help=f"Multiplier for the driver settle/retry sleeps. Default: {DEFAULT_SETTLE_SCALE:g}.",
+    )
+    parser.add_argument(
+        "--transport-latency-ms",
+        type=float,
+        default=DEFAULT_TRANSPORT_LATENCY_MS,
+        help=(
+            "Emulator latency per write and per read. "
+            f"Default: {DEFAULT_TRANSPORT_LATENCY_MS:g}."
+        ),
+    )
+    parser.add_argument("--output", type=Path, help="Write the JSON results to this file.")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results to compare against.")
+    return parser.parse_args()
+
+
+def scale_driver_sleeps(scale: float) -> None:
+    for name in SLEEP_CONSTANTS:
+        setattr(hp_4192a, name, getattr(hp_4192a, name) * scale)
+
+
+def summarize(durations_ns: list[int]) -> dict[str, float]:
+    durations_ns.sort()
+    count = len(durations_ns)
+    return {
+        "count": count,
+        "mean_us": statistics.fmean(durations_ns) / 1000.0,
+        "median_us": percentile(durations_ns, 0.50) / 1000.0,
+        "p95_us": percentile(durations_ns, 0.95) / 1000.0,
+        "min_us": durations_ns[0] / 1000.0,
+    }
+
+
+def time_function(function, iterations: int) -> dict[str, float]:
+    # Batches of calls per timing sample keep timer overhead out of
+    # sub-microsecond functions.
+    batch = 50
+    durations_ns: list[int] = []
+    for _ in range(max(1, iterations // batch)):
+        started_at = time.perf_counter_ns()
+        for _ in range(batch):
+            function()
+        durations_ns.append((time.perf_counter_ns() - started_at) // batch)
+    return summarize(durations_ns)
+
+
+def time_driver_call(function, calls: int) -> dict[str, float]:
+    durations_ns: list[int] = []
+    with redirect_stdout(StringIO()):
+        for _ in range(calls):
+            started_at = time.perf_counter_ns()
+            function()
+            durations_ns.append(time.perf_counter_ns() - started_at)
+    return summarize(durations_ns)
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+
+    results["parse_output_snapshot"] = time_function(
+        lambda: hp_4192a._parse_output_snapshot(F1_OUTPUT),
+        args.iterations,
+    )
+    results["parse_display_pair"] = time_function(
+        lambda: hp_4192a._parse_display_pair(F0_OUTPUT),
+        args.iterations,
+    )
+    results["format_spot_frequency_set_command"] = time_function(
+        lambda: hp_4192a._format_spot_frequency_set_command(12_345.678),
+        args.iterations,
+    )
+    results["format_spot_bias_set_command"] = time_function(
+        lambda: hp_4192a._format_spot_bias_set_command(0.5),
+        args.iterations,
+    )
+    results["format_osc_level_set_command"] = time_function(
+        lambda: hp_4192a._format_osc_level_set_command(0.105),
+        args.iterations,
+    )
+    results["build_configure_request"] = time_function(
+        lambda: hp_4192a._build_configure_request(**FULL_CONFIGURE_KWARGS),
+        args.iterations,
+    )
+
+    latency_s = args.transport_latency_ms / 1000.0
+    meter = HP4192A(
+        HP4192AEmulator(write_latency_s=latency_s, read_latency_s=latency_s)
+    )
+    results["configure"] = time_driver_call(
+        lambda: meter.configure(
+            frequency_hz=10_000.0,
+            osc_level_v=0.1,
+            display_a="impedance",
+            display_b="phase_deg",
+        ),
+        args.calls,
+    )
+    results["measure"] = time_driver_call(meter.measure, args.calls)
+    results["ping"] = time_driver_call(lambda: meter.ping(show=False), args.calls)
+
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict[str, dict[str, float]], baseline: dict[str, object] | None) -> None:
+    baseline_results = baseline["results"] if baseline is not None else {}
+    header = f"{'benchmark':<36} {'median us':>11} {'p95 us':>11}"
+    if baseline is not None:
+        header += f" {'baseline us':>12} {'change':>8}"
+    print(header)
+
+    for name, result in results.items():
+        line = f"{name:<36} {result['median_us']:>11.2f} {result['p95_us']:>11.2f}"
+        previous = baseline_results.get(name)
+        if previous is not None:
+            change = result["median_us"] / previous["median_us"] - 1.0
+            line += f" {previous['median_us']:>12.2f} {change:>+7.1%}"
+        print(line)
+
+
+def main() -> None:
+    args = parse_args()
+    scale_driver_sleeps(args.settle_scale)
+
+    results = run_benchmarks(args)
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "calls": args.calls,
+            "settle_scale": args.settle_scale,
+            "transport_latency_ms": args.transport_latency_ms,
+        },
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+
+    print("HP 4192A hot_path_benchmark")
+    print("---------------------------")
+    print(f"Commit: {report['meta']['commit'] or 'unknown'}")
+    print(f"Settle scale: {args.settle_scale:g}")
+    print(f"Transport latency: {args.transport_latency_ms:g} ms")
+    print()
+    print_results(results, baseline)
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print()
+        print(f"Results: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ Core block:
 - `ping(show=False)` for readable state reporting
 - front-panel-only configure coverage for settings that do not yet have a
   proven safe recall path
+- `get()` and `ping()` inside a `batch()` block read on their first attempt
 - trace output for the failing step when a step fails
 
 Optional measurement block:
@@ -64,6 +65,10 @@ KNOWN_DUT_DESCRIPTION = "1 uF capacitor"
 KNOWN_DUT_FREQUENCY_HZ = 1_000.0
 KNOWN_DUT_OSC_LEVEL_V = 0.1
 
+BATCH_CHECK_FREQUENCY_HZ = 10_000.0
+BATCH_CHECK_BIAS_V = 0.5
+BATCH_CHECK_OSC_LEVEL_V = 0.1
+
 MODE_TEST_BASE_CONFIG = {
     "frequency_hz": 1_000.0,
     "osc_level_v": 0.100,
@@ -754,6 +759,37 @@ def run_core_step(meter: HP4192A, step: dict[str, object], index: int, total: in
     print("Result: PASS")
 
 
+def run_batch_check(meter: HP4192A) -> None:
+    print()
+    print("=" * 72)
+    print("Batch check")
+    print("get() and ping() inside batch() read on the first attempt")
+    print("=" * 72)
+
+    # The queued configure() is applied by the first call that needs the
+    # instrument. Its verification leaves F1 and a recall code active, so a
+    # call that decided its output state before the flush would read the
+    # wrong DISPLAY C and need a retry.
+    with meter.batch():
+        meter.configure(frequency_hz=BATCH_CHECK_FREQUENCY_HZ)
+        meter.configure(bias_voltage_v=BATCH_CHECK_BIAS_V)
+        verify_get_value("frequency_hz", meter.get("frequency_hz"), BATCH_CHECK_FREQUENCY_HZ)
+        meter.configure(osc_level_v=BATCH_CHECK_OSC_LEVEL_V)
+        state_rows = extract_state_rows(meter.ping(show=False))
+        verify_ping_value(state_rows, "spot bias", f"{BATCH_CHECK_BIAS_V:g} V")
+        verify_ping_value(state_rows, "oscillator level", f"{BATCH_CHECK_OSC_LEVEL_V:g} V")
+
+    retries = [
+        event.message
+        for event in meter.get_trace_events()
+        if event.category == "READTRY" and event.duration_s is None and " failed " in event.message
+    ]
+    if retries:
+        raise AssertionError(f"readback inside batch() needed a retry: {retries[0]}")
+
+    print("Result: PASS")
+
+
 def run_measurement_step(
     meter: HP4192A,
     step: dict[str, object],
@@ -820,6 +856,21 @@ def main() -> None:
                     print("----------------------")
                     print(meter.format_trace_log())
 
+        meter.clear_trace_log()
+        try:
+            run_batch_check(meter)
+        except Exception as exc:
+            category = classify_failure(exc)
+            parameter_name = extract_parameter_name(exc)
+            failure_categories[category] += 1
+            failure_parameters[parameter_name] += 1
+            failures.append(f"Batch check -> {exc}")
+            print(f"Result: FAIL ({category}: {exc})")
+            if ENABLE_IO_TRACE and SHOW_TRACE_ON_FAILURE:
+                print("Trace for failing step")
+                print("----------------------")
+                print(meter.format_trace_log())
+
         if RUN_MEASUREMENT_BLOCK:
             print()
             print(f"Running measurement block for DUT: {KNOWN_DUT_DESCRIPTION}")
@@ -49,6 +49,7 @@ sys.path.insert(0, str(SOURCE_DIR))
 
 import self_test as hp_self_test  # noqa: E402
 from instruments import HP4192A  # noqa: E402
+from instruments.visa import close_resource_managers  # noqa: E402
 
 
 DEFAULT_RUNS = 50
@@ -285,6 +286,9 @@ def run_benchmark(*, runs: int, include_measurement: bool, output_path: Path) ->
             f"Run result: {run_status} | failures={run_failures} | duration={run_duration_s:.2f} s"
         )
 
+    # Every run reopens the instrument on the same shared VISA resource
+    # manager; close it once here instead of once per run.
+    close_resource_managers()
     benchmark_duration_s = time.monotonic() - benchmark_started_at
 
     summary = {
@@ -8,8 +8,10 @@ It is meant to answer a simple question:
 
 Which GPIB addresses respond on this gateway?
 
-This script does not use the reusable instrument API.
-It talks to the gateway directly through PyVISA.
+This script does not use the instrument drivers such as `HP4192A`.
+It talks to the gateway directly through PyVISA. The only thing it takes from
+the `instruments` package is the shared VISA resource manager in
+`instruments.visa`, and it closes that manager when the scan ends.
 
 Safety choice
 -------------
@@ -43,9 +45,16 @@ Important:
 
 from __future__ import annotations
 
+from pathlib import Path
+import sys
 import time
 
-import pyvisa
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments.visa import acquire_resource_manager, release_resource_manager  # noqa: E402
 
 
 # Leave this empty to type the IP address when the script starts.
@@ -264,7 +273,7 @@ def scan_gateway_bus(gateway_ip: str) -> list[dict[str, object]]:
     """
 
     results: list[dict[str, object]] = []
-    resource_manager = pyvisa.ResourceManager()
+    resource_manager = acquire_resource_manager()
 
     try:
         for address in range(START_ADDRESS, END_ADDRESS + 1):
@@ -308,7 +317,7 @@ def scan_gateway_bus(gateway_ip: str) -> list[dict[str, object]]:
                         time.sleep(POST_CLEANUP_DELAY_S)
     finally:
         cleanup_gateway_controller(resource_manager, gateway_ip)
-        resource_manager.close()
+        release_resource_manager(close=True)
 
     return results
 
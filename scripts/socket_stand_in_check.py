@@ -0,0 +1,231 @@
+"""
+Check the raw TCP socket transport against a local stand-in instrument.
+
+Why this script exists
+----------------------
+`SocketDevice` and `AsyncSocketDevice` talk to instruments and gateways that
+expose a plain TCP socket port. This script checks them without hardware: it
+starts a small line-based server on localhost and runs both devices against
+it.
+
+What it checks
+--------------
+- `write()` sends LF by default and honours `write_termination`
+- `read()` honours `read_termination`
+- `TCP_NODELAY` is set by default and left off with ``nodelay=False``
+- a reply that arrives in several TCP segments is read as one message
+- two replies that arrive in one segment cost one `recv()`
+- a read timeout closes the connection, and the next call reconnects instead
+  of reading the late reply
+- `AsyncSocketDevice` round-trips, sets `TCP_NODELAY`, reads a split reply,
+  and reconnects after a timeout
+
+The stand-in answers every line with the same line. ``SPLIT`` makes it send
+its reply in three segments, ``TWO`` sends two replies at once, and ``STALL``
+holds the reply longer than the devices wait. The timeout steps therefore
+take a few seconds.
+
+How to use
+----------
+Run from the repo root:
+
+   python scripts/socket_stand_in_check.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments import AsyncSocketDevice, SocketDevice  # noqa: E402
+
+
+IO_TIMEOUT_MS = 500
+STALL_S = 1.5
+SEGMENT_GAP_S = 0.05
+
+
+class StandInInstrument(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.lines: list[bytes] = []
+
+
+class StandInHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server: StandInInstrument = self.server
+        with server.lock:
+            server.connections += 1
+        # Send each segment at once, so a split reply really arrives split.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        buffer = b""
+        while True:
+            try:
+                chunk = self.request.recv(4096)
+            except OSError:
+                return
+            if not chunk:
+                return
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                with server.lock:
+                    server.lines.append(line + b"\n")
+                try:
+                    self.reply(line.rstrip(b"\r"))
+                except OSError:
+                    return
+
+    def reply(self, line: bytes) -> None:
+        if line == b"SPLIT":
+            for segment in (b"SP", b"LI", b"T\n"):
+                self.request.sendall(segment)
+                time.sleep(SEGMENT_GAP_S)
+        elif line == b"TWO":
+            self.request.sendall(b"ONE\nTWO\n")
+        elif line == b"STALL":
+            time.sleep(STALL_S)
+            self.request.sendall(b"LATE\n")
+        elif line == b"CRLF":
+            self.request.sendall(b"CR;LF\r\n")
+        else:
+            self.request.sendall(line + b"\n")
+
+
+class CountingSocket:
+    """
+    Socket wrapper that counts `recv()` calls.
+    """
+
+    def __init__(self, sock: socket.socket):
+        self._socket = sock
+        self.recv_calls = 0
+
+    def recv(self, size: int) -> bytes:
+        self.recv_calls += 1
+        return self._socket.recv(size)
+
+    def __getattr__(self, name: str):
+        return getattr(self._socket, name)
+
+
+def check(condition: bool, description: str) -> None:
+    if not condition:
+        raise AssertionError(description)
+    print(f"  ok: {description}")
+
+
+def nodelay_enabled(sock) -> bool:
+    return bool(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+
+def check_socket_device(server: StandInInstrument, resource_name: str, port: int) -> None:
+    device = SocketDevice(resource_name, timeout_ms=IO_TIMEOUT_MS)
+    check(nodelay_enabled(device._socket), "TCP_NODELAY is set by default")
+    check(device.query("FRR") == "FRR", "query() round-trips")
+    check(server.lines[-1] == b"FRR\n", "default write termination is LF")
+    device.close()
+
+    sock = CountingSocket(socket.create_connection(("127.0.0.1", port)))
+    device = SocketDevice(resource_name, timeout_ms=IO_TIMEOUT_MS, sock=sock)
+    check(device.query("SPLIT") == "SPLIT", "a reply split over three segments reads as one")
+    check(sock.recv_calls > 1, "the split reply took several recv() calls")
+    sock.recv_calls = 0
+    device.write("TWO")
+    check(device.read() == "ONE" and device.read() == "TWO", "two buffered replies read in order")
+    check(sock.recv_calls == 1, "two replies in one segment cost one recv()")
+    device.close()
+
+    device = SocketDevice(
+        resource_name,
+        timeout_ms=IO_TIMEOUT_MS,
+        read_termination="\r\n",
+        write_termination="\r\n",
+        nodelay=False,
+    )
+    check(not nodelay_enabled(device._socket), "nodelay=False leaves TCP_NODELAY off")
+    check(device.query("CRLF") == "CR;LF", "read_termination='\\r\\n' ends the message")
+    check(server.lines[-1] == b"CRLF\r\n", "write_termination='\\r\\n' is sent")
+    device.close()
+
+    device = SocketDevice(resource_name, timeout_ms=IO_TIMEOUT_MS)
+    # After a round-trip the stand-in has counted this connection.
+    device.query("OLR")
+    connections = server.connections
+    print(f"  stalling one reply for {STALL_S:g} s ...")
+    device.write("STALL")
+    try:
+        device.read()
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError("the stalled read did not time out")
+    # Let the stand-in send its late reply to the closed connection.
+    time.sleep(STALL_S)
+    check(device.query("BIR") == "BIR", "the next query after a timeout gets its own reply")
+    check(server.connections == connections + 1, "the device reconnected after the timeout")
+    check(nodelay_enabled(device._socket), "the new connection keeps TCP_NODELAY")
+    device.close()
+
+
+async def check_async_socket_device(server: StandInInstrument, resource_name: str) -> None:
+    device = await AsyncSocketDevice.open(resource_name, timeout_ms=IO_TIMEOUT_MS)
+    check(nodelay_enabled(device._writer.get_extra_info("socket")), "async: TCP_NODELAY is set")
+    check(await device.query("OLR") == "OLR", "async: query() round-trips")
+    check(await device.query("SPLIT") == "SPLIT", "async: a split reply reads as one")
+
+    connections = server.connections
+    print(f"  async: stalling one reply for {STALL_S:g} s ...")
+    await device.write("STALL")
+    try:
+        await device.read()
+    except TimeoutError:
+        pass
+    else:
+        raise AssertionError("the stalled async read did not time out")
+    await asyncio.sleep(STALL_S)
+    check(await device.query("FRR") == "FRR", "async: the next query gets its own reply")
+    check(server.connections == connections + 1, "async: the device reconnected after the timeout")
+    check(
+        nodelay_enabled(device._writer.get_extra_info("socket")),
+        "async: the new connection keeps TCP_NODELAY",
+    )
+    await device.close()
+
+
+def main() -> None:
+    print("Socket stand-in check")
+    print("---------------------")
+
+    server = StandInInstrument()
+    port = server.server_address[1]
+    resource_name = f"TCPIP0::127.0.0.1::{port}::SOCKET"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        check_socket_device(server, resource_name, port)
+        asyncio.run(check_async_socket_device(server, resource_name))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("Socket stand-in check passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Check the pure-Python VXI-11 client against a local stand-in gateway.
+
+Why this script exists
+----------------------
+`Vxi11Device` talks to LAN/GPIB gateways such as the Keysight E5810. This
+script checks it without a gateway: it starts a small VXI-11 core-channel
+server on localhost and runs the client against it.
+
+What it checks
+--------------
+- two links to one gateway share one TCP connection
+- `write()` sends CR LF by default, like `VisaDevice`, and honours
+  `write_termination`
+- `read()`, `trigger()`, `clear()`, and `read_stb()` round-trip
+- a socket timeout in the middle of a call closes the shared connection, and
+  both links reconnect and work on their next call instead of reading the
+  late reply
+- `share_connection=False` opens a separate connection that is not shared
+- closing the last link closes the connection
+
+The stand-in answers ``device_read`` with the last message written on the
+same link. Writing ``STALL`` makes it hold the reply longer than the client
+waits. The timeout step therefore takes a few seconds.
+
+How to use
+----------
+Run from the repo root:
+
+   python scripts/vxi11_stand_in_check.py
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+import socketserver
+import struct
+import sys
+import threading
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SOURCE_DIR = REPO_ROOT / "source"
+sys.path.insert(0, str(SOURCE_DIR))
+
+from instruments import Vxi11Device  # noqa: E402
+from instruments import vxi11  # noqa: E402
+
+
+RESOURCE_A = "TCPIP0::127.0.0.1::gpib0,5::INSTR"
+RESOURCE_B = "TCPIP0::127.0.0.1::gpib0,6::INSTR"
+IO_TIMEOUT_MS = 500
+# The client waits at least 5 s for a reply on the socket.
+STALL_S = 6.0
+STATUS_BYTE = 0x42
+
+
+class StandInGateway(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.writes: dict[int, bytes] = {}
+        self.links = 0
+
+
+class StandInHandler(socketserver.BaseRequestHandler):
+    def handle(self) -> None:
+        server: StandInGateway = self.server
+        with server.lock:
+            server.connections += 1
+        while True:
+            try:
+                record = receive_record(self.request)
+            except ConnectionError:
+                return
+            unpacker = vxi11._XdrUnpacker(record)
+            xid = unpacker.unpack_uint()
+            for _ in range(5):  # msg type, rpc version, program, version, procedure
+                procedure = unpacker.unpack_uint()
+            unpacker.unpack_uint()  # credentials
+            unpacker.unpack_opaque()
+            unpacker.unpack_uint()  # verifier
+            unpacker.unpack_opaque()
+
+            result = vxi11._XdrPacker()
+            stall = self.run_procedure(server, procedure, unpacker, result)
+            if stall:
+                time.sleep(STALL_S)
+            try:
+                send_reply(self.request, xid, result)
+            except OSError:
+                return
+
+    def run_procedure(
+        self,
+        server: StandInGateway,
+        procedure: int,
+        unpacker: "vxi11._XdrUnpacker",
+        result: "vxi11._XdrPacker",
+    ) -> bool:
+        if procedure == vxi11._CREATE_LINK:
+            with server.lock:
+                server.links += 1
+                link_id = server.links
+            result.pack_int(0)
+            result.pack_int(link_id)
+            result.pack_uint(0)
+            result.pack_uint(1024)
+            return False
+
+        link_id = unpacker.unpack_int()
+        if procedure == vxi11._DEVICE_WRITE:
+            unpacker.unpack_uint()  # io timeout
+            unpacker.unpack_uint()  # lock timeout
+            unpacker.unpack_int()  # flags
+            data = unpacker.unpack_opaque()
+            server.writes[link_id] = data
+            result.pack_int(0)
+            result.pack_uint(len(data))
+            return data.startswith(b"STALL")
+        if procedure == vxi11._DEVICE_READ:
+            result.pack_int(0)
+            result.pack_int(vxi11._READ_REASON_END)
+            result.pack_opaque(server.writes.get(link_id, b""))
+            return False
+        if procedure == vxi11._DEVICE_READSTB:
+            result.pack_int(0)
+            result.pack_uint(STATUS_BYTE)
+            return False
+        if procedure in {vxi11._DEVICE_TRIGGER, vxi11._DEVICE_CLEAR}:
+            result.pack_int(0)
+            return False
+        if procedure == vxi11._DESTROY_LINK:
+            result.pack_int(0)
+            return False
+        result.pack_int(8)  # operation not supported
+        return False
+
+
+def receive_record(sock) -> bytes:
+    fragments: list[bytes] = []
+    while True:
+        (marker,) = struct.unpack(">I", receive_exactly(sock, 4))
+        fragments.append(receive_exactly(sock, marker & ~vxi11._LAST_FRAGMENT))
+        if marker & vxi11._LAST_FRAGMENT:
+            return b"".join(fragments)
+
+
+def receive_exactly(sock, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("client closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+def send_reply(sock, xid: int, result: "vxi11._XdrPacker") -> None:
+    header = vxi11._XdrPacker()
+    for value in (xid, vxi11._MSG_REPLY, vxi11._REPLY_ACCEPTED, 0):
+        header.pack_uint(value)
+    header.pack_opaque(b"")
+    header.pack_uint(vxi11._ACCEPT_SUCCESS)
+    message = header.get_buffer() + result.get_buffer()
+    sock.sendall(struct.pack(">I", vxi11._LAST_FRAGMENT | len(message)) + message)
+
+
+def check(condition: bool, description: str) -> None:
+    if not condition:
+        raise AssertionError(description)
+    print(f"  ok: {description}")
+
+
+def main() -> None:
+    print("VXI-11 stand-in check")
+    print("---------------------")
+
+    gateway = StandInGateway()
+    port = gateway.server_address[1]
+    threading.Thread(target=gateway.serve_forever, daemon=True).start()
+
+    try:
+        device_a = Vxi11Device(RESOURCE_A, timeout_ms=IO_TIMEOUT_MS, core_port=port)
+        device_b = Vxi11Device(
+            RESOURCE_B,
+            timeout_ms=IO_TIMEOUT_MS,
+            core_port=port,
+            write_termination="",
+        )
+        check(gateway.connections == 1, "two links share one connection")
+
+        check(device_a.query("EX") == "EX", "query() round-trips")
+        check(gateway.writes[1] == b"EX\r\n", "default write termination is CR LF")
+        device_b.write("F0")
+        check(gateway.writes[2] == b"F0", "write_termination='' sends the bare message")
+
+        device_a.trigger()
+        device_a.clear()
+        check(device_a.read_stb() == STATUS_BYTE, "trigger(), clear(), read_stb() answer")
+
+        print(f"  stalling one reply for {STALL_S:g} s ...")
+        try:
+            device_a.write("STALL")
+        except TimeoutError:
+            pass
+        else:
+            raise AssertionError("the stalled write did not time out")
+        # Let the stand-in send its late reply to the closed connection.
+        time.sleep(STALL_S - 5.0 + 0.5)
+
+        check(device_b.query("FRR") == "FRR", "the other link reconnects after the timeout")
+        check(device_a.query("BIR") == "BIR", "the timed-out link reconnects")
+        check(gateway.connections == 2, "both links share the new connection")
+
+        device_c = Vxi11Device(
+            RESOURCE_A,
+            timeout_ms=IO_TIMEOUT_MS,
+            core_port=port,
+            share_connection=False,
+        )
+        check(gateway.connections == 3, "share_connection=False opens its own connection")
+        check(device_c.query("OLR") == "OLR", "the unshared link round-trips")
+        check(len(vxi11._CONNECTIONS) == 1, "the unshared connection is not pooled")
+        device_c.close()
+
+        device_a.close()
+        device_b.close()
+        check(not vxi11._CONNECTIONS, "closing the last link closes the connection")
+    finally:
+        gateway.shutdown()
+        gateway.server_close()
+
+    print("VXI-11 stand-in check passed.")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,25 +8,80 @@ from .hp_4192a import (
     HP4192ACircuitMode,
     HP4192ADisplayA,
     HP4192ADisplayB,
+    HP4192AFrequencySweep,
     HP4192AMeasurement,
+    HP4192AMeasurementBlock,
+    HP4192ASequence,
+    HP4192ASequenceStep,
+    HP4192AStableMeasurement,
+    HP4192ASweepPoint,
+    HP4192ATransport,
     HP4192ATriggerMode,
+    HP4192AVerifyMode,
     HP4192AZYRange,
 )
-from .instrument import ConnectionInfo, Instrument, InstrumentReport
-from .visa import MockVisaDevice, VisaDevice
+from .hp_4192a_async import AsyncHP4192A
+from .hp_4192a_emulator import (
+    HP4192AEmulatedDUT,
+    HP4192AEmulator,
+    HP4192AFaultProfile,
+    HP4192ALatencyDistribution,
+)
+from .hp_4192a_profile import HP4192AProfile
+from .hp_4192a_timing import HP4192ASettleTiming
+from .hp_4192a_trace import HP4192ATraceBuffer, HP4192ATraceEvent
+from .instrument import ConnectionInfo, Instrument, InstrumentDevice, InstrumentReport
+from .recording import RecordingDevice, ReplayDevice, ReplayTiming
+from .tcp_socket import AsyncSocketDevice, SocketDevice
+from .visa import (
+    MockVisaDevice,
+    VisaDevice,
+    acquire_resource_manager,
+    close_resource_managers,
+    release_resource_manager,
+)
+from .vxi11 import Vxi11Device, Vxi11Error
 
 __all__ = [
+    "AsyncHP4192A",
+    "AsyncSocketDevice",
     "ConnectionInfo",
     "HP4192A",
     "HP4192ACircuitMode",
     "HP4192ADisplayA",
     "HP4192ADisplayB",
+    "HP4192AEmulatedDUT",
+    "HP4192AEmulator",
+    "HP4192AFaultProfile",
+    "HP4192AFrequencySweep",
+    "HP4192ALatencyDistribution",
     "HP4192AMeasurement",
+    "HP4192AMeasurementBlock",
     "HP4192AMeasurementMode",
+    "HP4192AProfile",
+    "HP4192ASequence",
+    "HP4192ASequenceStep",
+    "HP4192ASettleTiming",
+    "HP4192AStableMeasurement",
+    "HP4192ASweepPoint",
+    "HP4192ATraceBuffer",
+    "HP4192ATraceEvent",
+    "HP4192ATransport",
     "HP4192ATriggerMode",
+    "HP4192AVerifyMode",
     "HP4192AZYRange",
     "Instrument",
+    "InstrumentDevice",
     "InstrumentReport",
     "MockVisaDevice",
+    "RecordingDevice",
+    "ReplayDevice",
+    "ReplayTiming",
+    "SocketDevice",
     "VisaDevice",
+    "Vxi11Device",
+    "Vxi11Error",
+    "acquire_resource_manager",
+    "close_resource_managers",
+    "release_resource_manager",
 ]
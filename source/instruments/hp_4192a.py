@@ -5,30 +5,65 @@ Current scope:
 - ping(): report connection details, current display functions, spot
   frequency, spot bias, and oscillator level
 - get(): read one current parameter value from the instrument
+- get_many(): read several parameter values with the fewest recall snapshots
 - configure(): set spot frequency, spot bias, oscillator level, circuit mode,
   bias enable, trigger mode, measurement mode, range selection, and a small
   supported set of display-function pairs
+- batch(): queue several configure() calls and apply them as one
 - measure(): return one current A/B measurement pair
+- measure_until_stable(): re-trigger until DISPLAY A/B readings agree
+- measure_many(): trigger a block of A/B measurements into NumPy arrays
+- sweep(): run the built-in linear frequency sweep and yield one A/B
+  measurement per step
+- sweep_frequencies(): measure A/B at each frequency of an arbitrary list
+- sweep_adaptive(): log sweep that adds points where A/B change quickly
+- compile_sequence() / run_sequence(): run a recipe of configure() +
+  measure() steps with redundant program codes and readbacks removed
+- profile(): time driver calls per phase (write, settle, read, parse,
+  verify)
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, replace
 from decimal import Decimal, ROUND_HALF_UP
 import math
+from pathlib import Path
 import re
 import time
-from typing import Callable, Literal, TypeAlias
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    TextIO,
+    TypeAlias,
+    TypeVar,
+)
 
 from .instrument import (
     ConfigurationVerificationError,
     Instrument,
+    InstrumentDevice,
     InstrumentReport,
     format_configure_adjusted,
     format_configure_success,
     format_configure_unverified,
 )
+from .hp_4192a_profile import HP4192AProfile
+from .hp_4192a_timing import HP4192ASettleTiming
+from .hp_4192a_trace import DEFAULT_TRACE_CAPACITY, HP4192ATraceBuffer, HP4192ATraceEvent
+from .tcp_socket import SocketDevice
 from .visa import VisaDevice
+from .vxi11 import Vxi11Device
+
+if TYPE_CHECKING:
+    import numpy
 
 
 HP4192ADisplayA: TypeAlias = Literal[
@@ -73,6 +108,18 @@ HP4192AZYRange: TypeAlias = Literal[
     "1_mohm",
 ]
 
+HP4192ATransport: TypeAlias = Literal[
+    "visa",
+    "socket",
+    "vxi11",
+]
+
+HP4192AVerifyMode: TypeAlias = Literal[
+    "full",
+    "sampled",
+    "none",
+]
+
 HP4192AGetParameter: TypeAlias = Literal[
     "frequency_hz",
     "bias_voltage_v",
@@ -211,6 +258,60 @@ _ZY_RANGE_TO_CODE: dict[str, str] = {
 
 _DISPLAY_C_VOLTAGE_UNIT_CODES = {"V", "Y"}
 
+# Recall snapshot that carries each get() parameter. DISPLAY A/B function codes
+# are present in every snapshot, so they share the `FRR` snapshot with the
+# spot frequency.
+_GET_PARAMETER_TO_RECALL_CODE: dict[str, str] = {
+    "frequency_hz": "FRR",
+    "display_a": "FRR",
+    "display_b": "FRR",
+    "circuit_mode": "FRR",
+    "bias_voltage_v": "BIR",
+    "osc_level_v": "OLR",
+}
+
+# get() parameters read from DISPLAY C; the rest come from DISPLAY A/B.
+_DISPLAY_C_GET_PARAMETERS = {"frequency_hz", "bias_voltage_v", "osc_level_v"}
+
+# configure() readback checks, in the order their confirmation lines are
+# printed. "display" covers the DISPLAY A/B pair, which is always set together.
+_VERIFY_CHECK_TO_RECALL_CODE: dict[str, str] = {
+    "frequency_hz": "FRR",
+    "bias_voltage_v": "BIR",
+    "osc_level_v": "OLR",
+    "display": "FRR",
+    "circuit_mode": "FRR",
+}
+
+_VERIFY_CHECK_TO_GET_PARAMETER: dict[str, str] = {
+    "frequency_hz": "frequency_hz",
+    "bias_voltage_v": "bias_voltage_v",
+    "osc_level_v": "osc_level_v",
+    "display": "display_a",
+    "circuit_mode": "circuit_mode",
+}
+
+_PING_PARAMETERS: tuple[str, ...] = (
+    "frequency_hz",
+    "bias_voltage_v",
+    "osc_level_v",
+)
+
+# Table 3-23 output-format and DISPLAY C recall codes. The driver remembers the
+# last one of each it sent so snapshots can skip redundant writes.
+_OUTPUT_FORMAT_CODES = {"F0", "F1"}
+_DISPLAY_C_RECALL_CODES = {"FRR", "BIR", "OLR"}
+
+# Table 3-23 sweep control codes used by `sweep()`.
+#
+# `G0` selects linear sweep; under `G1` (log sweep) `W3` steps logarithmically
+# and ignores STEP, so `sweep()` always sends `G0`.
+# `W2` selects manual sweep, which moves the spot frequency to the START value.
+# `W3` steps the spot frequency up by one STEP value.
+_SWEEP_LINEAR_CODE = "G0"
+_SWEEP_MANUAL_CODE = "W2"
+_SWEEP_STEP_UP_CODE = "W3"
+
 # The 4192A is noticeably happier when command/readback sequences are not sent
 # at full PC speed. Keep these short so bench use stays responsive.
 #
@@ -241,15 +342,36 @@ _HP4192A_READBACK_ATTEMPTS = 5
 # a readback/state error.
 _HP4192A_VERIFY_RETRY_DELAY_S = 0.1
 #
-# Number of full verification passes after `configure()` has sent its commands.
+# Number of verification passes after `configure()` has sent its commands.
 # This is broader than numeric readback retry: it also covers display-family
-# and circuit-mode mismatches.
+# and circuit-mode mismatches. Passes after the first re-check only the
+# parameters that failed.
 _HP4192A_VERIFY_ATTEMPTS = 5
 
+# Command classes learned separately by adaptive settle timing. `EX` is
+# classified by what happened since the previous trigger; "unknown_mode" is used
+# until this driver has sent the V/H measurement-mode codes. A settle is only
+# learned as long enough from F1 recall snapshots, whose DISPLAY C unit is
+# checked; a stale F0 reading looks like a good one, so F0 reads only ever
+# count as failures.
+_TRIGGER_SETTLE_CLASSES = (
+    "trigger_after_frequency_change",
+    "trigger_normal",
+    "trigger_average",
+    "trigger_high_speed",
+    "trigger_unknown_mode",
+)
+_POST_CONFIG_SETTLE_CLASS = "post_configure"
+
 _IMPLIED_CIRCUIT_MODE_FOR_DISPLAY_A: dict[str, str] = {
     "impedance": "series",
 }
 
+_T = TypeVar("_T")
+
+# Default for optional settings that keep their current value when omitted.
+_UNCHANGED: Any = object()
+
 
 @dataclass(slots=True)
 class _DisplayField:
@@ -273,6 +395,83 @@ class _OutputSnapshot:
     raw: str
 
 
+@dataclass(slots=True)
+class _ConfigureRequest:
+    """
+    One validated configure() request: the program codes to send and the
+    values the readback is expected to show.
+    """
+
+    frequency_hz: float | None = None
+    expected_frequency_hz: float | None = None
+    bias_voltage_v: float | None = None
+    expected_bias_voltage_v: float | None = None
+    osc_level_v: float | None = None
+    expected_osc_level_v: float | None = None
+    bias_enabled: bool | None = None
+    trigger_mode: str | None = None
+    measurement_mode: str | None = None
+    zy_range: str | None = None
+    circuit_mode: str | None = None
+    display_a: str | None = None
+    display_b: str | None = None
+    commands: list[str] = field(default_factory=list)
+    display_c_recall_code: str | None = None
+
+    def requested_items(self) -> list[str]:
+        requested_items = []
+        for key, value in (
+            ("frequency_hz", self.frequency_hz),
+            ("bias_voltage_v", self.bias_voltage_v),
+            ("osc_level_v", self.osc_level_v),
+            ("bias_enabled", self.bias_enabled),
+            ("trigger_mode", self.trigger_mode),
+            ("measurement_mode", self.measurement_mode),
+            ("zy_range", self.zy_range),
+            ("circuit_mode", self.circuit_mode),
+            ("display_a", self.display_a),
+            ("display_b", self.display_b),
+        ):
+            if value is not None:
+                requested_items.append(f"{key}={value!r}")
+        return requested_items
+
+    def readback_checks(self) -> list[str]:
+        checks = []
+        if self.frequency_hz is not None:
+            checks.append("frequency_hz")
+        if self.bias_voltage_v is not None:
+            checks.append("bias_voltage_v")
+        if self.osc_level_v is not None:
+            checks.append("osc_level_v")
+        if self.display_a is not None and self.display_b is not None:
+            checks.append("display")
+        if self.circuit_mode is not None:
+            checks.append("circuit_mode")
+        return checks
+
+    def unverified_messages(self, instrument_name: str) -> list[str]:
+        messages = []
+        for parameter_name, value in (
+            ("bias_enabled", None if self.bias_enabled is None else str(self.bias_enabled)),
+            ("trigger_mode", self.trigger_mode),
+            ("measurement_mode", self.measurement_mode),
+            ("zy_range", self.zy_range),
+        ):
+            if value is not None:
+                messages.append(
+                    format_configure_unverified(instrument_name, parameter_name, value)
+                )
+        return messages
+
+
+@dataclass(slots=True)
+class _ParameterReadback:
+    values: dict[str, float | str]
+    errors: dict[str, Exception]
+    snapshots: dict[str, _OutputSnapshot]
+
+
 @dataclass(slots=True)
 class HP4192AMeasurement:
     """
@@ -285,6 +484,135 @@ class HP4192AMeasurement:
     display_b: float
 
 
+@dataclass(slots=True)
+class HP4192AStableMeasurement:
+    """
+    HP 4192A measurement taken once successive readings agreed.
+
+    This is the return type of `HP4192A.measure_until_stable()`.
+
+    - `display_a`, `display_b`: the last reading, `nan` on overflow or
+      uncalibrated
+    - `trigger_count`: number of ``EX`` triggers it took
+    - `converged`: `False` when the deadline or trigger limit was reached
+      before two successive readings agreed
+    """
+
+    display_a: float
+    display_b: float
+    trigger_count: int
+    converged: bool
+
+
+@dataclass(slots=True)
+class HP4192AMeasurementBlock:
+    """
+    Columnar HP 4192A block-measurement result.
+
+    This is the return type of `HP4192A.measure_many()`. Every field is a
+    one-dimensional NumPy array with one entry per triggered measurement.
+
+    - `display_a`, `display_b`: float64 values, `nan` on overflow or
+      uncalibrated
+    - `display_a_status`, `display_b_status`: raw table 3-25 status codes
+      (``N``, ``O``, or ``U``) as one-character strings
+    - `timestamps_s`: `time.monotonic()` value taken right after each read
+    """
+
+    display_a: numpy.ndarray
+    display_b: numpy.ndarray
+    display_a_status: numpy.ndarray
+    display_b_status: numpy.ndarray
+    timestamps_s: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.display_a)
+
+
+@dataclass(slots=True)
+class HP4192ASweepPoint:
+    """
+    One step of an HP 4192A built-in frequency sweep.
+
+    This is the item type yielded by `HP4192A.sweep()`.
+
+    `display_a_status` and `display_b_status` are the raw table 3-25 status
+    codes: ``N`` (normal), ``O`` (overflow), or ``U`` (uncalibrated). The
+    matching display value is `math.nan` when the status is not ``N``.
+    """
+
+    frequency_hz: float
+    display_a: float
+    display_b: float
+    display_a_status: str
+    display_b_status: str
+
+
+@dataclass(slots=True)
+class HP4192AFrequencySweep:
+    """
+    Columnar result of `HP4192A.sweep_frequencies()`.
+
+    Every field is a one-dimensional NumPy array with one entry per requested
+    frequency, in request order.
+
+    - `frequency_hz`: the frequency the instrument was set to, after rounding
+      to its resolution
+    - `display_a`, `display_b`: float64 values, `nan` on overflow or
+      uncalibrated
+    - `display_a_status`, `display_b_status`: raw table 3-25 status codes
+    - `timestamps_s`: `time.monotonic()` value taken right after each read
+    """
+
+    frequency_hz: numpy.ndarray
+    display_a: numpy.ndarray
+    display_b: numpy.ndarray
+    display_a_status: numpy.ndarray
+    display_b_status: numpy.ndarray
+    timestamps_s: numpy.ndarray
+
+    def __len__(self) -> int:
+        return len(self.frequency_hz)
+
+
+@dataclass(slots=True)
+class HP4192ASequenceStep:
+    """
+    One compiled step of an `HP4192ASequence`.
+
+    - `configure_kwargs`: the `configure()` keywords of the step as given
+    - `commands`: program codes the step still sends, in one device write
+    - `skipped_commands`: codes dropped because they are already in effect
+    - `readback_checks`: verification checks for the settings this step
+      actually changes
+    - `measure`: whether the step ends with `measure()`
+    """
+
+    configure_kwargs: dict[str, object]
+    commands: list[str]
+    skipped_commands: list[str]
+    readback_checks: list[str]
+    measure: bool
+    _request: _ConfigureRequest = field(repr=False)
+
+
+@dataclass(slots=True)
+class HP4192ASequence:
+    """
+    Measurement recipe compiled by `HP4192A.compile_sequence()`.
+    """
+
+    steps: list[HP4192ASequenceStep]
+
+    @property
+    def command_count(self) -> int:
+        return sum(len(step.commands) for step in self.steps)
+
+    @property
+    def skipped_command_count(self) -> int:
+        return sum(len(step.skipped_commands) for step in self.steps)
+
+
 class HP4192A(Instrument):
     """
     HP 4192A driver for the active measurement-automation work.
@@ -295,17 +623,56 @@ class HP4192A(Instrument):
 
     def __init__(
         self,
-        device: VisaDevice,
+        device: InstrumentDevice,
         *,
         trace_enabled: bool = False,
         trace_print_live: bool = False,
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+        trace_categories: Iterable[str] | None = None,
+        batch_writes: bool = False,
+        verify: HP4192AVerifyMode = "full",
+        verify_sample_interval: int = 10,
+        adaptive_timing: bool = False,
+        timing_profile_path: str | Path | None = None,
     ):
         super().__init__("HP 4192A LF Impedance Analyzer", device.resource_name)
         self._device = device
+        self._batch_writes = batch_writes
+        self._verify_mode = _validate_verify_mode(verify)
+        self._verify_sample_interval = _validate_verify_sample_interval(
+            verify_sample_interval
+        )
+        self._verification_counts = {
+            "configure_calls": 0,
+            "verified": 0,
+            "skipped": 0,
+        }
+        # Calls made in "sampled" mode; every Nth of these is verified.
+        self._verify_sample_count = 0
         self._trace_enabled = trace_enabled
         self._trace_print_live = trace_print_live
-        self._trace_started_at = time.monotonic()
-        self._trace_entries: list[str] = []
+        self._trace_buffer = HP4192ATraceBuffer(trace_capacity, trace_categories)
+        # Output format (`F0`/`F1`) and DISPLAY C recall code last sent by this
+        # driver. `None` means unknown, so the next snapshot sends it again.
+        self._output_format_code: str | None = None
+        self._display_c_recall_code: str | None = None
+        # Adaptive settle timing. The last settle is kept pending until the
+        # readback after it is known to be good or bad.
+        self._settle_timing: HP4192ASettleTiming | None = None
+        self._timing_profile_path = timing_profile_path
+        self._pending_settle: tuple[str, float, bool] | None = None
+        self._frequency_changed_since_trigger = False
+        self._average_enabled: bool | None = None
+        self._high_speed_enabled: bool | None = None
+        # Per-phase timing, only while a `profile()` block is active.
+        self._profile: HP4192AProfile | None = None
+        # Queued `configure()` settings while a `batch()` block is active.
+        self._batch_kwargs: dict[str, object] | None = None
+        self._batch_verify: HP4192AVerifyMode | None = None
+        if adaptive_timing:
+            self._settle_timing = HP4192ASettleTiming(_default_settle_times())
+            if timing_profile_path is not None:
+                self._settle_timing.load(timing_profile_path, self._timing_profile_key())
 
     @classmethod
     def open(
@@ -315,10 +682,22 @@ class HP4192A(Instrument):
         timeout_ms: int = 5000,
         trace_enabled: bool = False,
         trace_print_live: bool = False,
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+        trace_categories: Iterable[str] | None = None,
+        batch_writes: bool = False,
+        verify: HP4192AVerifyMode = "full",
+        verify_sample_interval: int = 10,
+        adaptive_timing: bool = False,
+        timing_profile_path: str | Path | None = None,
+        transport: HP4192ATransport = "visa",
     ) -> "HP4192A":
         """
         Open an HP 4192A through a VISA resource.
 
+        The device uses the process-wide shared VISA resource manager, so
+        opening several analyzers, or reopening one per run, initializes the
+        VISA backend only once. See `instruments.visa.close_resource_managers()`.
+
         Parameters
         ----------
         resource_name:
@@ -332,12 +711,55 @@ class HP4192A(Instrument):
         trace_print_live:
             When true together with `trace_enabled`, print trace entries live
             as they happen.
+        trace_capacity:
+            Number of trace events kept in memory. Older events are dropped,
+            so tracing can stay on for long runs.
+        trace_categories:
+            Trace only these categories, for example ``{"VERIFY", "READTRY"}``.
+            `None` traces all of them.
+        batch_writes:
+            When true, send the program codes of one `configure()` call (and
+            the limits of one `sweep()`) concatenated in a single device write
+            instead of one write per code. Each write is a full LAN-to-GPIB
+            transaction on a gateway, so this cuts configure latency roughly
+            in proportion to the number of codes. The trace still shows one
+            WRITE entry per code.
+        verify:
+            Default `configure()` verification policy: ``"full"``,
+            ``"sampled"``, or ``"none"``. See `configure()`.
+        verify_sample_interval:
+            With ``verify="sampled"``, verify every Nth `configure()` call.
+        adaptive_timing:
+            When true, learn the settle time after ``EX`` and after a
+            configure batch per command class instead of always waiting the
+            fixed worst-case time. Only readbacks the driver can check (recall
+            snapshots) shorten a settle; `measure()` and the other ``F0``
+            reads can only lengthen it. See `get_timing_profile()`.
+        timing_profile_path:
+            Optional JSON file for the learned timing profile. When given
+            together with `adaptive_timing`, the profile stored for this VISA
+            resource is loaded on open and saved on `close()`.
+        transport:
+            ``"visa"`` (default) opens the resource through PyVISA.
+            ``"socket"`` talks to a ``TCPIP0::<host>::<port>::SOCKET``
+            resource over a raw TCP socket without PyVISA; see
+            `tcp_socket.SocketDevice`.
+            ``"vxi11"`` talks to a ``TCPIP0::<ip>::gpib0,<addr>::INSTR``
+            gateway resource with the built-in VXI-11 client, without a
+            vendor VISA install; see `vxi11.Vxi11Device`.
         """
 
         return cls(
-            VisaDevice(resource_name, timeout_ms=timeout_ms),
+            _open_device(resource_name, timeout_ms=timeout_ms, transport=transport),
             trace_enabled=trace_enabled,
             trace_print_live=trace_print_live,
+            trace_capacity=trace_capacity,
+            trace_categories=trace_categories,
+            batch_writes=batch_writes,
+            verify=verify,
+            verify_sample_interval=verify_sample_interval,
+            adaptive_timing=adaptive_timing,
+            timing_profile_path=timing_profile_path,
         )
 
     def ping(self, *, show: bool = True) -> InstrumentReport:
@@ -372,18 +794,30 @@ class HP4192A(Instrument):
         - In this lab setup, VISA device clear reset the frequency to 100 kHz.
         - This method reports only parameters that currently have a proven
           manual-backed readback path in this driver.
+        - The report is read through the same snapshot planner as
+          `get_many()`: one ``FRR`` snapshot for the display functions,
+          circuit mode, and spot frequency, then one ``BIR`` and one ``OLR``
+          snapshot. If DISPLAY C of the ``FRR`` snapshot never shows a valid
+          frequency, the display rows are still reported and only the spot
+          frequency gets a note.
         - Because the instrument is queried through recall codes such as
           `FRR`, `BIR`, and `OLR`, DISPLAY C may end up showing the last
           recalled parameter after `ping()` finishes.
         """
 
+        self._flush_configure_batch()
+
         state_rows: dict[str, object] = {}
         notes: list[str] = []
 
-        try:
-            frequency_snapshot = self._read_output_snapshot("FRR")
-        except Exception as exc:
-            notes.append(f"Could not read display functions and spot frequency: {exc}")
+        readback = self._read_parameters(_PING_PARAMETERS)
+
+        frequency_snapshot = readback.snapshots.get("FRR")
+        if frequency_snapshot is None:
+            notes.append(
+                "Could not read display functions and spot frequency: "
+                f"{readback.errors['frequency_hz']}"
+            )
         else:
             display_a_name = _DISPLAY_A_CODE_TO_NAME.get(
                 frequency_snapshot.display_a.function_code,
@@ -403,34 +837,28 @@ class HP4192A(Instrument):
             if circuit_mode is not None:
                 state_rows["circuit mode"] = circuit_mode
 
-            try:
-                frequency_hz = _parse_spot_frequency_hz(frequency_snapshot)
-            except Exception as exc:
-                notes.append(f"Could not parse spot frequency from DISPLAY C: {exc}")
+            if "frequency_hz" in readback.values:
+                state_rows["spot frequency"] = _format_frequency_hz(
+                    readback.values["frequency_hz"]
+                )
             else:
-                state_rows["spot frequency"] = _format_frequency_hz(frequency_hz)
+                notes.append(
+                    f"Could not read spot frequency: {readback.errors['frequency_hz']}"
+                )
 
-        try:
-            bias_v = self._read_display_c_number(
-                "BIR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="spot bias",
-            )
-        except Exception as exc:
-            notes.append(f"Could not read spot bias: {exc}")
+        if "bias_voltage_v" in readback.values:
+            state_rows["spot bias"] = f"{_trim_zeros(readback.values['bias_voltage_v'])} V"
         else:
-            state_rows["spot bias"] = f"{_trim_zeros(bias_v)} V"
+            notes.append(f"Could not read spot bias: {readback.errors['bias_voltage_v']}")
 
-        try:
-            osc_level_v = self._read_display_c_number(
-                "OLR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="oscillator level",
+        if "osc_level_v" in readback.values:
+            state_rows["oscillator level"] = (
+                f"{_trim_zeros(readback.values['osc_level_v'])} V"
             )
-        except Exception as exc:
-            notes.append(f"Could not read oscillator level: {exc}")
         else:
-            state_rows["oscillator level"] = f"{_trim_zeros(osc_level_v)} V"
+            notes.append(
+                f"Could not read oscillator level: {readback.errors['osc_level_v']}"
+            )
 
         report = InstrumentReport(
             instrument_name=self.instrument_name,
@@ -495,42 +923,61 @@ class HP4192A(Instrument):
         of guessing.
         """
 
-        if parameter_name == "frequency_hz":
-            return self._read_spot_frequency_hz()
+        return self.get_many([parameter_name])[parameter_name]
 
-        if parameter_name == "bias_voltage_v":
-            return self._read_display_c_number(
-                "BIR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="spot bias",
-            )
+    def get_many(
+        self,
+        parameter_names: Iterable[HP4192AGetParameter],
+    ) -> dict[str, float | str]:
+        """
+        Read several current HP 4192A parameter values with the fewest
+        instrument snapshots.
 
-        if parameter_name == "osc_level_v":
-            return self._read_display_c_number(
-                "OLR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="oscillator level",
-            )
+        Parameters
+        ----------
+        parameter_names:
+            Names accepted by `get()`:
+            `frequency_hz`, `bias_voltage_v`, `osc_level_v`, `display_a`,
+            `display_b`, and `circuit_mode`. Duplicates are read once.
+
+        Return value
+        ------------
+        A dict mapping each requested name to the same value `get()` returns,
+        in the requested order.
 
-        snapshot = self._read_output_snapshot("FRR")
+        Snapshot planning
+        -----------------
+        Each snapshot is one ``F1`` / recall code / ``EX`` / read cycle, and
+        the parameters are grouped by the recall code they need:
+
+        - ``FRR``: `frequency_hz`, `display_a`, `display_b`, `circuit_mode`
+        - ``BIR``: `bias_voltage_v`
+        - ``OLR``: `osc_level_v`
+
+        So asking for frequency, bias, oscillator level, and both display
+        functions costs three snapshots instead of five separate `get()`
+        calls. Each snapshot is retried as a unit when its readback comes back
+        empty or in the wrong output state.
+
+        Errors
+        ------
+        All values are read from the instrument before anything is raised.
+        If any requested parameter could not be read, the error for the first
+        such parameter in the requested order is raised.
+        """
 
-        if parameter_name == "display_a":
-            return _get_display_a_get_value(snapshot.display_a.function_code)
+        if isinstance(parameter_names, str):
+            raise TypeError("parameter_names must be a collection of names, not one str")
 
-        if parameter_name == "display_b":
-            return _get_display_b_get_value(snapshot.display_b.function_code)
+        requested_names = list(dict.fromkeys(parameter_names))
+        self._flush_configure_batch()
+        readback = self._read_parameters(requested_names)
 
-        if parameter_name == "circuit_mode":
-            circuit_mode = _DISPLAY_A_CODE_TO_CIRCUIT_MODE.get(
-                snapshot.display_a.function_code
-            )
-            if circuit_mode is None:
-                raise RuntimeError(
-                    "current DISPLAY A function does not expose circuit_mode"
-                )
-            return circuit_mode
+        for name in requested_names:
+            if name in readback.errors:
+                raise readback.errors[name]
 
-        raise ValueError(f"Unsupported get() parameter: {parameter_name!r}")
+        return {name: readback.values[name] for name in requested_names}
 
     def configure(
         self,
@@ -551,6 +998,8 @@ class HP4192A(Instrument):
         # Measurement display
         display_a: HP4192ADisplayA | None = None,
         display_b: HP4192ADisplayB | None = None,
+        # Self-check
+        verify: HP4192AVerifyMode | None = None,
     ) -> None:
         """
         Change HP 4192A settings through one high-level entry point.
@@ -728,6 +1177,12 @@ class HP4192A(Instrument):
         after the set command. This gives the instrument a chance to make
         DISPLAY C follow the last changed numeric test parameter.
 
+        Write batching
+        --------------
+        By default each program code is sent as its own device write. When the
+        driver was created with `batch_writes=True`, all codes of one call are
+        concatenated into one write, for example ``FR1ENC2A1B1``.
+
         Configure self-check
         --------------------
         After sending each requested setting, this method reads the instrument
@@ -735,8 +1190,11 @@ class HP4192A(Instrument):
         parameter.
 
         To reduce false failures from occasional stale readback, the driver
-        retries the full verification pass a small number of times before it
-        gives up and raises.
+        retries verification a small number of times before it gives up and
+        raises. Each retry re-reads only the parameters that failed or could
+        not be read; parameters that already passed keep their result. For
+        example, a stale ``BIR`` readback costs one extra ``BIR`` snapshot,
+        not another ``FRR``, ``BIR``, and ``OLR`` pass.
 
         Behavior:
         - if the actual instrument value matches the requested value, a normal
@@ -747,118 +1205,161 @@ class HP4192A(Instrument):
           raises `ConfigurationVerificationError`
         - if a parameter has no safe readback path in the current state, the
           method prints `readback unavailable` instead of guessing
+
+        Verification policy
+        -------------------
+        verify:
+            Overrides the instrument default set with `HP4192A.open(verify=...)`
+            or `set_verify()` for this one call.
+            Accepted values:
+            - ``"full"``: settle and verify every call (default)
+            - ``"sampled"``: verify every Nth call, plus every call that
+              changes `display_a`/`display_b` or `circuit_mode`
+            - ``"none"``: send the commands only
+
+            When a call is not verified, the post-configure settle pause and
+            the readback are both skipped, and no confirmation lines are
+            printed. `get_verification_counts()` reports how many calls were
+            verified and skipped.
+
+            Use ``"full"`` for bench setup and self-tests. ``"sampled"`` and
+            ``"none"`` are meant for high-throughput loops that already check
+            their results another way.
+
+        Inside `batch()` the call is queued instead of sent; see `batch()`.
         """
 
-        commands: list[str] = []
-        latest_display_c_recall_code: str | None = None
-        expected_frequency_hz: float | None = None
-        expected_bias_voltage_v: float | None = None
-        expected_osc_level_v: float | None = None
-        effective_circuit_mode = circuit_mode
-
-        if frequency_hz is not None:
-            frequency_hz = _validate_frequency_hz(frequency_hz)
-            expected_frequency_hz = _normalize_frequency_hz(frequency_hz)
-            commands.append(_format_spot_frequency_set_command(frequency_hz))
-            latest_display_c_recall_code = "FRR"
-
-        if bias_voltage_v is not None:
-            bias_voltage_v = _validate_bias_voltage_v(bias_voltage_v)
-            expected_bias_voltage_v = _normalize_bias_voltage_v(bias_voltage_v)
-            commands.append(_format_spot_bias_set_command(bias_voltage_v))
-            latest_display_c_recall_code = "BIR"
-
-        if osc_level_v is not None:
-            osc_level_v = _validate_osc_level_v(osc_level_v)
-            expected_osc_level_v = _normalize_osc_level_v(osc_level_v)
-            commands.append(_format_osc_level_set_command(osc_level_v))
-            latest_display_c_recall_code = "OLR"
-
-        if bias_enabled is not None:
-            bias_enabled = _validate_bool_parameter("bias_enabled", bias_enabled)
-            if bias_enabled is False and expected_bias_voltage_v is not None:
-                expected_bias_voltage_v = 0.0
-
-        if trigger_mode is not None:
-            commands.append(_get_trigger_mode_code(trigger_mode))
-
-        if measurement_mode is not None:
-            commands.extend(_get_measurement_mode_codes(measurement_mode))
-
-        if zy_range is not None:
-            commands.append(_get_zy_range_code(zy_range))
-
-        if display_a is not None or display_b is not None:
-            if display_a is None or display_b is None:
-                raise ValueError("display_a and display_b must be provided together")
-
-            implied_circuit_mode = _IMPLIED_CIRCUIT_MODE_FOR_DISPLAY_A.get(display_a)
-            if implied_circuit_mode is not None:
-                if circuit_mode is None:
-                    effective_circuit_mode = implied_circuit_mode
-                elif circuit_mode != implied_circuit_mode:
-                    raise ValueError(
-                        f"display_a={display_a!r} requires circuit_mode={implied_circuit_mode!r}"
-                    )
-
-            if display_a in {"inductance", "capacitance"} and circuit_mode is None:
-                raise ValueError(
-                    "display_a='inductance' or display_a='capacitance' "
-                    "require circuit_mode to be set explicitly"
-                )
+        configure_kwargs = {
+            "frequency_hz": frequency_hz,
+            "bias_voltage_v": bias_voltage_v,
+            "osc_level_v": osc_level_v,
+            "bias_enabled": bias_enabled,
+            "trigger_mode": trigger_mode,
+            "measurement_mode": measurement_mode,
+            "zy_range": zy_range,
+            "circuit_mode": circuit_mode,
+            "display_a": display_a,
+            "display_b": display_b,
+        }
+        if self._batch_kwargs is not None:
+            if verify is not None:
+                raise ValueError("inside batch(), pass verify to batch() instead of configure()")
+            self._queue_configure(configure_kwargs)
+            return
 
-        if effective_circuit_mode is not None:
-            commands.append(_get_circuit_mode_code(effective_circuit_mode))
+        verify_mode = self._verify_mode if verify is None else _validate_verify_mode(verify)
+        self._apply_configure_request(_build_configure_request(**configure_kwargs), verify_mode)
 
-        if display_a is not None and display_b is not None:
-            commands.extend(_get_display_pair_codes(display_a, display_b))
+    @contextmanager
+    def batch(self, *, verify: HP4192AVerifyMode | None = None) -> Iterator[None]:
+        """
+        Defer `configure()` calls and apply them together.
+
+        Inside the ``with`` block, `configure()` only queues its settings.
+        Later calls override earlier ones for the same parameter. The merged
+        request is sent in one `configure()`: one command batch, one
+        post-configure settle, and one verification pass, with the usual
+        confirmation line per parameter.
+
+        The queue is applied when the block ends, or earlier at the start of
+        any other driver call inside the block that talks to the instrument
+        (`measure()`, `get()`, `ping()`, a sweep, `run_sequence()`, ...).
+        That call then starts from the output state the verification left,
+        so it reads on its first attempt. If the block raises, the queued
+        settings are discarded and nothing is sent.
+
+        `verify` sets the verification policy of the merged call, as in
+        `configure()`. Nested `batch()` blocks join the outer one and share
+        its policy, so passing `verify` to a nested block raises ValueError.
+
+        Example:
+            with meter.batch():
+                meter.configure(frequency_hz=10_000.0)
+                meter.configure(circuit_mode="series", display_a="impedance", display_b="phase_deg")
+        """
 
-        if bias_enabled is not None:
-            commands.append(_get_bias_enabled_code(bias_enabled))
+        if self._batch_kwargs is not None:
+            if verify is not None:
+                raise ValueError("nested batch() joins the outer one; pass verify to the outer batch()")
+            yield
+            return
 
-        requested_items = []
-        for key, value in (
-            ("frequency_hz", frequency_hz),
-            ("bias_voltage_v", bias_voltage_v),
-            ("osc_level_v", osc_level_v),
-            ("bias_enabled", bias_enabled),
-            ("trigger_mode", trigger_mode),
-            ("measurement_mode", measurement_mode),
-            ("zy_range", zy_range),
-            ("circuit_mode", effective_circuit_mode),
-            ("display_a", display_a),
-            ("display_b", display_b),
+        self._batch_kwargs = {}
+        self._batch_verify = None if verify is None else _validate_verify_mode(verify)
+        try:
+            yield
+        except BaseException:
+            self._batch_kwargs = None
+            raise
+        try:
+            self._flush_configure_batch()
+        finally:
+            self._batch_kwargs = None
+
+    def _queue_configure(self, configure_kwargs: dict[str, object]) -> None:
+        merged = dict(self._batch_kwargs)
+        display_a = configure_kwargs["display_a"]
+        if (
+            display_a in _IMPLIED_CIRCUIT_MODE_FOR_DISPLAY_A
+            and configure_kwargs["circuit_mode"] is None
         ):
-            if value is not None:
-                requested_items.append(f"{key}={value!r}")
+            # Applied one by one, this call would switch to the implied
+            # circuit mode, so an earlier queued circuit mode no longer holds.
+            merged.pop("circuit_mode", None)
+        merged.update(
+            (name, value) for name, value in configure_kwargs.items() if value is not None
+        )
+
+        # Validate now, so a bad call fails where it is made.
+        _build_configure_request(
+            **{name: merged.get(name) for name in _CONFIGURE_PARAMETERS}
+        )
+        self._batch_kwargs = merged
+        self._trace("CONFIG", "queued %s", ", ".join(sorted(merged)))
+
+    def _flush_configure_batch(self) -> None:
+        configure_kwargs = self._batch_kwargs
+        if not configure_kwargs:
+            return
+
+        self._batch_kwargs = {}
+        verify_mode = self._verify_mode if self._batch_verify is None else self._batch_verify
+        request = _build_configure_request(
+            **{name: configure_kwargs.get(name) for name in _CONFIGURE_PARAMETERS}
+        )
+        self._apply_configure_request(request, verify_mode)
+
+    def _apply_configure_request(
+        self,
+        request: _ConfigureRequest,
+        verify_mode: HP4192AVerifyMode,
+        *,
+        batch: bool | None = None,
+        span_name: str = "configure",
+    ) -> None:
+        # The one place that sends a configure request and applies the
+        # verification policy and counters; `run_sequence()` steps come here
+        # too, with their precompiled commands in `request.commands`.
+        requested_items = request.requested_items()
         if requested_items:
             self._trace("CONFIG", ", ".join(requested_items))
 
-        for command in commands:
-            self._write_command(command)
+        with self._trace_span("CONFIG", span_name):
+            self._write_commands(request.commands, batch=batch)
 
-        try:
-            messages = self._verify_configuration_with_retry(
-                frequency_hz=frequency_hz,
-                expected_frequency_hz=expected_frequency_hz,
-                bias_voltage_v=bias_voltage_v,
-                expected_bias_voltage_v=expected_bias_voltage_v,
-                osc_level_v=osc_level_v,
-                expected_osc_level_v=expected_osc_level_v,
-                bias_enabled=bias_enabled,
-                trigger_mode=trigger_mode,
-                measurement_mode=measurement_mode,
-                zy_range=zy_range,
-                effective_circuit_mode=effective_circuit_mode,
-                display_a=display_a,
-                display_b=display_b,
-                commands_were_sent=bool(commands),
-            )
-            for message in messages:
-                print(message)
-        finally:
-            if latest_display_c_recall_code is not None:
-                self._write_command(latest_display_c_recall_code)
+            try:
+                if self._should_verify_configuration(request, verify_mode):
+                    self._verification_counts["verified"] += 1
+                    with self._trace_span("VERIFY", "verify"):
+                        messages = self._verify_configuration_with_retry(request)
+                    for message in messages:
+                        print(message)
+                else:
+                    self._verification_counts["skipped"] += 1
+                    self._trace("VERIFY", "skipped (verify=%r)", verify_mode)
+            finally:
+                if request.display_c_recall_code is not None:
+                    self._select_display_c_recall(request.display_c_recall_code)
 
     def measure(self) -> HP4192AMeasurement:
         """
@@ -885,12 +1386,20 @@ class HP4192A(Instrument):
         ------------------------------
         This method uses the current display setup and sends:
 
-        - ``F1`` to request DISPLAY A/B/C output
+        - ``F0`` to request DISPLAY A/B output only (skipped when already in
+          effect, and also when ``F1`` is in effect, for example right after a
+          verified `configure()`; DISPLAY C is then read but not parsed)
         - ``EX`` to execute one measurement/output cycle
         - one VISA read of the returned data string
 
         Important notes
         ---------------
+        - DISPLAY C is not needed here, so it is left out of the output string
+          when ``F0`` is selected. After a verified `configure()`, ``F1`` is
+          already active and switching would cost an ``F0`` write now and an
+          ``F1`` write at the next verification, which is more than the
+          extra DISPLAY C field of one reading. Block reads (`measure_many()`,
+          sweeps, `measure_until_stable()`) always switch to ``F0``.
         - `measure()` does not send a recall code such as `FRR` or `BIR`.
         - Because of that, it does not intentionally change which parameter is
           shown on DISPLAY C.
@@ -898,393 +1407,1040 @@ class HP4192A(Instrument):
           example impedance/phase or inductance/Q.
         """
 
-        snapshot = self._read_output_snapshot()
+        self._flush_configure_batch()
+        display_a, display_b = self._read_display_pair(keep_f1=True)
+        self._finish_settle(None)
 
         return HP4192AMeasurement(
             display_a=_parse_numeric_measurement_field(
-                snapshot.display_a,
+                display_a,
                 display_name="DISPLAY A",
             ),
             display_b=_parse_numeric_measurement_field(
-                snapshot.display_b,
+                display_b,
                 display_name="DISPLAY B",
             ),
         )
 
-    def _verify_configuration_with_retry(
+    def measure_until_stable(
         self,
         *,
-        frequency_hz: float | None,
-        expected_frequency_hz: float | None,
-        bias_voltage_v: float | None,
-        expected_bias_voltage_v: float | None,
-        osc_level_v: float | None,
-        expected_osc_level_v: float | None,
-        bias_enabled: bool | None,
-        trigger_mode: HP4192ATriggerMode | None,
-        measurement_mode: HP4192AMeasurementMode | None,
-        zy_range: HP4192AZYRange | None,
-        effective_circuit_mode: HP4192ACircuitMode | None,
-        display_a: HP4192ADisplayA | None,
-        display_b: HP4192ADisplayB | None,
-        commands_were_sent: bool,
-    ) -> list[str]:
-        if commands_were_sent:
-            time.sleep(_HP4192A_POST_CONFIG_SETTLE_S)
-
-        last_exception: Exception | None = None
-        last_category = "unknown"
-
-        for attempt_index in range(_HP4192A_VERIFY_ATTEMPTS):
-            attempt_number = attempt_index + 1
-            self._trace(
-                "VERIFY",
-                f"attempt {attempt_number}/{_HP4192A_VERIFY_ATTEMPTS}",
-            )
-
-            try:
-                return self._verify_configuration_once(
-                    frequency_hz=frequency_hz,
-                    expected_frequency_hz=expected_frequency_hz,
-                    bias_voltage_v=bias_voltage_v,
-                    expected_bias_voltage_v=expected_bias_voltage_v,
-                    osc_level_v=osc_level_v,
-                    expected_osc_level_v=expected_osc_level_v,
-                    bias_enabled=bias_enabled,
-                    trigger_mode=trigger_mode,
-                    measurement_mode=measurement_mode,
-                    zy_range=zy_range,
-                    effective_circuit_mode=effective_circuit_mode,
-                    display_a=display_a,
-                    display_b=display_b,
-                )
-            except Exception as exc:
-                last_exception = exc
-                last_category = _classify_hp4192a_exception(exc)
-                self._trace(
-                    "VERIFY",
-                    f"attempt {attempt_number} failed ({last_category}): {exc}",
-                )
+        rel_tol: float = 1e-3,
+        abs_tol: float = 0.0,
+        timeout_s: float = 2.0,
+        max_triggers: int = 50,
+        trigger_settle_s: float = 0.02,
+    ) -> HP4192AStableMeasurement:
+        """
+        Trigger repeatedly until two successive DISPLAY A/B readings agree,
+        then return the last one.
 
-                if attempt_number >= _HP4192A_VERIFY_ATTEMPTS:
-                    break
+        Use this after a large frequency step instead of a fixed worst-case
+        wait. In high-speed mode the reading usually settles in a couple of
+        triggers; in average mode the method simply keeps triggering until it
+        has.
 
-                time.sleep(_HP4192A_VERIFY_RETRY_DELAY_S)
+        Parameters
+        ----------
+        rel_tol, abs_tol:
+            Two readings agree when both DISPLAY A and DISPLAY B satisfy
+            ``math.isclose(previous, current, rel_tol=rel_tol, abs_tol=abs_tol)``.
+            Use `abs_tol` when a display can sit near zero, for example phase.
+            Overflow or uncalibrated readings (`nan`) agree only with another
+            `nan` on the same display.
 
-        if isinstance(last_exception, ConfigurationVerificationError):
-            raise ConfigurationVerificationError(
-                "configure verification failed after "
-                f"{_HP4192A_VERIFY_ATTEMPTS} attempts "
-                f"({last_category}): {last_exception}"
-            ) from last_exception
+        timeout_s:
+            Deadline in seconds, measured from the first trigger.
 
-        raise RuntimeError(
-            "configure verification failed after "
-            f"{_HP4192A_VERIFY_ATTEMPTS} attempts "
-            f"({last_category}): {last_exception}"
-        ) from last_exception
+        max_triggers:
+            Upper limit on the number of ``EX`` triggers.
 
-    def _verify_configuration_once(
-        self,
-        *,
-        frequency_hz: float | None,
-        expected_frequency_hz: float | None,
-        bias_voltage_v: float | None,
-        expected_bias_voltage_v: float | None,
-        osc_level_v: float | None,
-        expected_osc_level_v: float | None,
-        bias_enabled: bool | None,
-        trigger_mode: HP4192ATriggerMode | None,
-        measurement_mode: HP4192AMeasurementMode | None,
-        zy_range: HP4192AZYRange | None,
-        effective_circuit_mode: HP4192ACircuitMode | None,
-        display_a: HP4192ADisplayA | None,
-        display_b: HP4192ADisplayB | None,
-    ) -> list[str]:
-        messages: list[str] = []
-        snapshot_for_display_checks: _OutputSnapshot | None = None
+        trigger_settle_s:
+            Pause after each ``EX`` before reading, in seconds. This replaces
+            the fixed driver settle time for this method only.
 
-        if any(
-            value is not None
-            for value in (frequency_hz, effective_circuit_mode, display_a, display_b)
-        ):
-            snapshot_for_display_checks = self._read_output_snapshot("FRR")
+        Return value
+        ------------
+        An `HP4192AStableMeasurement` with the last DISPLAY A/B pair, the
+        number of triggers used, and whether the readings converged. Reaching
+        the deadline or trigger limit is not an error; check `converged`.
 
-        if frequency_hz is not None:
-            if snapshot_for_display_checks is None:
-                raise ConfigurationVerificationError(
-                    "frequency_hz was changed but no frequency readback was captured"
-                )
+        Manual-backed measurement path
+        ------------------------------
+        Same as `measure()`, with ``EX`` and the read repeated:
 
-            actual_frequency_hz = _parse_spot_frequency_hz(snapshot_for_display_checks)
-            messages.append(
-                _verify_numeric_setting(
-                    instrument_name=self.instrument_name,
-                    parameter_name="frequency_hz",
-                    requested_value=frequency_hz,
-                    expected_value=expected_frequency_hz,
-                    actual_value=actual_frequency_hz,
-                    requested_text=_format_frequency_hz(frequency_hz),
-                    actual_text=_format_frequency_hz(actual_frequency_hz),
-                    absolute_tolerance=1e-6,
-                )
-            )
+        - ``F0`` (only when not already in effect)
+        - ``EX``, one VISA read, repeated until two readings agree
+        """
 
-        if bias_voltage_v is not None:
-            actual_bias_voltage_v = self._read_display_c_number(
-                "BIR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="spot bias",
+        rel_tol = _require_real_number("rel_tol", rel_tol)
+        abs_tol = _require_real_number("abs_tol", abs_tol)
+        timeout_s = _require_real_number("timeout_s", timeout_s)
+        trigger_settle_s = _require_real_number("trigger_settle_s", trigger_settle_s)
+        if rel_tol < 0.0 or abs_tol < 0.0:
+            raise ValueError("rel_tol and abs_tol must not be negative")
+        if timeout_s < 0.0 or trigger_settle_s < 0.0:
+            raise ValueError("timeout_s and trigger_settle_s must not be negative")
+        if isinstance(max_triggers, bool) or not isinstance(max_triggers, int):
+            raise TypeError("max_triggers must be an int")
+        if max_triggers < 2:
+            raise ValueError("max_triggers must be at least 2")
+
+        self._flush_configure_batch()
+        self._trace(
+            "STABLE",
+            "start rel_tol=%g abs_tol=%g timeout=%g s",
+            rel_tol,
+            abs_tol,
+            timeout_s,
+        )
+        deadline = time.monotonic() + timeout_s
+        previous: tuple[float, float] | None = None
+        trigger_count = 0
+
+        while True:
+            display_a, display_b = self._retry_readback(
+                lambda: self._read_display_pair(settle_s=trigger_settle_s),
+                parameter_name="stable measurement",
             )
-            messages.append(
-                _verify_numeric_setting(
-                    instrument_name=self.instrument_name,
-                    parameter_name="bias_voltage_v",
-                    requested_value=bias_voltage_v,
-                    expected_value=expected_bias_voltage_v,
-                    actual_value=actual_bias_voltage_v,
-                    requested_text=f"{_trim_zeros(bias_voltage_v)} V",
-                    actual_text=f"{_trim_zeros(actual_bias_voltage_v)} V",
-                    absolute_tolerance=1e-9,
-                )
+            trigger_count += 1
+            current = (
+                _parse_numeric_measurement_field(display_a, display_name="DISPLAY A"),
+                _parse_numeric_measurement_field(display_b, display_name="DISPLAY B"),
             )
 
-        if osc_level_v is not None:
-            actual_osc_level_v = self._read_display_c_number(
-                "OLR",
-                expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
-                parameter_name="oscillator level",
+            converged = previous is not None and all(
+                _readings_agree(old, new, rel_tol=rel_tol, abs_tol=abs_tol)
+                for old, new in zip(previous, current)
             )
-            messages.append(
-                _verify_numeric_setting(
-                    instrument_name=self.instrument_name,
-                    parameter_name="osc_level_v",
-                    requested_value=osc_level_v,
-                    expected_value=expected_osc_level_v,
-                    actual_value=actual_osc_level_v,
-                    requested_text=f"{_trim_zeros(osc_level_v)} V",
-                    actual_text=f"{_trim_zeros(actual_osc_level_v)} V",
-                    absolute_tolerance=1e-9,
+            if (
+                converged
+                or trigger_count >= max_triggers
+                or time.monotonic() >= deadline
+            ):
+                self._trace(
+                    "STABLE",
+                    "%s after %d triggers",
+                    "converged" if converged else "gave up",
+                    trigger_count,
                 )
-            )
-
-        if display_a is not None and display_b is not None:
-            if snapshot_for_display_checks is None:
-                raise ConfigurationVerificationError(
-                    "display_a/display_b were changed but no display readback was captured"
+                return HP4192AStableMeasurement(
+                    display_a=current[0],
+                    display_b=current[1],
+                    trigger_count=trigger_count,
+                    converged=converged,
                 )
 
-            actual_display_a_name = _DISPLAY_A_CODE_TO_NAME.get(
-                snapshot_for_display_checks.display_a.function_code,
-                f"unknown ({snapshot_for_display_checks.display_a.function_code})",
-            )
-            actual_display_b_name = _DISPLAY_B_CODE_TO_NAME.get(
-                snapshot_for_display_checks.display_b.function_code,
-                f"unknown ({snapshot_for_display_checks.display_b.function_code})",
-            )
-
-            messages.append(
-                _verify_display_setting(
-                    instrument_name=self.instrument_name,
-                    parameter_name="display_a",
-                    requested_value=display_a,
-                    actual_code=snapshot_for_display_checks.display_a.function_code,
-                    allowed_codes=_DISPLAY_A_REQUEST_TO_CODES[display_a],
-                    actual_text=actual_display_a_name,
-                )
-            )
-            messages.append(
-                _verify_display_setting(
-                    instrument_name=self.instrument_name,
-                    parameter_name="display_b",
-                    requested_value=display_b,
-                    actual_code=snapshot_for_display_checks.display_b.function_code,
-                    allowed_codes=_DISPLAY_B_REQUEST_TO_CODES[display_b],
-                    actual_text=actual_display_b_name,
-                )
-            )
+            previous = current
 
-        if effective_circuit_mode is not None:
-            if snapshot_for_display_checks is None:
-                raise ConfigurationVerificationError(
-                    "circuit_mode was changed but no display readback was captured"
-                )
+    def measure_many(self, count: int) -> HP4192AMeasurementBlock:
+        """
+        Trigger `count` HP 4192A measurements back to back and return them as
+        NumPy arrays.
 
-            actual_circuit_mode = _DISPLAY_A_CODE_TO_CIRCUIT_MODE.get(
-                snapshot_for_display_checks.display_a.function_code
-            )
-            if actual_circuit_mode is None:
-                messages.append(
-                    format_configure_unverified(
-                        self.instrument_name,
-                        "circuit_mode",
-                        effective_circuit_mode,
-                    )
-                )
-            elif effective_circuit_mode == "auto":
-                messages.append(
-                    format_configure_adjusted(
-                        self.instrument_name,
-                        "circuit_mode",
-                        "auto",
-                        actual_circuit_mode,
-                    )
-                )
-            elif actual_circuit_mode != effective_circuit_mode:
-                raise ConfigurationVerificationError(
-                    "circuit_mode verification failed: "
-                    f"requested {effective_circuit_mode!r}, instrument reports {actual_circuit_mode!r}"
-                )
-            else:
-                messages.append(
-                    format_configure_success(
-                        self.instrument_name,
-                        "circuit_mode",
-                        actual_circuit_mode,
-                    )
-                )
+        Parameters
+        ----------
+        count:
+            Number of measurements to trigger. Must be a positive integer.
 
-        if bias_enabled is not None:
-            messages.append(
-                format_configure_unverified(
-                    self.instrument_name,
-                    "bias_enabled",
-                    str(bias_enabled),
-                )
-            )
+        Return value
+        ------------
+        An `HP4192AMeasurementBlock` with one array entry per measurement:
 
-        if trigger_mode is not None:
-            messages.append(
-                format_configure_unverified(
-                    self.instrument_name,
-                    "trigger_mode",
-                    trigger_mode,
-                )
-            )
+        - `display_a`, `display_b`: numeric DISPLAY A/B values
+        - `display_a_status`, `display_b_status`: raw status codes
+        - `timestamps_s`: monotonic timestamp of each read
 
-        if measurement_mode is not None:
-            messages.append(
-                format_configure_unverified(
-                    self.instrument_name,
-                    "measurement_mode",
-                    measurement_mode,
-                )
-            )
+        Status handling is the same as `measure()`: overflow or uncalibrated
+        readings are stored as `math.nan`, and the status arrays show which
+        one it was.
 
-        if zy_range is not None:
-            messages.append(
-                format_configure_unverified(
-                    self.instrument_name,
-                    "zy_range",
-                    zy_range,
-                )
-            )
+        Manual-backed measurement path
+        ------------------------------
+        ``F0`` (DISPLAY A/B only) is sent once for the whole block. Each
+        measurement then uses:
 
-        return messages
+        - ``EX`` to execute one measurement/output cycle
+        - one VISA read of the returned data string
 
-    def close(self) -> None:
+        Important notes
+        ---------------
+        - Like `measure()`, this method does not send a recall code, so it does
+          not intentionally change which parameter is shown on DISPLAY C.
+        - The result arrays are allocated once up front. No per-point Python
+          result objects are kept.
+        - NumPy is required. Install with: ``pip install numpy``
+        """
+
+        if isinstance(count, bool) or not isinstance(count, int):
+            raise TypeError("count must be an int")
+        if count < 1:
+            raise ValueError("count must be at least 1")
+
+        numpy = _import_numpy("measure_many")
+
+        display_a_values = numpy.empty(count, dtype=numpy.float64)
+        display_b_values = numpy.empty(count, dtype=numpy.float64)
+        display_a_status = numpy.empty(count, dtype="U1")
+        display_b_status = numpy.empty(count, dtype="U1")
+        timestamps_s = numpy.empty(count, dtype=numpy.float64)
+
+        self._flush_configure_batch()
+        self._trace("BLOCK", "start count=%d", count)
+
+        for index in range(count):
+            display_a, display_b = self._retry_readback(
+                self._read_display_pair,
+                parameter_name="block measurement",
+            )
+            timestamps_s[index] = time.monotonic()
+            display_a_values[index] = _parse_numeric_measurement_field(
+                display_a,
+                display_name="DISPLAY A",
+            )
+            display_b_values[index] = _parse_numeric_measurement_field(
+                display_b,
+                display_name="DISPLAY B",
+            )
+            display_a_status[index] = display_a.status_code
+            display_b_status[index] = display_b.status_code
+
+        return HP4192AMeasurementBlock(
+            display_a=display_a_values,
+            display_b=display_b_values,
+            display_a_status=display_a_status,
+            display_b_status=display_b_status,
+            timestamps_s=timestamps_s,
+        )
+
+    def sweep(
+        self,
+        *,
+        start_hz: float,
+        stop_hz: float,
+        step_hz: float,
+    ) -> Iterator[HP4192ASweepPoint]:
+        """
+        Run the HP 4192A built-in linear frequency sweep and yield one
+        measurement per step.
+
+        Parameters
+        ----------
+        start_hz:
+            First sweep frequency in hertz.
+            Valid range: 5 Hz to 13 MHz.
+            Sent as raw command ``TF...EN`` in kHz.
+
+        stop_hz:
+            Last sweep frequency in hertz. Must be above `start_hz`.
+            Valid range: 5 Hz to 13 MHz.
+            Sent as raw command ``PF...EN`` in kHz.
+
+        step_hz:
+            Frequency step in hertz.
+            Valid range: 5 Hz to 13 MHz.
+            Sent as raw command ``SF...EN`` in kHz.
+
+        Yield value
+        -----------
+        One `HP4192ASweepPoint` per sweep step, in ascending frequency order:
+
+        - `frequency_hz`: spot frequency read back from DISPLAY C
+        - `display_a`, `display_b`: numeric DISPLAY A/B values, or `math.nan`
+          when the instrument reports overflow or uncalibrated
+        - `display_a_status`, `display_b_status`: the raw status codes
+
+        Manual-backed sweep path
+        ------------------------
+        The sweep limits are sent once:
+
+        - ``TF...EN``, ``PF...EN``, ``SF...EN`` from table 3-24
+        - ``G0`` from table 3-23 to select linear sweep, so a log sweep left
+          on the front panel does not change the steps
+        - ``W2`` from table 3-23 to enter manual sweep at the START value
+
+        Each step then uses:
+
+        - ``W3`` to step the spot frequency up (skipped for the first point)
+        - ``FRR``, ``EX`` and one VISA read, so DISPLAY C reports the
+          frequency the instrument actually measured at (``F1`` is sent only
+          when it is not already in effect)
+
+        This replaces one full `configure(frequency_hz=...)` plus `measure()`
+        per point with one step command and one snapshot.
+
+        Important notes
+        ---------------
+        - This is a generator. Nothing is sent until the first point is
+          requested, and stopping the iteration early stops the sweep.
+        - The display setup, circuit mode, bias, and oscillator level are not
+          changed. Set them with `configure()` before starting the sweep.
+        - After the sweep, the spot frequency is left at the last swept point.
+        """
+
+        start_hz = _validate_frequency_hz(start_hz)
+        stop_hz = _validate_frequency_hz(stop_hz)
+        step_hz = _require_real_number("step_hz", step_hz)
+        if not 5.0 <= step_hz <= 13_000_000.0:
+            raise ValueError("step_hz must be between 5 Hz and 13 MHz")
+
+        normalized_start_hz = _normalize_frequency_hz(start_hz)
+        normalized_stop_hz = _normalize_frequency_hz(stop_hz)
+        normalized_step_hz = _normalize_frequency_hz(step_hz)
+        if normalized_stop_hz <= normalized_start_hz:
+            raise ValueError("stop_hz must be above start_hz")
+
+        point_count = _count_sweep_points(
+            normalized_start_hz,
+            normalized_stop_hz,
+            normalized_step_hz,
+        )
+
+        self._trace(
+            "SWEEP",
+            "start=%s stop=%s step=%s points=%d",
+            _format_frequency_hz(normalized_start_hz),
+            _format_frequency_hz(normalized_stop_hz),
+            _format_frequency_hz(normalized_step_hz),
+            point_count,
+        )
+
+        self._flush_configure_batch()
+        self._write_commands(
+            [
+                _format_frequency_set_command("TF", start_hz),
+                _format_frequency_set_command("PF", stop_hz),
+                _format_frequency_set_command("SF", step_hz),
+                _SWEEP_LINEAR_CODE,
+                _SWEEP_MANUAL_CODE,
+            ]
+        )
+
+        for point_index in range(point_count):
+            if point_index > 0:
+                self._write_command(_SWEEP_STEP_UP_CODE)
+
+            yield self._retry_readback(
+                lambda: _parse_sweep_point(self._read_output_snapshot("FRR")),
+                parameter_name="sweep point",
+            )
+
+    def sweep_frequencies(self, frequencies_hz: Iterable[float]) -> HP4192AFrequencySweep:
+        """
+        Measure DISPLAY A/B at each frequency of an arbitrary list.
+
+        Parameters
+        ----------
+        frequencies_hz:
+            Frequencies in hertz, in the order to measure them, for example a
+            log-spaced grid or the frequencies of an earlier run. Each one
+            must be between 5 Hz and 13 MHz.
+
+        Return value
+        ------------
+        An `HP4192AFrequencySweep` with one array entry per frequency. Its
+        `frequency_hz` holds the frequencies as the instrument rounds them, so
+        the grid shows what was actually measured.
+
+        Manual-backed sweep path
+        ------------------------
+        All ``FR...EN`` commands are built and validated before the first
+        write. ``F0`` is sent once. Each point then costs one device write
+        (``FR...EN`` and ``EX`` concatenated, paragraph 3-124) and one read.
+        A point at the same rounded frequency as the one before sends only
+        ``EX``.
+
+        Important notes
+        ---------------
+        - Unlike `sweep()`, the frequency is not read back per point; DISPLAY
+          C is not part of the ``F0`` output.
+        - The display setup, circuit mode, bias, and oscillator level are not
+          changed. Set them with `configure()` before the sweep.
+        - After the sweep, the spot frequency is left at the last point.
+        - NumPy is required. Install with: ``pip install numpy``
+        """
+
+        commands, normalized_frequencies_hz = _build_spot_frequency_table(frequencies_hz)
+        count = len(commands)
+        if count == 0:
+            raise ValueError("frequencies_hz must not be empty")
+
+        numpy = _import_numpy("sweep_frequencies")
+
+        frequency_values = numpy.array(normalized_frequencies_hz, dtype=numpy.float64)
+        display_a_values = numpy.empty(count, dtype=numpy.float64)
+        display_b_values = numpy.empty(count, dtype=numpy.float64)
+        display_a_status = numpy.empty(count, dtype="U1")
+        display_b_status = numpy.empty(count, dtype="U1")
+        timestamps_s = numpy.empty(count, dtype=numpy.float64)
+
+        self._flush_configure_batch()
+        self._trace(
+            "SWEEP",
+            "software sweep points=%d first=%s last=%s",
+            count,
+            _format_frequency_hz(normalized_frequencies_hz[0]),
+            _format_frequency_hz(normalized_frequencies_hz[-1]),
+        )
+
+        previous_command: str | None = None
+        for index, command in enumerate(commands):
+            frequency_command = None if command == previous_command else command
+            display_a, display_b = self._retry_readback(
+                lambda: self._read_display_pair(frequency_command=frequency_command),
+                parameter_name="sweep point",
+            )
+            previous_command = command
+            timestamps_s[index] = time.monotonic()
+            display_a_values[index] = _parse_numeric_measurement_field(
+                display_a,
+                display_name="DISPLAY A",
+            )
+            display_b_values[index] = _parse_numeric_measurement_field(
+                display_b,
+                display_name="DISPLAY B",
+            )
+            display_a_status[index] = display_a.status_code
+            display_b_status[index] = display_b.status_code
+
+        return HP4192AFrequencySweep(
+            frequency_hz=frequency_values,
+            display_a=display_a_values,
+            display_b=display_b_values,
+            display_a_status=display_a_status,
+            display_b_status=display_b_status,
+            timestamps_s=timestamps_s,
+        )
+
+    def sweep_adaptive(
+        self,
+        *,
+        start_hz: float,
+        stop_hz: float,
+        initial_points: int = 21,
+        max_points: int = 201,
+        display_a_tol: float = 0.1,
+        display_b_tol: float = 5.0,
+    ) -> HP4192AFrequencySweep:
+        """
+        Sweep from `start_hz` to `stop_hz`, adding points only where the
+        readings change quickly.
+
+        Parameters
+        ----------
+        start_hz, stop_hz:
+            Sweep limits in hertz, 5 Hz to 13 MHz, `stop_hz` above `start_hz`.
+
+        initial_points:
+            Points of the first, log-spaced grid. At least 2.
+
+        max_points:
+            Point budget for the whole sweep, including the first grid.
+
+        display_a_tol:
+            Largest accepted relative change of DISPLAY A between neighbouring
+            points, for example ``0.1`` for 10 % of |Z|.
+
+        display_b_tol:
+            Largest accepted absolute change of DISPLAY B between neighbouring
+            points, in DISPLAY B units (degrees for ``phase_deg``).
+
+        Return value
+        ------------
+        An `HP4192AFrequencySweep` sorted by frequency.
+
+        How points are added
+        --------------------
+        After the first grid, each pass finds the neighbouring pairs whose
+        change exceeds a tolerance, or where one side is overflow or
+        uncalibrated. It measures the geometric midpoint of the worst pairs,
+        as many as the budget allows, in one `sweep_frequencies()` call. The
+        sweep ends when every pair is within tolerance (or cannot be split at
+        the 1 mHz resolution) or when `max_points` is reached.
+
+        With the defaults, a smooth |Z| curve stays near the first grid, while
+        a self-resonance collects points around the peak or dip.
+
+        Important notes
+        ---------------
+        - Set the display pair with `configure()` first. The tolerances apply
+          to whatever DISPLAY A and DISPLAY B show.
+        - NumPy is required. Install with: ``pip install numpy``
+        """
+
+        start_hz = _validate_frequency_hz(start_hz)
+        stop_hz = _validate_frequency_hz(stop_hz)
+        if stop_hz <= start_hz:
+            raise ValueError("stop_hz must be above start_hz")
+        if isinstance(initial_points, bool) or not isinstance(initial_points, int):
+            raise TypeError("initial_points must be an int")
+        if initial_points < 2:
+            raise ValueError("initial_points must be at least 2")
+        if isinstance(max_points, bool) or not isinstance(max_points, int):
+            raise TypeError("max_points must be an int")
+        if max_points < initial_points:
+            raise ValueError("max_points must be at least initial_points")
+        display_a_tol = _require_real_number("display_a_tol", display_a_tol)
+        display_b_tol = _require_real_number("display_b_tol", display_b_tol)
+        if display_a_tol <= 0.0 or display_b_tol <= 0.0:
+            raise ValueError("display_a_tol and display_b_tol must be positive")
+
+        numpy = _import_numpy("sweep_adaptive")
+
+        result = self.sweep_frequencies(numpy.geomspace(start_hz, stop_hz, initial_points))
+        rounds = 0
+        converged = False
+        while True:
+            budget = max_points - len(result)
+            new_frequencies_hz = _adaptive_sweep_midpoints(
+                numpy,
+                result,
+                display_a_tol=display_a_tol,
+                display_b_tol=display_b_tol,
+            )
+            if not new_frequencies_hz:
+                converged = True
+                break
+            if budget <= 0:
+                break
+
+            rounds += 1
+            refinement = self.sweep_frequencies(sorted(new_frequencies_hz[:budget]))
+            result = _merge_frequency_sweeps(numpy, result, refinement)
+
+        self._trace(
+            "SWEEP",
+            "adaptive sweep %s after %d refinement passes, points=%d",
+            "converged" if converged else "stopped at max_points",
+            rounds,
+            len(result),
+        )
+        return result
+
+    @staticmethod
+    def compile_sequence(
+        steps: Iterable[Mapping[str, object]],
+        *,
+        measure: bool = True,
+    ) -> HP4192ASequence:
+        """
+        Compile a recipe of `configure()` steps into a minimal command plan.
+
+        Each step is a mapping of `configure()` keywords (without `verify`),
+        such as the ``configure_kwargs`` of the self-test recipes. With
+        `measure=True` every step ends with one `measure()`.
+
+        The compiler follows the instrument state from step to step:
+
+        - program codes already in effect are dropped; the display pair is
+          treated as one setting, and ``I0`` also forgets the spot bias
+        - the codes left in a step are sent in one concatenated write
+        - a step settles and verifies only the settings it changes; a step
+          that changes nothing goes straight to `measure()`
+        - the trailing DISPLAY C recall of `configure()` is left out, since
+          `measure()` does not read DISPLAY C
+
+        The first step sends all of its codes, because the state before the
+        sequence is unknown. A compiled sequence can be run many times.
+        """
+
+        return _compile_sequence(steps, measure=measure)
+
+    def run_sequence(
+        self,
+        sequence: HP4192ASequence | Iterable[Mapping[str, object]],
+        *,
+        verify: HP4192AVerifyMode | None = None,
+    ) -> list[HP4192AMeasurement]:
+        """
+        Run a compiled sequence and return one measurement per measuring step.
+
+        `sequence` may also be an uncompiled recipe; it is compiled with
+        `compile_sequence()` first. `verify` works as in `configure()`, but
+        only the settings a step changes are read back. Confirmation lines
+        are printed per parameter, as `configure()` does.
+        """
+
+        if not isinstance(sequence, HP4192ASequence):
+            sequence = _compile_sequence(sequence, measure=True)
+        verify_mode = self._verify_mode if verify is None else _validate_verify_mode(verify)
+
+        self._flush_configure_batch()
+        measurements: list[HP4192AMeasurement] = []
+        for step in sequence.steps:
+            if step.commands:
+                self._apply_configure_request(
+                    step._request,
+                    verify_mode,
+                    batch=True,
+                    span_name="sequence step",
+                )
+
+            if step.measure:
+                measurements.append(self.measure())
+
+        return measurements
+
+    def _verify_configuration_with_retry(self, request: _ConfigureRequest) -> list[str]:
+        post_config_settle_s: float | None = None
+        if request.commands:
+            post_config_settle_s = self._settle_time(
+                _POST_CONFIG_SETTLE_CLASS,
+                _HP4192A_POST_CONFIG_SETTLE_S,
+            )
+            self._trace("SLEEP", "%.3f s after configure", post_config_settle_s)
+            self._sleep(post_config_settle_s, "_HP4192A_POST_CONFIG_SETTLE_S")
+
+        pending_checks = request.readback_checks()
+        passed_messages: dict[str, list[str]] = {}
+        failures: dict[str, Exception] = {}
+
+        for attempt_index in range(_HP4192A_VERIFY_ATTEMPTS):
+            attempt_number = attempt_index + 1
+            if not pending_checks:
+                break
+
+            self._trace(
+                "VERIFY",
+                "attempt %d/%d: %s",
+                attempt_number,
+                _HP4192A_VERIFY_ATTEMPTS,
+                ", ".join(pending_checks),
+            )
+
+            with self._profiled("verify", "configure"):
+                failures = self._verify_configuration_checks(
+                    request,
+                    pending_checks,
+                    passed_messages,
+                )
+            if attempt_index == 0 and post_config_settle_s is not None:
+                self._record_post_config_settle(post_config_settle_s, failures)
+            if not failures:
+                break
+
+            for check_name, exc in failures.items():
+                self._trace(
+                    "VERIFY",
+                    "attempt %d failed for %s (%s): %s",
+                    attempt_number,
+                    check_name,
+                    _classify_hp4192a_exception(exc),
+                    str(exc),
+                )
+            self._invalidate_output_state()
+            pending_checks = [name for name in pending_checks if name in failures]
+
+            if attempt_number >= _HP4192A_VERIFY_ATTEMPTS:
+                break
+
+            self._sleep(_HP4192A_VERIFY_RETRY_DELAY_S, "_HP4192A_VERIFY_RETRY_DELAY_S")
+
+        if failures:
+            last_exception = next(iter(failures.values()))
+            last_category = _classify_hp4192a_exception(last_exception)
+
+            if isinstance(last_exception, ConfigurationVerificationError):
+                raise ConfigurationVerificationError(
+                    "configure verification failed after "
+                    f"{_HP4192A_VERIFY_ATTEMPTS} attempts "
+                    f"({last_category}): {last_exception}"
+                ) from last_exception
+
+            raise RuntimeError(
+                "configure verification failed after "
+                f"{_HP4192A_VERIFY_ATTEMPTS} attempts "
+                f"({last_category}): {last_exception}"
+            ) from last_exception
+
+        messages: list[str] = []
+        for check_name in request.readback_checks():
+            messages.extend(passed_messages[check_name])
+        messages.extend(request.unverified_messages(self.instrument_name))
+        return messages
+
+    def _verify_configuration_checks(
+        self,
+        request: _ConfigureRequest,
+        check_names: list[str],
+        passed_messages: dict[str, list[str]],
+    ) -> dict[str, Exception]:
+        """
+        Run one verification pass over `check_names` only.
+
+        Checks that pass are stored in `passed_messages` and are not read back
+        again on a later attempt. The returned dict holds the checks that
+        failed, in check order.
+        """
+
+        checks_by_recall_code: dict[str, list[str]] = {}
+        for check_name in check_names:
+            recall_code = _VERIFY_CHECK_TO_RECALL_CODE[check_name]
+            checks_by_recall_code.setdefault(recall_code, []).append(check_name)
+
+        failures: dict[str, Exception] = {}
+        snapshots: dict[str, _OutputSnapshot] = {}
+        for recall_code, recall_checks in checks_by_recall_code.items():
+            try:
+                snapshots[recall_code] = self._read_recall_snapshot(
+                    recall_code,
+                    [_VERIFY_CHECK_TO_GET_PARAMETER[name] for name in recall_checks],
+                )
+            except Exception as exc:
+                for check_name in recall_checks:
+                    failures[check_name] = exc
+
+        for check_name in check_names:
+            snapshot = snapshots.get(_VERIFY_CHECK_TO_RECALL_CODE[check_name])
+            if snapshot is None:
+                continue
+            try:
+                passed_messages[check_name] = _verify_configuration_check(
+                    instrument_name=self.instrument_name,
+                    request=request,
+                    check_name=check_name,
+                    snapshot=snapshot,
+                )
+            except Exception as exc:
+                failures[check_name] = exc
+
+        return {name: failures[name] for name in check_names if name in failures}
+
+    def close(self) -> None:
         """
         Close the VISA connection to the instrument.
+
+        With adaptive timing and a `timing_profile_path`, the learned timing
+        profile is saved first.
         """
 
-        self._device.close()
+        self._invalidate_output_state()
+        try:
+            if self._settle_timing is not None and self._timing_profile_path is not None:
+                self.save_timing_profile()
+        finally:
+            self._device.close()
 
     def set_trace(
         self,
         *,
         enabled: bool = True,
         print_live: bool = False,
+        categories: Iterable[str] | None = _UNCHANGED,
+        stream: TextIO | None = _UNCHANGED,
     ) -> None:
         """
         Enable or disable raw HP 4192A I/O tracing.
+
+        `categories` limits tracing to those categories; `None` traces all.
+        Omitting it keeps the current filter.
+        `stream` also receives every event as one JSON line while it is
+        recorded, so runs longer than the in-memory buffer keep a full
+        record; `None` stops streaming and omitting it keeps the current
+        stream. Nothing is written while tracing is disabled.
         """
 
+        if categories is not _UNCHANGED:
+            self._trace_buffer.set_categories(categories)
+        if stream is not _UNCHANGED:
+            self._trace_buffer.set_stream(stream)
         self._trace_enabled = enabled
         self._trace_print_live = print_live if enabled else False
 
+    def set_verify(
+        self,
+        mode: HP4192AVerifyMode,
+        *,
+        sample_interval: int | None = None,
+    ) -> None:
+        """
+        Set the default `configure()` verification policy.
+
+        `mode` is ``"full"``, ``"sampled"``, or ``"none"``. `sample_interval`
+        sets N for ``"sampled"`` (verify every Nth sampled call, starting
+        with the first one after this call).
+        """
+
+        self._verify_mode = _validate_verify_mode(mode)
+        if sample_interval is not None:
+            self._verify_sample_interval = _validate_verify_sample_interval(
+                sample_interval
+            )
+        self._verify_sample_count = 0
+
+    def get_verification_counts(self) -> dict[str, int]:
+        """
+        Return how many `configure()` calls were verified and skipped.
+
+        Keys: `configure_calls`, `verified`, `skipped`.
+        """
+
+        return dict(self._verification_counts)
+
+    def clear_verification_counts(self) -> None:
+        """
+        Reset the `configure()` verification counters.
+        """
+
+        for key in self._verification_counts:
+            self._verification_counts[key] = 0
+        self._verify_sample_count = 0
+
+    def get_timing_profile(self) -> dict[str, dict[str, float]]:
+        """
+        Return the learned settle-time profile, one entry per command class.
+
+        Each entry has `settle_s` (the wait used next), `known_bad_s` (longest
+        wait that produced an empty or unparsable readback), `successes`, and
+        `failures`. Returns an empty dict when adaptive timing is off.
+        """
+
+        if self._settle_timing is None:
+            return {}
+        return self._settle_timing.as_dict()
+
+    def save_timing_profile(self, path: str | Path | None = None) -> None:
+        """
+        Save the learned settle-time profile for this VISA resource.
+
+        `path` defaults to the `timing_profile_path` given when the driver was
+        created. Profiles of other instruments in the same file are kept.
+        """
+
+        if self._settle_timing is None:
+            raise RuntimeError("adaptive timing is not enabled for this instrument")
+        if path is None:
+            path = self._timing_profile_path
+        if path is None:
+            raise ValueError("no timing profile path was given")
+        self._settle_timing.save(path, self._timing_profile_key())
+
+    @contextmanager
+    def profile(self) -> Iterator[HP4192AProfile]:
+        """
+        Time driver calls per phase inside a ``with`` block.
+
+        Yields an `HP4192AProfile` that collects wall time for device writes,
+        settle sleeps, device reads, parsing, and `configure()` verification,
+        per program code or settle constant. Print it after the block for a
+        report.
+
+        Example:
+            with meter.profile() as profile:
+                meter.configure(frequency_hz=1_000.0)
+                meter.measure()
+            print(profile)
+        """
+
+        previous_profile = self._profile
+        profile = HP4192AProfile()
+        self._profile = profile
+        profile.start()
+        try:
+            yield profile
+        finally:
+            profile.stop()
+            self._profile = previous_profile
+
     def clear_trace_log(self) -> None:
         """
         Clear the accumulated in-memory trace log.
         """
 
-        self._trace_entries.clear()
-        self._trace_started_at = time.monotonic()
+        self._trace_buffer.clear()
 
     def get_trace_log(self) -> list[str]:
         """
         Return the current in-memory trace log.
         """
 
-        return list(self._trace_entries)
+        return self._trace_buffer.lines()
+
+    def get_trace_events(self) -> list[HP4192ATraceEvent]:
+        """
+        Return the current in-memory trace log as structured events.
+
+        Besides the entries of `get_trace_log()` this includes the spans
+        (events with a `duration_s`) around `configure()`, its verification,
+        snapshots, readback attempts, writes, reads, and settle sleeps.
+        """
+
+        return self._trace_buffer.events()
+
+    def export_trace(
+        self,
+        path: str | Path,
+        *,
+        format: Literal["chrome", "jsonl"] = "chrome",
+    ) -> None:
+        """
+        Write the in-memory trace to `path` for a timeline viewer.
+
+        ``"chrome"`` writes Chrome trace event JSON, which Perfetto and
+        ``chrome://tracing`` open directly. ``"jsonl"`` writes one JSON object
+        per event.
+        """
+
+        if format == "chrome":
+            self._trace_buffer.write_chrome_trace(path, process_name=self.instrument_name)
+        elif format == "jsonl":
+            with open(path, "w", encoding="utf-8") as file:
+                self._trace_buffer.write_jsonl(file)
+        else:
+            raise ValueError(f"Unsupported trace export format: {format!r}")
 
     def format_trace_log(self) -> str:
         """
         Return the current in-memory trace log as plain text.
         """
 
-        if not self._trace_entries:
+        lines = self._trace_buffer.lines()
+        if not lines:
             return "(trace log is empty)"
-        return "\n".join(self._trace_entries)
+        dropped = self._trace_buffer.dropped
+        if dropped:
+            lines.insert(0, f"({dropped} earlier trace entries dropped)")
+        return "\n".join(lines)
+
+    def _should_verify_configuration(
+        self,
+        request: _ConfigureRequest,
+        verify_mode: HP4192AVerifyMode,
+    ) -> bool:
+        self._verification_counts["configure_calls"] += 1
+
+        if verify_mode == "full":
+            return True
+        if verify_mode == "none":
+            return False
+
+        # Count only sampled calls, so "full" or "none" calls in between (set
+        # per call or through set_verify()) do not shift the sampling phase.
+        sample_index = self._verify_sample_count
+        self._verify_sample_count += 1
+        if request.display_a is not None or request.circuit_mode is not None:
+            return True
+        return sample_index % self._verify_sample_interval == 0
+
+    def _read_parameters(self, parameter_names: Iterable[str]) -> _ParameterReadback:
+        parameters_by_recall_code: dict[str, list[str]] = {}
+        for name in parameter_names:
+            try:
+                recall_code = _GET_PARAMETER_TO_RECALL_CODE[name]
+            except KeyError as exc:
+                raise ValueError(f"Unsupported get() parameter: {name!r}") from exc
+            group = parameters_by_recall_code.setdefault(recall_code, [])
+            if name not in group:
+                group.append(name)
+
+        readback = _ParameterReadback(values={}, errors={}, snapshots={})
+
+        for recall_code, names in parameters_by_recall_code.items():
+            unchecked: list[_OutputSnapshot] = []
+            try:
+                snapshot = self._read_recall_snapshot(recall_code, names, unchecked=unchecked)
+            except Exception as exc:
+                if not unchecked:
+                    for name in names:
+                        readback.errors[name] = exc
+                    continue
+                # The output parsed but its DISPLAY C value did not check out.
+                # DISPLAY A/B still name the current display functions, so only
+                # the DISPLAY C parameters fail.
+                snapshot = unchecked[-1]
+                for name in names:
+                    if name in _DISPLAY_C_GET_PARAMETERS:
+                        readback.errors[name] = exc
+                names = [name for name in names if name not in _DISPLAY_C_GET_PARAMETERS]
+
+            readback.snapshots[recall_code] = snapshot
+            for name in names:
+                try:
+                    readback.values[name] = _extract_get_value(snapshot, name)
+                except Exception as exc:
+                    readback.errors[name] = exc
+
+        return readback
+
+    def _read_recall_snapshot(
+        self,
+        recall_code: str,
+        parameter_names: list[str],
+        *,
+        unchecked: list[_OutputSnapshot] | None = None,
+    ) -> _OutputSnapshot:
+        # `unchecked` collects every snapshot that parsed, including ones that
+        # then failed the DISPLAY C check.
+        def read() -> _OutputSnapshot:
+            snapshot = self._read_output_snapshot(recall_code)
+            if unchecked is not None:
+                unchecked.append(snapshot)
+            return _check_recall_snapshot(snapshot, parameter_names)
 
-    def _read_spot_frequency_hz(self) -> float:
         return self._retry_readback(
-            lambda: _parse_spot_frequency_hz(self._read_output_snapshot("FRR")),
-            parameter_name="spot frequency",
+            read,
+            parameter_name=_describe_recall_snapshot(recall_code, parameter_names),
         )
 
-    def _trace(self, category: str, message: str) -> None:
-        if not self._trace_enabled:
+    def _trace(
+        self,
+        category: str,
+        message: str,
+        *args: object,
+        code: str | None = None,
+    ) -> None:
+        # `message` is a %-style template; the text is built only when the
+        # trace is read, not on every I/O. Pass plain values, not exceptions:
+        # a stored exception keeps its traceback and frames alive.
+        if not self._trace_enabled or not self._trace_buffer.accepts(category):
             return
 
-        elapsed_s = time.monotonic() - self._trace_started_at
-        entry = f"[{elapsed_s:8.3f} s] {category:<8} {message}"
-        self._trace_entries.append(entry)
+        self._trace_buffer.record(category, message, args, code=code)
 
         if self._trace_print_live:
-            print(entry)
+            print(self._trace_buffer.last())
 
-    def _retry_readback(self, reader: Callable[[], float], *, parameter_name: str) -> float:
+    def _retry_readback(self, reader: Callable[[], _T], *, parameter_name: str) -> _T:
         last_exception: Exception | None = None
 
         for attempt_index in range(_HP4192A_READBACK_ATTEMPTS):
             attempt_number = attempt_index + 1
             self._trace(
                 "READTRY",
-                f"{parameter_name}: attempt {attempt_number}/{_HP4192A_READBACK_ATTEMPTS}",
+                "%s: attempt %d/%d",
+                parameter_name,
+                attempt_number,
+                _HP4192A_READBACK_ATTEMPTS,
             )
             try:
-                return reader()
+                with self._trace_span("READTRY", "%s", parameter_name):
+                    value = reader()
             except Exception as exc:
                 last_exception = exc
+                self._finish_settle(exc)
+                # A wrong-state readback means the remembered output format or
+                # recall code cannot be trusted, so the retry re-sends both.
+                self._invalidate_output_state()
                 self._trace(
                     "READTRY",
-                    f"{parameter_name}: attempt {attempt_number} failed ({_classify_hp4192a_exception(exc)}): {exc}",
+                    "%s: attempt %d failed (%s): %s",
+                    parameter_name,
+                    attempt_number,
+                    _classify_hp4192a_exception(exc),
+                    str(exc),
                 )
                 if attempt_number >= _HP4192A_READBACK_ATTEMPTS:
                     break
-                time.sleep(_HP4192A_READBACK_RETRY_DELAY_S)
+                self._sleep(_HP4192A_READBACK_RETRY_DELAY_S, "_HP4192A_READBACK_RETRY_DELAY_S")
+            else:
+                self._finish_settle(None)
+                return value
 
         raise RuntimeError(
             f"{parameter_name} readback failed after {_HP4192A_READBACK_ATTEMPTS} attempts: "
             f"{last_exception}"
         ) from last_exception
 
-    def _read_display_c_number(
-        self,
-        recall_code: str,
-        *,
-        expected_unit_codes: set[str],
-        parameter_name: str,
-    ) -> float:
-        return self._retry_readback(
-            lambda: _parse_display_c_number(
-                self._read_output_snapshot(recall_code).display_c,
-                expected_unit_codes=expected_unit_codes,
-                parameter_name=parameter_name,
-            ),
-            parameter_name=parameter_name,
-        )
-
     def _read_output_snapshot(self, recall_code: str | None = None) -> _OutputSnapshot:
         """
         Read one DISPLAY A/B/C output snapshot.
@@ -1299,27 +2455,640 @@ class HP4192A(Instrument):
         Important:
         - Do not send VISA device clear here. On the real instrument in this lab
           setup, device clear reset the frequency to 100 kHz.
+        - ``F1`` and the recall code are skipped when the driver already sent
+          the same code and nothing since then can have changed it.
+        """
+
+        self._trace("SNAPSHOT", "start recall=%s", recall_code or "-", code=recall_code)
+        try:
+            with self._trace_span("SNAPSHOT", "recall=%s", recall_code or "-", code=recall_code):
+                self._select_output_format("F1")
+                if recall_code is not None:
+                    self._select_display_c_recall(recall_code)
+
+                raw = self._trigger_and_read(learn_success=recall_code is not None)
+                with self._profiled("parse", "F1"):
+                    return _parse_output_snapshot(raw)
+        except Exception:
+            self._invalidate_output_state()
+            raise
+
+    def _read_display_pair(
+        self,
+        *,
+        settle_s: float | None = None,
+        frequency_command: str | None = None,
+        keep_f1: bool = False,
+    ) -> tuple[_DisplayField, _DisplayField]:
+        """
+        Read one DISPLAY A/B pair in the reduced ``F0`` output format.
+
+        Manual basis:
+        - Table 3-23: ``F0`` selects DISPLAY A/B output without DISPLAY C.
+
+        ``F0`` is only sent when it is not already in effect, so a measurement
+        loop costs one ``EX`` and one read per point. A `frequency_command`
+        goes out in the same write as ``EX``.
+
+        With `keep_f1`, a known active ``F1`` is kept and only DISPLAY A/B of
+        its output are parsed. A single read after a verified `configure()`
+        then skips ``F0`` here and ``F1`` at the next verification: two
+        writes saved for one DISPLAY C field read.
+        """
+
+        try:
+            if keep_f1 and self._output_format_code == "F1":
+                format_code = "F1"
+                self._trace("SKIP", "F0 (F1 active, DISPLAY C ignored)", code="F0")
+            else:
+                format_code = "F0"
+                self._select_output_format("F0")
+            raw = self._trigger_and_read(settle_s=settle_s, frequency_command=frequency_command)
+            with self._profiled("parse", format_code):
+                return _parse_display_pair(raw, expect_display_c=format_code == "F1")
+        except Exception:
+            self._invalidate_output_state()
+            raise
+
+    def _trigger_and_read(
+        self,
+        *,
+        settle_s: float | None = None,
+        frequency_command: str | None = None,
+        learn_success: bool = False,
+    ) -> str:
+        settle_class: str | None = None
+        if settle_s is None:
+            if frequency_command is not None:
+                settle_class = "trigger_after_frequency_change"
+            else:
+                settle_class = self._trigger_settle_class()
+            settle_s = self._settle_time(settle_class, _HP4192A_TRIGGER_SETTLE_S)
+        settle_source = "trigger_settle_s" if settle_class is None else "_HP4192A_TRIGGER_SETTLE_S"
+        try:
+            if frequency_command is None:
+                self._write_command("EX", settle_s=settle_s, settle_source=settle_source)
+            else:
+                self._write_commands(
+                    [frequency_command, "EX"],
+                    batch=True,
+                    settle_s=settle_s,
+                    settle_source=settle_source,
+                )
+            if self._settle_timing is not None and settle_class is not None:
+                self._pending_settle = (settle_class, settle_s, learn_success)
+
+            try:
+                with self._profiled("read", "EX"), self._trace_span("READ", "", code="EX"):
+                    raw = self._device.read().strip()
+            except Exception as exc:
+                self._trace_io_error("READ", exc, code="EX")
+                raise
+            self._trace("READ", "%s", raw or "<empty>", code="EX")
+            if not raw:
+                raise RuntimeError("instrument returned no data")
+        except Exception:
+            self._invalidate_output_state()
+            raise
+
+        return raw
+
+    def _select_output_format(self, format_code: str) -> None:
+        if self._output_format_code == format_code:
+            self._trace("SKIP", "%s already active", format_code, code=format_code)
+            return
+        self._write_command(format_code)
+
+    def _select_display_c_recall(self, recall_code: str) -> None:
+        if self._display_c_recall_code == recall_code:
+            self._trace("SKIP", "%s already active", recall_code, code=recall_code)
+            return
+        self._write_command(recall_code)
+
+    def _track_output_state(self, command: str) -> None:
+        if command in _OUTPUT_FORMAT_CODES:
+            self._output_format_code = command
+        elif command in _DISPLAY_C_RECALL_CODES:
+            self._display_c_recall_code = command
+        elif command != "EX":
+            # Parameter entry and sweep steps can move DISPLAY C to another
+            # parameter, so only `EX` is trusted to leave the recall in place.
+            self._display_c_recall_code = None
+
+    def _track_settle_state(self, command: str) -> None:
+        if command == "EX":
+            self._frequency_changed_since_trigger = False
+        elif command in {_SWEEP_MANUAL_CODE, _SWEEP_STEP_UP_CODE} or (
+            command.startswith("FR") and command.endswith("EN")
+        ):
+            self._frequency_changed_since_trigger = True
+        elif command in {"V0", "V1"}:
+            self._average_enabled = command == "V1"
+        elif command in {"H0", "H1"}:
+            self._high_speed_enabled = command == "H1"
+
+    def _trigger_settle_class(self) -> str:
+        if self._frequency_changed_since_trigger:
+            return "trigger_after_frequency_change"
+        if self._high_speed_enabled:
+            return "trigger_high_speed"
+        if self._average_enabled:
+            return "trigger_average"
+        if self._high_speed_enabled is False and self._average_enabled is False:
+            return "trigger_normal"
+        return "trigger_unknown_mode"
+
+    def _settle_time(self, settle_class: str, fixed_settle_s: float) -> float:
+        if self._settle_timing is None:
+            return fixed_settle_s
+        return self._settle_timing.settle_s(settle_class)
+
+    def _finish_settle(self, exc: Exception | None) -> None:
+        pending_settle = self._pending_settle
+        self._pending_settle = None
+        if pending_settle is None or self._settle_timing is None:
+            return
+
+        settle_class, settle_s, learn_success = pending_settle
+        if exc is None:
+            if learn_success:
+                self._settle_timing.record_success(settle_class, settle_s)
+        elif _classify_hp4192a_exception(exc) == "communication/readback":
+            self._settle_timing.record_failure(settle_class, settle_s)
+            self._trace(
+                "TIMING",
+                "%s backed off to %.3f s",
+                settle_class,
+                self._settle_timing.settle_s(settle_class),
+            )
+
+    def _record_post_config_settle(
+        self,
+        settle_s: float,
+        failures: dict[str, Exception],
+    ) -> None:
+        if self._settle_timing is None:
+            return
+
+        # A too-short post-configure pause shows up as stale state as well as
+        # empty readback, so both count against it.
+        categories = {_classify_hp4192a_exception(exc) for exc in failures.values()}
+        if categories & {"communication/readback", "state mismatch"}:
+            self._settle_timing.record_failure(_POST_CONFIG_SETTLE_CLASS, settle_s)
+            self._trace(
+                "TIMING",
+                "%s backed off to %.3f s",
+                _POST_CONFIG_SETTLE_CLASS,
+                self._settle_timing.settle_s(_POST_CONFIG_SETTLE_CLASS),
+            )
+        else:
+            self._settle_timing.record_success(_POST_CONFIG_SETTLE_CLASS, settle_s)
+
+    def _timing_profile_key(self) -> str:
+        return self.connection_info.resource_name
+
+    def _invalidate_output_state(self) -> None:
+        self._output_format_code = None
+        self._display_c_recall_code = None
+
+    def _write_commands(
+        self,
+        commands: list[str],
+        *,
+        batch: bool | None = None,
+        settle_s: float = _HP4192A_COMMAND_DELAY_S,
+        settle_source: str = "_HP4192A_COMMAND_DELAY_S",
+    ) -> None:
         """
+        Send several program codes, batched into one device write when
+        `batch_writes` is enabled or `batch` is true. `settle_s` is the pause
+        after the last code.
 
-        self._trace("SNAPSHOT", f"start recall={recall_code or '-'}")
-        self._write_command("F1")
-        if recall_code is not None:
-            self._write_command(recall_code)
-        self._write_command("EX", settle_s=_HP4192A_TRIGGER_SETTLE_S)
+        Manual basis:
+        - Paragraph 3-124: HP-IB program codes may be concatenated in one
+          program string, for example ``FR1ENC2A1B1``.
+        """
 
-        raw = self._device.read().strip()
-        self._trace("READ", raw or "<empty>")
-        if not raw:
-            raise RuntimeError("instrument returned no data")
+        if batch is None:
+            batch = self._batch_writes
+        if not batch or len(commands) < 2:
+            last_index = len(commands) - 1
+            for index, command in enumerate(commands):
+                if index == last_index:
+                    self._write_command(command, settle_s=settle_s, settle_source=settle_source)
+                else:
+                    self._write_command(command)
+            return
 
-        return _parse_output_snapshot(raw)
+        for command in commands:
+            self._trace("WRITE", "%s", command, code=_program_code(command))
+        message = "".join(commands)
+        self._trace("BATCH", "%d codes in one write: %s", len(commands), message)
+        try:
+            with self._profiled("write", "batch"), self._trace_span("WRITE", "%s", message):
+                self._device.write(message)
+        except Exception as exc:
+            self._trace_io_error("WRITE", exc)
+            self._invalidate_output_state()
+            raise
+        for command in commands:
+            self._track_output_state(command)
+            self._track_settle_state(command)
+        if settle_s > 0.0:
+            self._trace("SLEEP", "%.3f s after batch", settle_s)
+            self._sleep(settle_s, settle_source)
 
-    def _write_command(self, command: str, *, settle_s: float = _HP4192A_COMMAND_DELAY_S) -> None:
-        self._trace("WRITE", command)
-        self._device.write(command)
+    def _write_command(
+        self,
+        command: str,
+        *,
+        settle_s: float = _HP4192A_COMMAND_DELAY_S,
+        settle_source: str = "_HP4192A_COMMAND_DELAY_S",
+    ) -> None:
+        code = _program_code(command)
+        self._trace("WRITE", "%s", command, code=code)
+        try:
+            with self._profiled("write", code), self._trace_span("WRITE", "%s", command, code=code):
+                self._device.write(command)
+        except Exception as exc:
+            self._trace_io_error("WRITE", exc, code=code)
+            self._invalidate_output_state()
+            raise
+        self._track_output_state(command)
+        self._track_settle_state(command)
         if settle_s > 0.0:
-            self._trace("SLEEP", f"{settle_s:.3f} s after {command}")
-            time.sleep(settle_s)
+            self._trace("SLEEP", "%.3f s after %s", settle_s, command, code=code)
+            self._sleep(settle_s, settle_source)
+
+    def _trace_io_error(self, category: str, exc: Exception, *, code: str | None = None) -> None:
+        # Follows the failed WRITE/READ span, so a replay built from the
+        # trace raises the same error at the same point.
+        self._trace(category, "<error %s: %s>", type(exc).__name__, str(exc), code=code)
+
+    def _sleep(self, seconds: float, source: str) -> None:
+        with self._profiled("settle", source), self._trace_span("SLEEP", "%s", source):
+            time.sleep(seconds)
+
+    def _profiled(self, phase: str, code: str) -> ContextManager[None]:
+        if self._profile is None:
+            return _NO_CONTEXT
+        return self._profile.phase(phase, code)
+
+    def _trace_span(
+        self,
+        category: str,
+        message: str,
+        *args: object,
+        code: str | None = None,
+    ) -> ContextManager[None]:
+        if not self._trace_enabled or not self._trace_buffer.accepts(category):
+            return _NO_CONTEXT
+        return self._trace_buffer.span(category, message, args, code=code)
+
+
+_NO_CONTEXT = nullcontext()
+
+
+def _program_code(command: str) -> str:
+    # Parameter entry carries a value (`FR12.345EN`); trace and profile it by
+    # its code.
+    if len(command) > 4 and command.endswith("EN"):
+        return f"{command[:2]}...EN"
+    return command
+
+
+def _open_device(
+    resource_name: str,
+    *,
+    timeout_ms: int,
+    transport: HP4192ATransport,
+) -> VisaDevice | SocketDevice | Vxi11Device:
+    if transport == "visa":
+        return VisaDevice(resource_name, timeout_ms=timeout_ms)
+    if transport == "socket":
+        return SocketDevice(resource_name, timeout_ms=timeout_ms)
+    if transport == "vxi11":
+        return Vxi11Device(resource_name, timeout_ms=timeout_ms)
+    raise ValueError(
+        f"Unsupported transport {transport!r}. Supported values: visa, socket, vxi11"
+    )
+
+
+def _build_configure_request(
+    *,
+    frequency_hz: float | None,
+    bias_voltage_v: float | None,
+    osc_level_v: float | None,
+    bias_enabled: bool | None,
+    trigger_mode: str | None,
+    measurement_mode: str | None,
+    zy_range: str | None,
+    circuit_mode: str | None,
+    display_a: str | None,
+    display_b: str | None,
+) -> _ConfigureRequest:
+    request = _ConfigureRequest()
+    commands = request.commands
+    effective_circuit_mode = circuit_mode
+
+    if frequency_hz is not None:
+        request.frequency_hz = _validate_frequency_hz(frequency_hz)
+        request.expected_frequency_hz = _normalize_frequency_hz(request.frequency_hz)
+        commands.append(_format_spot_frequency_set_command(request.frequency_hz))
+        request.display_c_recall_code = "FRR"
+
+    if bias_voltage_v is not None:
+        request.bias_voltage_v = _validate_bias_voltage_v(bias_voltage_v)
+        request.expected_bias_voltage_v = _normalize_bias_voltage_v(request.bias_voltage_v)
+        commands.append(_format_spot_bias_set_command(request.bias_voltage_v))
+        request.display_c_recall_code = "BIR"
+
+    if osc_level_v is not None:
+        request.osc_level_v = _validate_osc_level_v(osc_level_v)
+        request.expected_osc_level_v = _normalize_osc_level_v(request.osc_level_v)
+        commands.append(_format_osc_level_set_command(request.osc_level_v))
+        request.display_c_recall_code = "OLR"
+
+    if bias_enabled is not None:
+        request.bias_enabled = _validate_bool_parameter("bias_enabled", bias_enabled)
+        if request.bias_enabled is False and request.expected_bias_voltage_v is not None:
+            request.expected_bias_voltage_v = 0.0
+
+    if trigger_mode is not None:
+        commands.append(_get_trigger_mode_code(trigger_mode))
+        request.trigger_mode = trigger_mode
+
+    if measurement_mode is not None:
+        commands.extend(_get_measurement_mode_codes(measurement_mode))
+        request.measurement_mode = measurement_mode
+
+    if zy_range is not None:
+        commands.append(_get_zy_range_code(zy_range))
+        request.zy_range = zy_range
+
+    if display_a is not None or display_b is not None:
+        if display_a is None or display_b is None:
+            raise ValueError("display_a and display_b must be provided together")
+
+        implied_circuit_mode = _IMPLIED_CIRCUIT_MODE_FOR_DISPLAY_A.get(display_a)
+        if implied_circuit_mode is not None:
+            if circuit_mode is None:
+                effective_circuit_mode = implied_circuit_mode
+            elif circuit_mode != implied_circuit_mode:
+                raise ValueError(
+                    f"display_a={display_a!r} requires circuit_mode={implied_circuit_mode!r}"
+                )
+
+        if display_a in {"inductance", "capacitance"} and circuit_mode is None:
+            raise ValueError(
+                "display_a='inductance' or display_a='capacitance' "
+                "require circuit_mode to be set explicitly"
+            )
+
+    if effective_circuit_mode is not None:
+        commands.append(_get_circuit_mode_code(effective_circuit_mode))
+        request.circuit_mode = effective_circuit_mode
+
+    if display_a is not None and display_b is not None:
+        commands.extend(_get_display_pair_codes(display_a, display_b))
+        request.display_a = display_a
+        request.display_b = display_b
+
+    if request.bias_enabled is not None:
+        commands.append(_get_bias_enabled_code(request.bias_enabled))
+
+    return request
+
+
+_CONFIGURE_PARAMETERS = (
+    "frequency_hz",
+    "bias_voltage_v",
+    "osc_level_v",
+    "bias_enabled",
+    "trigger_mode",
+    "measurement_mode",
+    "zy_range",
+    "circuit_mode",
+    "display_a",
+    "display_b",
+)
+
+# Request fields and the command settings (see `_command_setting`) whose
+# change makes them part of a compiled sequence step.
+_REQUEST_FIELD_SETTINGS: dict[str, tuple[str, ...]] = {
+    "frequency_hz": ("FR",),
+    "bias_voltage_v": ("BI",),
+    "osc_level_v": ("OL",),
+    "bias_enabled": ("I",),
+    "trigger_mode": ("T",),
+    "measurement_mode": ("V", "H"),
+    "zy_range": ("R",),
+    "circuit_mode": ("C",),
+    "display_a": ("display",),
+    "display_b": ("display",),
+}
+
+
+def _compile_sequence(
+    steps: Iterable[Mapping[str, object]],
+    *,
+    measure: bool,
+) -> HP4192ASequence:
+    state: dict[str, object] = {}
+    compiled_steps: list[HP4192ASequenceStep] = []
+
+    for step in steps:
+        configure_kwargs = dict(step)
+        unknown = sorted(set(configure_kwargs) - set(_CONFIGURE_PARAMETERS))
+        if unknown:
+            raise ValueError(
+                f"Unsupported sequence step keywords: {unknown}. "
+                f"Supported: {list(_CONFIGURE_PARAMETERS)}"
+            )
+        request = _build_configure_request(
+            **{name: configure_kwargs.get(name) for name in _CONFIGURE_PARAMETERS}
+        )
+
+        display_codes: tuple[str, ...] = ()
+        if request.display_a is not None and request.display_b is not None:
+            display_codes = _get_display_pair_codes(request.display_a, request.display_b)
+
+        # The display pair is one setting: a DISPLAY B code means different
+        # functions under different DISPLAY A codes, so both go out together.
+        display_changed = bool(display_codes) and state.get("display") != display_codes
+
+        commands: list[str] = []
+        skipped_commands: list[str] = []
+        changed_settings: set[str] = set()
+        for command in request.commands:
+            if command in display_codes:
+                setting, value = "display", display_codes
+                changed = display_changed
+            else:
+                setting, value = _command_setting(command), command
+                changed = state.get(setting) != value
+
+            if not changed:
+                skipped_commands.append(command)
+                continue
+
+            commands.append(command)
+            changed_settings.add(setting)
+            state[setting] = value
+            if command == _get_bias_enabled_code(False):
+                # `I0` zeroes the spot bias, so a later bias value must be
+                # sent again.
+                state.pop("BI", None)
+
+        unchanged_fields = {
+            name: None
+            for name, settings in _REQUEST_FIELD_SETTINGS.items()
+            if not changed_settings.intersection(settings)
+        }
+        reduced_request = replace(
+            request,
+            commands=commands,
+            display_c_recall_code=None,
+            **unchanged_fields,
+        )
+        compiled_steps.append(
+            HP4192ASequenceStep(
+                configure_kwargs=configure_kwargs,
+                commands=commands,
+                skipped_commands=skipped_commands,
+                readback_checks=reduced_request.readback_checks(),
+                measure=measure,
+                _request=reduced_request,
+            )
+        )
+
+    return HP4192ASequence(steps=compiled_steps)
+
+
+def _command_setting(command: str) -> str:
+    # Parameter entry (`FR...EN`) is keyed by its two-letter code; the other
+    # configure codes by their letter (`C2` -> `C`).
+    if command.endswith("EN"):
+        return command[:2]
+    return command[0]
+
+
+def _verify_configuration_check(
+    *,
+    instrument_name: str,
+    request: _ConfigureRequest,
+    check_name: str,
+    snapshot: _OutputSnapshot,
+) -> list[str]:
+    if check_name == "frequency_hz":
+        actual_frequency_hz = _parse_spot_frequency_hz(snapshot)
+        return [
+            _verify_numeric_setting(
+                instrument_name=instrument_name,
+                parameter_name="frequency_hz",
+                requested_value=request.frequency_hz,
+                expected_value=request.expected_frequency_hz,
+                actual_value=actual_frequency_hz,
+                requested_text=_format_frequency_hz(request.frequency_hz),
+                actual_text=_format_frequency_hz(actual_frequency_hz),
+                absolute_tolerance=1e-6,
+            )
+        ]
+
+    if check_name == "bias_voltage_v":
+        actual_bias_voltage_v = _extract_get_value(snapshot, "bias_voltage_v")
+        return [
+            _verify_numeric_setting(
+                instrument_name=instrument_name,
+                parameter_name="bias_voltage_v",
+                requested_value=request.bias_voltage_v,
+                expected_value=request.expected_bias_voltage_v,
+                actual_value=actual_bias_voltage_v,
+                requested_text=f"{_trim_zeros(request.bias_voltage_v)} V",
+                actual_text=f"{_trim_zeros(actual_bias_voltage_v)} V",
+                absolute_tolerance=1e-9,
+            )
+        ]
+
+    if check_name == "osc_level_v":
+        actual_osc_level_v = _extract_get_value(snapshot, "osc_level_v")
+        return [
+            _verify_numeric_setting(
+                instrument_name=instrument_name,
+                parameter_name="osc_level_v",
+                requested_value=request.osc_level_v,
+                expected_value=request.expected_osc_level_v,
+                actual_value=actual_osc_level_v,
+                requested_text=f"{_trim_zeros(request.osc_level_v)} V",
+                actual_text=f"{_trim_zeros(actual_osc_level_v)} V",
+                absolute_tolerance=1e-9,
+            )
+        ]
+
+    if check_name == "display":
+        actual_display_a_name = _DISPLAY_A_CODE_TO_NAME.get(
+            snapshot.display_a.function_code,
+            f"unknown ({snapshot.display_a.function_code})",
+        )
+        actual_display_b_name = _DISPLAY_B_CODE_TO_NAME.get(
+            snapshot.display_b.function_code,
+            f"unknown ({snapshot.display_b.function_code})",
+        )
+        return [
+            _verify_display_setting(
+                instrument_name=instrument_name,
+                parameter_name="display_a",
+                requested_value=request.display_a,
+                actual_code=snapshot.display_a.function_code,
+                allowed_codes=_DISPLAY_A_REQUEST_TO_CODES[request.display_a],
+                actual_text=actual_display_a_name,
+            ),
+            _verify_display_setting(
+                instrument_name=instrument_name,
+                parameter_name="display_b",
+                requested_value=request.display_b,
+                actual_code=snapshot.display_b.function_code,
+                allowed_codes=_DISPLAY_B_REQUEST_TO_CODES[request.display_b],
+                actual_text=actual_display_b_name,
+            ),
+        ]
+
+    if check_name == "circuit_mode":
+        requested_circuit_mode = request.circuit_mode
+        actual_circuit_mode = _DISPLAY_A_CODE_TO_CIRCUIT_MODE.get(
+            snapshot.display_a.function_code
+        )
+        if actual_circuit_mode is None:
+            return [
+                format_configure_unverified(
+                    instrument_name,
+                    "circuit_mode",
+                    requested_circuit_mode,
+                )
+            ]
+        if requested_circuit_mode == "auto":
+            return [
+                format_configure_adjusted(
+                    instrument_name,
+                    "circuit_mode",
+                    "auto",
+                    actual_circuit_mode,
+                )
+            ]
+        if actual_circuit_mode != requested_circuit_mode:
+            raise ConfigurationVerificationError(
+                "circuit_mode verification failed: "
+                f"requested {requested_circuit_mode!r}, instrument reports {actual_circuit_mode!r}"
+            )
+        return [
+            format_configure_success(
+                instrument_name,
+                "circuit_mode",
+                actual_circuit_mode,
+            )
+        ]
+
+    raise ValueError(f"Unknown configure verification check: {check_name!r}")
 
 
 def _validate_frequency_hz(value: float) -> float:
@@ -1343,6 +3112,28 @@ def _validate_osc_level_v(value: float) -> float:
     return numeric_value
 
 
+def _default_settle_times() -> dict[str, float]:
+    defaults = {name: _HP4192A_TRIGGER_SETTLE_S for name in _TRIGGER_SETTLE_CLASSES}
+    defaults[_POST_CONFIG_SETTLE_CLASS] = _HP4192A_POST_CONFIG_SETTLE_S
+    return defaults
+
+
+def _validate_verify_mode(value: str) -> HP4192AVerifyMode:
+    if value not in {"full", "sampled", "none"}:
+        raise ValueError(
+            f"Unsupported verify mode {value!r}. Supported values: full, none, sampled"
+        )
+    return value
+
+
+def _validate_verify_sample_interval(value: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError("verify_sample_interval must be an int")
+    if value < 1:
+        raise ValueError("verify_sample_interval must be at least 1")
+    return value
+
+
 def _validate_bool_parameter(parameter_name: str, value: bool) -> bool:
     if not isinstance(value, bool):
         raise TypeError(f"{parameter_name} must be bool")
@@ -1442,6 +3233,121 @@ def _parse_output_snapshot(raw: str) -> _OutputSnapshot:
     )
 
 
+def _parse_display_pair(
+    raw: str,
+    *,
+    expect_display_c: bool = False,
+) -> tuple[_DisplayField, _DisplayField]:
+    # Hot path for ``F0`` output such as ``NZFN+0012.34E+00,NTDN-045.0E+00``.
+    # Each field is a fixed 4-character header followed by the value, so the
+    # fields are sliced directly instead of going through a regex split. With
+    # `expect_display_c` (``F1`` output) the trailing DISPLAY C field is
+    # ignored; without it, a DISPLAY C field means the instrument is not in
+    # the ``F0`` state the driver selected, and the read is rejected.
+    field_a, separator, rest = raw.partition(",")
+    field_b, extra_separator, _ = rest.partition(",")
+    field_b = field_b.strip()
+    if not separator or not field_b:
+        raise RuntimeError(f"unexpected output: {raw!r}")
+    if extra_separator and not expect_display_c:
+        raise RuntimeError(f"unexpected output: DISPLAY C field in F0 output {raw!r}")
+
+    return (
+        _parse_fixed_display_field(
+            field_a.strip(),
+            display_name="DISPLAY A",
+            known_function_codes=_KNOWN_DISPLAY_A_FUNCTION_CODES,
+        ),
+        _parse_fixed_display_field(
+            field_b,
+            display_name="DISPLAY B",
+            known_function_codes=_KNOWN_DISPLAY_B_FUNCTION_CODES,
+        ),
+    )
+
+
+def _parse_fixed_display_field(
+    field: str,
+    *,
+    display_name: str,
+    known_function_codes: set[str],
+) -> _DisplayField:
+    if len(field) >= 5 and field[1:3] in known_function_codes:
+        return _DisplayField(
+            status_code=field[0],
+            function_code=field[1:3],
+            deviation_mode_code=field[3],
+            value_text=field[4:],
+        )
+    # Unusual header layouts are handled by the general field parser.
+    return _parse_display_field(field, display_name=display_name)
+
+
+def _import_numpy(method_name: str | None = None):
+    try:
+        import numpy
+    except ImportError as exc:
+        needed_for = (
+            f"HP4192A.{method_name}()" if method_name else "HP4192A block reads and sweeps"
+        )
+        raise ImportError(
+            f"numpy is required for {needed_for}. Install with: pip install numpy"
+        ) from exc
+    return numpy
+
+
+def _check_recall_snapshot(snapshot: _OutputSnapshot, parameter_names: list[str]) -> _OutputSnapshot:
+    # Parse the DISPLAY C number inside the retry loop so a snapshot that comes
+    # back with a stale recall is read again instead of failing the caller.
+    for name in parameter_names:
+        if name in _DISPLAY_C_GET_PARAMETERS:
+            _extract_get_value(snapshot, name)
+    return snapshot
+
+
+def _describe_recall_snapshot(recall_code: str, parameter_names: list[str]) -> str:
+    if recall_code == "BIR":
+        return "spot bias"
+    if recall_code == "OLR":
+        return "oscillator level"
+    if "frequency_hz" in parameter_names:
+        return "spot frequency"
+    return "display functions"
+
+
+def _extract_get_value(snapshot: _OutputSnapshot, parameter_name: str) -> float | str:
+    if parameter_name == "frequency_hz":
+        return _parse_spot_frequency_hz(snapshot)
+
+    if parameter_name == "bias_voltage_v":
+        return _parse_display_c_number(
+            snapshot.display_c,
+            expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
+            parameter_name="spot bias",
+        )
+
+    if parameter_name == "osc_level_v":
+        return _parse_display_c_number(
+            snapshot.display_c,
+            expected_unit_codes=_DISPLAY_C_VOLTAGE_UNIT_CODES,
+            parameter_name="oscillator level",
+        )
+
+    if parameter_name == "display_a":
+        return _get_display_a_get_value(snapshot.display_a.function_code)
+
+    if parameter_name == "display_b":
+        return _get_display_b_get_value(snapshot.display_b.function_code)
+
+    if parameter_name == "circuit_mode":
+        circuit_mode = _DISPLAY_A_CODE_TO_CIRCUIT_MODE.get(snapshot.display_a.function_code)
+        if circuit_mode is None:
+            raise RuntimeError("current DISPLAY A function does not expose circuit_mode")
+        return circuit_mode
+
+    raise ValueError(f"Unsupported get() parameter: {parameter_name!r}")
+
+
 def _get_display_a_get_value(function_code: str) -> str:
     try:
         return _DISPLAY_A_CODE_TO_GET_VALUE[function_code]
@@ -1626,6 +3532,12 @@ def _try_parse_float(value_text: str) -> float | None:
         return None
 
 
+def _readings_agree(previous: float, current: float, *, rel_tol: float, abs_tol: float) -> bool:
+    if math.isnan(previous) or math.isnan(current):
+        return math.isnan(previous) and math.isnan(current)
+    return math.isclose(previous, current, rel_tol=rel_tol, abs_tol=abs_tol)
+
+
 def _parse_numeric_measurement_field(field: _DisplayField, *, display_name: str) -> float:
     if field.status_code == "O":
         return math.nan
@@ -1655,9 +3567,119 @@ def _format_spot_frequency_set_command(frequency_hz: float) -> str:
     - Units are kHz.
     """
 
+    return _format_frequency_set_command("FR", frequency_hz)
+
+
+def _format_frequency_set_command(program_code: str, frequency_hz: float) -> str:
+    """
+    Build one HP 4192A frequency parameter-setting command.
+
+    Manual basis:
+    - Table 3-24: ``FR`` (spot), ``TF`` (start), ``PF`` (stop), and ``SF``
+      (step) all take a frequency value in kHz.
+    - Paragraph 3-124: the parameter terminator is ``EN``.
+    """
+
     frequency_khz = frequency_hz / 1000.0
     value_text = _format_frequency_value_khz(frequency_khz)
-    return f"FR{value_text}EN"
+    return f"{program_code}{value_text}EN"
+
+
+def _build_spot_frequency_table(frequencies_hz: Iterable[float]) -> tuple[list[str], list[float]]:
+    # One rounding per point gives both the ``FR...EN`` command and the
+    # frequency the instrument will use, exactly as
+    # `_format_spot_frequency_set_command()` and `_normalize_frequency_hz()`.
+    commands: list[str] = []
+    normalized_frequencies_hz: list[float] = []
+    for frequency_hz in frequencies_hz:
+        value_text = _format_frequency_value_khz(_validate_frequency_hz(frequency_hz) / 1000.0)
+        commands.append(f"FR{value_text}EN")
+        normalized_frequencies_hz.append(float(value_text) * 1000.0)
+    return commands, normalized_frequencies_hz
+
+
+def _adaptive_sweep_midpoints(
+    numpy,
+    sweep: HP4192AFrequencySweep,
+    *,
+    display_a_tol: float,
+    display_b_tol: float,
+) -> list[float]:
+    """
+    Return the midpoints of the neighbouring pairs in `sweep` that need more
+    points, worst pair first.
+    """
+
+    frequencies_hz = sweep.frequency_hz
+    a_left, a_right = sweep.display_a[:-1], sweep.display_a[1:]
+    b_left, b_right = sweep.display_b[:-1], sweep.display_b[1:]
+
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        a_scale = numpy.maximum(numpy.abs(a_left), numpy.abs(a_right))
+        a_error = numpy.abs(a_right - a_left) / (display_a_tol * a_scale)
+        b_error = numpy.abs(b_right - b_left) / display_b_tol
+    a_error = numpy.where(a_scale == 0.0, 0.0, a_error)
+
+    # A pair with a reading on one side only (overflow or uncalibrated on the
+    # other) is refined; a pair with no readings at all is not.
+    finite = numpy.isfinite(sweep.display_a) & numpy.isfinite(sweep.display_b)
+    one_sided = finite[:-1] != finite[1:]
+    error = numpy.fmax(numpy.nan_to_num(a_error, nan=0.0), numpy.nan_to_num(b_error, nan=0.0))
+    error = numpy.where(one_sided, numpy.inf, numpy.where(finite[:-1] & finite[1:], error, 0.0))
+
+    midpoints_hz: list[float] = []
+    for index in numpy.argsort(-error, kind="stable"):
+        if error[index] <= 1.0:
+            break
+        left_hz = frequencies_hz[index]
+        right_hz = frequencies_hz[index + 1]
+        midpoint_hz = _normalize_frequency_hz(math.sqrt(left_hz * right_hz))
+        if left_hz < midpoint_hz < right_hz:
+            midpoints_hz.append(midpoint_hz)
+    return midpoints_hz
+
+
+def _merge_frequency_sweeps(
+    numpy,
+    first: HP4192AFrequencySweep,
+    second: HP4192AFrequencySweep,
+) -> HP4192AFrequencySweep:
+    frequency_hz = numpy.concatenate((first.frequency_hz, second.frequency_hz))
+    order = numpy.argsort(frequency_hz, kind="stable")
+    return HP4192AFrequencySweep(
+        frequency_hz=frequency_hz[order],
+        display_a=numpy.concatenate((first.display_a, second.display_a))[order],
+        display_b=numpy.concatenate((first.display_b, second.display_b))[order],
+        display_a_status=numpy.concatenate(
+            (first.display_a_status, second.display_a_status)
+        )[order],
+        display_b_status=numpy.concatenate(
+            (first.display_b_status, second.display_b_status)
+        )[order],
+        timestamps_s=numpy.concatenate((first.timestamps_s, second.timestamps_s))[order],
+    )
+
+
+def _count_sweep_points(start_hz: float, stop_hz: float, step_hz: float) -> int:
+    # Small tolerance so a stop value that lands exactly on a step is included
+    # despite float rounding in the kHz conversion.
+    return int(math.floor((stop_hz - start_hz) / step_hz + 1e-9)) + 1
+
+
+def _parse_sweep_point(snapshot: _OutputSnapshot) -> HP4192ASweepPoint:
+    return HP4192ASweepPoint(
+        frequency_hz=_parse_spot_frequency_hz(snapshot),
+        display_a=_parse_numeric_measurement_field(
+            snapshot.display_a,
+            display_name="DISPLAY A",
+        ),
+        display_b=_parse_numeric_measurement_field(
+            snapshot.display_b,
+            display_name="DISPLAY B",
+        ),
+        display_a_status=snapshot.display_a.status_code,
+        display_b_status=snapshot.display_b.status_code,
+    )
 
 
 def _format_spot_bias_set_command(bias_voltage_v: float) -> str:
@@ -0,0 +1,271 @@
+"""
+Asyncio front end for the HP 4192A driver.
+
+`HP4192A` blocks in `time.sleep` and in synchronous device reads, so one Python
+thread can only drive one analyzer at a time. `AsyncHP4192A` wraps one
+`HP4192A` and runs each call on a worker thread, so one event loop can drive
+several analyzers and overlap one unit's settle time with another unit's I/O.
+
+Each wrapper owns one worker thread, so calls on the same analyzer run in
+order and calls on different analyzers run concurrently. A shared default
+thread pool would cap the number of analyzers that can wait at the same time.
+
+The wrapped driver uses the ordinary blocking transports on those threads;
+`tcp_socket.AsyncSocketDevice` is for asyncio code that talks to a socket
+resource itself and is not used here. With ``transport="vxi11"`` each
+analyzer gets its own core-channel connection, because links that share one
+gateway connection take turns on it and would not overlap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable, Mapping, TypeVar
+
+from .hp_4192a import (
+    HP4192A,
+    HP4192ACircuitMode,
+    HP4192ADisplayA,
+    HP4192ADisplayB,
+    HP4192AFrequencySweep,
+    HP4192AGetParameter,
+    HP4192AMeasurement,
+    HP4192AMeasurementBlock,
+    HP4192AMeasurementMode,
+    HP4192ASequence,
+    HP4192AStableMeasurement,
+    HP4192ATransport,
+    HP4192ATriggerMode,
+    HP4192AVerifyMode,
+    HP4192AZYRange,
+)
+from .hp_4192a_trace import DEFAULT_TRACE_CAPACITY
+from .instrument import InstrumentReport
+from .vxi11 import Vxi11Device
+
+
+_T = TypeVar("_T")
+
+
+class AsyncHP4192A:
+    """
+    Asyncio wrapper around one `HP4192A`.
+
+    Create it from an already-open driver, or with ``await AsyncHP4192A.open(...)``.
+    The wrapped driver stays available as `meter` for settings that have no
+    async variant, such as `set_trace()`.
+
+    Example
+    -------
+    ```python
+    meters = [await AsyncHP4192A.open(name) for name in resource_names]
+    readings = await asyncio.gather(*(meter.measure() for meter in meters))
+    ```
+    """
+
+    def __init__(self, meter: HP4192A):
+        self.meter = meter
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix=f"hp4192a-{meter.connection_info.resource_name}",
+        )
+
+    @classmethod
+    async def open(
+        cls,
+        resource_name: str,
+        *,
+        timeout_ms: int = 5000,
+        trace_enabled: bool = False,
+        trace_print_live: bool = False,
+        trace_capacity: int = DEFAULT_TRACE_CAPACITY,
+        trace_categories: Iterable[str] | None = None,
+        batch_writes: bool = False,
+        verify: HP4192AVerifyMode = "full",
+        verify_sample_interval: int = 10,
+        adaptive_timing: bool = False,
+        timing_profile_path: str | Path | None = None,
+        transport: HP4192ATransport = "visa",
+    ) -> "AsyncHP4192A":
+        """
+        Open an HP 4192A through a VISA resource without blocking the event
+        loop.
+
+        The parameters are the same as `HP4192A.open()`. With
+        ``transport="vxi11"`` the link gets its own core-channel connection
+        (``Vxi11Device(..., share_connection=False)``), so analyzers behind
+        one gateway do not queue behind each other's reads.
+        """
+
+        options = dict(
+            trace_enabled=trace_enabled,
+            trace_print_live=trace_print_live,
+            trace_capacity=trace_capacity,
+            trace_categories=trace_categories,
+            batch_writes=batch_writes,
+            verify=verify,
+            verify_sample_interval=verify_sample_interval,
+            adaptive_timing=adaptive_timing,
+            timing_profile_path=timing_profile_path,
+        )
+
+        def open_meter() -> HP4192A:
+            if transport == "vxi11":
+                device = Vxi11Device(
+                    resource_name,
+                    timeout_ms=timeout_ms,
+                    share_connection=False,
+                )
+                return HP4192A(device, **options)
+            return HP4192A.open(
+                resource_name,
+                timeout_ms=timeout_ms,
+                transport=transport,
+                **options,
+            )
+
+        return cls(await asyncio.to_thread(open_meter))
+
+    @property
+    def instrument_name(self) -> str:
+        return self.meter.instrument_name
+
+    async def ping(self, *, show: bool = False) -> InstrumentReport:
+        """
+        Async variant of `HP4192A.ping()`.
+
+        `show` defaults to `False` here, because reports printed from several
+        analyzers at once interleave.
+        """
+
+        return await self._run(lambda: self.meter.ping(show=show))
+
+    async def get(self, parameter_name: HP4192AGetParameter) -> float | str:
+        """
+        Async variant of `HP4192A.get()`.
+        """
+
+        return await self._run(lambda: self.meter.get(parameter_name))
+
+    async def get_many(
+        self,
+        parameter_names: list[HP4192AGetParameter],
+    ) -> dict[str, float | str]:
+        """
+        Async variant of `HP4192A.get_many()`.
+        """
+
+        return await self._run(lambda: self.meter.get_many(parameter_names))
+
+    async def configure(
+        self,
+        *,
+        frequency_hz: float | None = None,
+        bias_voltage_v: float | None = None,
+        osc_level_v: float | None = None,
+        bias_enabled: bool | None = None,
+        trigger_mode: HP4192ATriggerMode | None = None,
+        measurement_mode: HP4192AMeasurementMode | None = None,
+        zy_range: HP4192AZYRange | None = None,
+        circuit_mode: HP4192ACircuitMode | None = None,
+        display_a: HP4192ADisplayA | None = None,
+        display_b: HP4192ADisplayB | None = None,
+        verify: HP4192AVerifyMode | None = None,
+    ) -> None:
+        """
+        Async variant of `HP4192A.configure()`.
+        """
+
+        await self._run(
+            lambda: self.meter.configure(
+                frequency_hz=frequency_hz,
+                bias_voltage_v=bias_voltage_v,
+                osc_level_v=osc_level_v,
+                bias_enabled=bias_enabled,
+                trigger_mode=trigger_mode,
+                measurement_mode=measurement_mode,
+                zy_range=zy_range,
+                circuit_mode=circuit_mode,
+                display_a=display_a,
+                display_b=display_b,
+                verify=verify,
+            )
+        )
+
+    async def measure(self) -> HP4192AMeasurement:
+        """
+        Async variant of `HP4192A.measure()`.
+        """
+
+        return await self._run(self.meter.measure)
+
+    async def measure_until_stable(self, **kwargs: float) -> HP4192AStableMeasurement:
+        """
+        Async variant of `HP4192A.measure_until_stable()`.
+        """
+
+        return await self._run(lambda: self.meter.measure_until_stable(**kwargs))
+
+    async def measure_many(self, count: int) -> HP4192AMeasurementBlock:
+        """
+        Async variant of `HP4192A.measure_many()`.
+
+        The whole block runs as one call, so other analyzers keep running while
+        this one acquires.
+        """
+
+        return await self._run(lambda: self.meter.measure_many(count))
+
+    async def sweep_frequencies(self, frequencies_hz: Iterable[float]) -> HP4192AFrequencySweep:
+        """
+        Async variant of `HP4192A.sweep_frequencies()`.
+
+        The whole sweep runs as one call.
+        """
+
+        frequencies_hz = list(frequencies_hz)
+        return await self._run(lambda: self.meter.sweep_frequencies(frequencies_hz))
+
+    async def sweep_adaptive(self, **kwargs) -> HP4192AFrequencySweep:
+        """
+        Async variant of `HP4192A.sweep_adaptive()`.
+
+        The whole sweep, including every refinement pass, runs as one call.
+        """
+
+        return await self._run(lambda: self.meter.sweep_adaptive(**kwargs))
+
+    async def run_sequence(
+        self,
+        sequence: HP4192ASequence | Iterable[Mapping[str, object]],
+        *,
+        verify: HP4192AVerifyMode | None = None,
+    ) -> list[HP4192AMeasurement]:
+        """
+        Async variant of `HP4192A.run_sequence()`.
+        """
+
+        return await self._run(lambda: self.meter.run_sequence(sequence, verify=verify))
+
+    async def close(self) -> None:
+        """
+        Async variant of `HP4192A.close()`.
+
+        Also stops the worker thread of this wrapper.
+        """
+
+        try:
+            await self._run(self.meter.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncHP4192A":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _run(self, call: Callable[[], _T]) -> _T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
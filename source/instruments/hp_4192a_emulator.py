@@ -0,0 +1,548 @@
+"""
+HP 4192A emulator for offline driver checks and benchmarks.
+
+`MockVisaDevice` only replays queued strings. `HP4192AEmulator` understands
+the program codes the driver sends, keeps the instrument state they change,
+and answers `EX` with a correctly formatted output string computed from a
+configurable RLC DUT. It has the same interface as `VisaDevice`, so it plugs
+straight into `HP4192A(...)`.
+
+Supported program codes (table 3-23 / 3-24):
+
+- ``FR``, ``BI``, ``OL``, ``TF``, ``PF``, ``SF`` ... ``EN`` parameter entry
+- ``A1``/``A3``/``A4`` and ``B1``/``B2`` display functions
+- ``C1``-``C3``, ``T1``-``T3``, ``V0``/``V1``, ``H0``/``H1``, ``R1``-``R8``,
+  ``I0``/``I1``
+- ``F0``/``F1`` output format
+- ``FRR``, ``BIR``, ``OLR`` DISPLAY C recall
+- ``G0``/``G1`` linear or log sweep
+- ``W2``/``W3`` manual sweep start and step up
+- ``EX`` trigger
+
+Concatenated program strings such as ``FR1ENC2A1B1`` are accepted. Unknown
+codes raise `ValueError`, so driver bugs show up instead of being ignored.
+
+A display value reports status ``O`` (overflow) past the display limit and
+``U`` (uncalibrated) when a fixed ZY range ``R1``-``R7`` is more than one
+decade away from the DUT's |Z|. ``I0`` keeps the spot bias setpoint but
+``BIR`` reports ``0 V`` until bias is switched on or a new ``BI`` value is
+entered, as on the bench.
+
+`HP4192AFaultProfile` injects the readback failures seen on the real gateway
+(empty, stale, and wrong-state output) at configurable rates, together with
+random write/read latency, so the driver's retry paths can be benchmarked.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import cmath
+import math
+import random
+import re
+import time
+
+
+# One program code in a (possibly concatenated) program string. Recall codes
+# are matched before parameter entry so `FRR` is not read as `FR` + value.
+_PROGRAM_CODE_PATTERN = re.compile(
+    r"\s*(?:"
+    r"(?P<recall>FRR|BIR|OLR)"
+    r"|(?P<entry>FR|BI|OL|TF|PF|SF)(?P<value>[+-]?(?:\d+\.?\d*|\.\d+))EN"
+    r"|(?P<trigger>EX)"
+    r"|(?P<control>[ABCFGHIRTVW])(?P<digit>\d)"
+    r")\s*"
+)
+
+_ENTRY_CODE_TO_DISPLAY_C = {
+    "FR": "FRR",
+    "BI": "BIR",
+    "OL": "OLR",
+}
+
+# Spot-frequency ratio of one `W3` step in log sweep (`G1`). The instrument
+# picks its own log step; this only has to differ from the linear STEP so a
+# sweep that leaves log sweep selected reads the wrong frequencies.
+_LOG_SWEEP_STEP_RATIO = 10.0 ** 0.1
+
+_CONTROL_CODE_DIGITS = {
+    "A": {1, 3, 4},
+    "B": {1, 2},
+    "C": {1, 2, 3},
+    "F": {0, 1},
+    "G": {0, 1},
+    "H": {0, 1},
+    "I": {0, 1},
+    "R": {1, 2, 3, 4, 5, 6, 7, 8},
+    "T": {1, 2, 3},
+    "V": {0, 1},
+    "W": {2, 3},
+}
+
+# DISPLAY C parameter shown instead of the recalled one by a wrong-state fault.
+# Each substitute has a different unit (frequency `K` for a voltage `V` and
+# back), the way the driver can tell. A BIR/OLR swap would keep `V` and go
+# unnoticed.
+_WRONG_DISPLAY_C_CODE = {
+    "FRR": "BIR",
+    "BIR": "FRR",
+    "OLR": "FRR",
+}
+
+# Largest value the 4192A displays before it reports overflow.
+_DISPLAY_OVERFLOW_LIMIT = 1.3e7
+
+# `C1` (auto) picks series below this |Z| and parallel above it.
+_AUTO_CIRCUIT_THRESHOLD_OHM = 1_000.0
+
+# Nominal |Z| of each fixed ZY range. A reading more than one decade outside
+# its range is reported uncalibrated; `R1` has no lower and `R7` no upper
+# limit, and `R8` (auto) always picks a calibrated range.
+_RANGE_CODE_TO_OHM = {
+    "R1": 1.0,
+    "R2": 10.0,
+    "R3": 100.0,
+    "R4": 1_000.0,
+    "R5": 10_000.0,
+    "R6": 100_000.0,
+    "R7": 1_000_000.0,
+}
+
+
+@dataclass(slots=True)
+class HP4192ALatencyDistribution:
+    """
+    Random per-transaction latency for `HP4192AFaultProfile`.
+
+    Each sample is log-normal around `median_s` with shape `jitter` (``0`` is a
+    fixed latency). With probability `tail_rate`, `tail_s` is added on top to
+    model an occasional slow gateway transaction.
+    """
+
+    median_s: float = 0.0
+    jitter: float = 0.0
+    tail_rate: float = 0.0
+    tail_s: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        latency_s = self.median_s
+        if self.jitter > 0.0 and latency_s > 0.0:
+            latency_s *= rng.lognormvariate(0.0, self.jitter)
+        if self.tail_rate > 0.0 and rng.random() < self.tail_rate:
+            latency_s += self.tail_s
+        return latency_s
+
+
+@dataclass(slots=True)
+class HP4192AFaultProfile:
+    """
+    Readback faults and latency injected by `HP4192AEmulator`.
+
+    Rates are per `read()` and are checked in this order:
+
+    - `empty_rate`: the read returns an empty string
+    - `stale_rate`: the read returns the previous output again instead of the
+      one for the latest ``EX``
+    - `wrong_state_rate`: the output comes back in the wrong output state:
+      with ``F1``, DISPLAY C shows a parameter with a different unit than the
+      recalled one (the spot frequency instead of a voltage, or the spot bias
+      instead of the frequency); with ``F0``, a DISPLAY C field is appended
+      as if ``F1`` were still active
+
+    The driver detects both wrong-state forms and retries the read where it
+    has a retry path. `measure()` has none, so it raises instead.
+
+    `write_latency` and `read_latency` replace the emulator's fixed latencies.
+    """
+
+    name: str = "clean"
+    empty_rate: float = 0.0
+    stale_rate: float = 0.0
+    wrong_state_rate: float = 0.0
+    write_latency: HP4192ALatencyDistribution | None = None
+    read_latency: HP4192ALatencyDistribution | None = None
+
+
+@dataclass(slots=True)
+class HP4192AEmulatedDUT:
+    """
+    Lumped RLC device under test for `HP4192AEmulator`.
+
+    - `topology="series"`: R, L, and C in series
+    - `topology="parallel"`: R, L, and C in parallel
+
+    Set `inductance_h` or `capacitance_f` to `None` to leave that element out.
+    The default is a 1 uF capacitor with 0.1 ohm series resistance.
+    """
+
+    resistance_ohm: float = 0.1
+    inductance_h: float | None = None
+    capacitance_f: float | None = 1e-6
+    topology: str = "series"
+
+    def impedance(self, frequency_hz: float) -> complex:
+        omega = 2.0 * math.pi * frequency_hz
+        element_impedances = [complex(self.resistance_ohm, 0.0)]
+        if self.inductance_h is not None:
+            element_impedances.append(complex(0.0, omega * self.inductance_h))
+        if self.capacitance_f is not None:
+            element_impedances.append(complex(0.0, -1.0 / (omega * self.capacitance_f)))
+
+        if self.topology == "series":
+            return sum(element_impedances, complex(0.0, 0.0))
+        if self.topology == "parallel":
+            admittance = sum(
+                (1.0 / z if z != 0 else complex(math.inf, 0.0) for z in element_impedances),
+                complex(0.0, 0.0),
+            )
+            return 1.0 / admittance if admittance != 0 else complex(math.inf, 0.0)
+        raise ValueError(f"Unsupported DUT topology {self.topology!r}. Supported values: series, parallel")
+
+
+class HP4192AEmulator:
+    """
+    VISA-like HP 4192A that answers from an emulated instrument state.
+
+    Parameters
+    ----------
+    dut:
+        Device under test. Defaults to `HP4192AEmulatedDUT()`.
+    write_latency_s, read_latency_s:
+        Time each `write()` / `read()` call takes, for example to model a
+        LAN/GPIB gateway transaction.
+    measurement_time_s:
+        Time after ``EX`` before the output is ready. A `read()` that comes
+        earlier waits for it.
+    settling_triggers:
+        Number of triggers after a frequency, bias, or oscillator-level change
+        whose readings are still off by a decaying error, so settle logic has
+        something to converge on.
+    faults:
+        Optional `HP4192AFaultProfile` with injected readback faults and
+        random latency.
+    seed:
+        Seed for the fault and latency random generator, so a benchmark run
+        can be repeated exactly.
+
+    `writes` keeps every program code received, `write_count` /
+    `read_count` count device transactions, and `fault_counts` counts the
+    injected faults by kind.
+    """
+
+    def __init__(
+        self,
+        dut: HP4192AEmulatedDUT | None = None,
+        *,
+        resource_name: str = "EMULATED::HP4192A::INSTR",
+        write_latency_s: float = 0.0,
+        read_latency_s: float = 0.0,
+        measurement_time_s: float = 0.0,
+        settling_triggers: int = 0,
+        faults: HP4192AFaultProfile | None = None,
+        seed: int | None = None,
+    ):
+        self.resource_name = resource_name
+        self.timeout = 5000
+        self.dut = dut if dut is not None else HP4192AEmulatedDUT()
+        self.write_latency_s = write_latency_s
+        self.read_latency_s = read_latency_s
+        self.measurement_time_s = measurement_time_s
+        self.settling_triggers = settling_triggers
+        self.faults = faults
+        self.writes: list[str] = []
+        self.write_count = 0
+        self.read_count = 0
+        self.fault_counts = {"empty": 0, "stale": 0, "wrong_state": 0}
+        self._rng = random.Random(seed)
+        self._last_output = ""
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Return to the power-on state.
+        """
+
+        self.frequency_hz = 100_000.0
+        self.bias_voltage_v = 0.0
+        self.osc_level_v = 1.0
+        self.bias_enabled = False
+        self._bias_readback_zeroed = False
+        self.start_frequency_hz = 5.0
+        self.stop_frequency_hz = 13_000_000.0
+        self.step_frequency_hz = 1_000.0
+        self.sweep_scale_code = "G0"
+        self.display_a_code = "A1"
+        self.display_b_code = "B1"
+        self.circuit_mode_code = "C1"
+        self.trigger_mode_code = "T1"
+        self.average_code = "V0"
+        self.high_speed_code = "H0"
+        self.range_code = "R8"
+        self.output_format_code = "F0"
+        self.display_c_code = "FRR"
+        self._pending_output: str | None = None
+        self._output_ready_at = 0.0
+        self._settling_remaining = 0
+
+    def write(self, message: str) -> None:
+        self.write_count += 1
+        latency_s = self.write_latency_s
+        if self.faults is not None and self.faults.write_latency is not None:
+            latency_s = self.faults.write_latency.sample(self._rng)
+        if latency_s > 0.0:
+            time.sleep(latency_s)
+        for code in self._split_program_string(message):
+            self.writes.append(code)
+            self._execute(code)
+
+    def read(self) -> str:
+        self.read_count += 1
+        latency_s = self.read_latency_s
+        if self.faults is not None and self.faults.read_latency is not None:
+            latency_s = self.faults.read_latency.sample(self._rng)
+        if latency_s > 0.0:
+            time.sleep(latency_s)
+        if self._pending_output is None:
+            if self.trigger_mode_code != "T1":
+                raise TimeoutError(f"{self.resource_name}: no output pending")
+            self._trigger()
+        wait_s = self._output_ready_at - time.monotonic()
+        if wait_s > 0.0:
+            time.sleep(wait_s)
+        output = self._pending_output
+        self._pending_output = None
+        if self.faults is not None:
+            output = self._inject_read_fault(output)
+        self._last_output = output
+        return output
+
+    def query(self, message: str) -> str:
+        self.write(message)
+        return self.read()
+
+    def clear(self) -> None:
+        # On the real instrument, device clear reset the spot frequency to
+        # 100 kHz (see `HP4192A._read_output_snapshot()`).
+        self._pending_output = None
+        self.frequency_hz = 100_000.0
+
+    def read_stb(self) -> int:
+        return 0
+
+    def close(self) -> None:
+        return None
+
+    def _inject_read_fault(self, output: str) -> str:
+        faults = self.faults
+        draw = self._rng.random()
+        if draw < faults.empty_rate:
+            self.fault_counts["empty"] += 1
+            return ""
+        draw -= faults.empty_rate
+        if draw < faults.stale_rate and self._last_output:
+            self.fault_counts["stale"] += 1
+            return self._last_output
+        draw -= faults.stale_rate
+        if draw < faults.wrong_state_rate:
+            self.fault_counts["wrong_state"] += 1
+            fields = output.split(",")
+            recalled = self.display_c_code
+            self.display_c_code = _WRONG_DISPLAY_C_CODE[recalled]
+            try:
+                wrong_display_c = self._format_display_c()
+            finally:
+                self.display_c_code = recalled
+            return ",".join(fields[:2] + [wrong_display_c])
+        return output
+
+    def _split_program_string(self, message: str) -> list[str]:
+        codes: list[str] = []
+        position = 0
+        text = message.strip().upper()
+        while position < len(text):
+            match = _PROGRAM_CODE_PATTERN.match(text, position)
+            if match is None or match.end() == position:
+                raise ValueError(f"HP 4192A emulator: unknown program code at {text[position:]!r}")
+            code = match.group(0).strip()
+            control = match.group("control")
+            if control is not None and int(match.group("digit")) not in _CONTROL_CODE_DIGITS[control]:
+                raise ValueError(f"HP 4192A emulator: unsupported program code {code!r}")
+            codes.append(code)
+            position = match.end()
+        return codes
+
+    def _execute(self, code: str) -> None:
+        if code == "EX":
+            self._trigger()
+            return
+
+        if code in {"FRR", "BIR", "OLR"}:
+            self.display_c_code = code
+            return
+
+        match = _PROGRAM_CODE_PATTERN.fullmatch(code)
+        entry = match.group("entry")
+        if entry is not None:
+            self._enter_parameter(entry, float(match.group("value")))
+            return
+
+        control = match.group("control")
+        if control == "A":
+            self.display_a_code = code
+        elif control == "B":
+            self.display_b_code = code
+        elif control == "C":
+            self.circuit_mode_code = code
+        elif control == "F":
+            self.output_format_code = code
+        elif control == "G":
+            self.sweep_scale_code = code
+        elif control == "H":
+            self.high_speed_code = code
+        elif control == "I":
+            # The setpoint survives `I0`; only the `BIR` readback drops to 0 V.
+            self.bias_enabled = code == "I1"
+            self._bias_readback_zeroed = not self.bias_enabled
+        elif control == "R":
+            self.range_code = code
+        elif control == "T":
+            self.trigger_mode_code = code
+        elif control == "V":
+            self.average_code = code
+        elif code == "W2":
+            self._set_spot_frequency(self.start_frequency_hz)
+        elif code == "W3":
+            if self.sweep_scale_code == "G1":
+                next_frequency_hz = self.frequency_hz * _LOG_SWEEP_STEP_RATIO
+            else:
+                next_frequency_hz = self.frequency_hz + self.step_frequency_hz
+            self._set_spot_frequency(min(next_frequency_hz, self.stop_frequency_hz))
+
+    def _enter_parameter(self, entry: str, value: float) -> None:
+        if entry == "FR":
+            self._set_spot_frequency(value * 1000.0)
+        elif entry == "BI":
+            self.bias_voltage_v = round(value, 2)
+            self._bias_readback_zeroed = False
+            self._settling_remaining = self.settling_triggers
+        elif entry == "OL":
+            self.osc_level_v = round(value, 3)
+            self._settling_remaining = self.settling_triggers
+        elif entry == "TF":
+            self.start_frequency_hz = value * 1000.0
+        elif entry == "PF":
+            self.stop_frequency_hz = value * 1000.0
+        elif entry == "SF":
+            self.step_frequency_hz = value * 1000.0
+
+        display_c_code = _ENTRY_CODE_TO_DISPLAY_C.get(entry)
+        if display_c_code is not None:
+            self.display_c_code = display_c_code
+
+    def _set_spot_frequency(self, frequency_hz: float) -> None:
+        self.frequency_hz = round(frequency_hz, 3)
+        self.display_c_code = "FRR"
+        self._settling_remaining = self.settling_triggers
+
+    def _trigger(self) -> None:
+        display_a, display_b = self._measure_displays()
+        fields = [display_a, display_b]
+        if self.output_format_code == "F1":
+            fields.append(self._format_display_c())
+        self._pending_output = ",".join(fields)
+        self._output_ready_at = time.monotonic() + self.measurement_time_s
+
+    def _measure_displays(self) -> tuple[str, str]:
+        impedance = self.dut.impedance(self.frequency_hz)
+        if self._settling_remaining > 0:
+            impedance *= 1.0 + 0.05 * self._settling_remaining / self.settling_triggers
+            self._settling_remaining -= 1
+
+        series = self._uses_series_circuit(impedance)
+        status_code = "U" if self._is_uncalibrated(impedance) else "N"
+        omega = 2.0 * math.pi * self.frequency_hz
+        admittance = 1.0 / impedance if impedance != 0 else complex(math.inf, 0.0)
+
+        if self.display_a_code == "A1":
+            value = impedance if series else admittance
+            display_a = ("ZF" if series else "YF", abs(value))
+            phase = cmath.phase(value)
+            if self.display_b_code == "B1":
+                display_b = ("TD", math.degrees(phase))
+            else:
+                display_b = ("TR", phase)
+            return (
+                _format_display_field(*display_a, status_code),
+                _format_display_field(*display_b, status_code),
+            )
+
+        if series:
+            resistive, reactive = impedance.real, impedance.imag
+        else:
+            resistive, reactive = admittance.real, admittance.imag
+
+        if self.display_a_code == "A3":
+            if series:
+                display_a = ("LS", reactive / omega)
+            else:
+                display_a = ("LP", -1.0 / (omega * reactive) if reactive else math.inf)
+        else:
+            if series:
+                display_a = ("CS", -1.0 / (omega * reactive) if reactive else math.inf)
+            else:
+                display_a = ("CP", reactive / omega)
+
+        quality = abs(reactive) / resistive if resistive else math.inf
+        if self.display_b_code == "B1":
+            display_b = ("QF", quality)
+        else:
+            display_b = ("DF", 1.0 / quality if quality else math.inf)
+        return (
+            _format_display_field(*display_a, status_code),
+            _format_display_field(*display_b, status_code),
+        )
+
+    def _uses_series_circuit(self, impedance: complex) -> bool:
+        if self.circuit_mode_code == "C2":
+            return True
+        if self.circuit_mode_code == "C3":
+            return False
+        return abs(impedance) <= _AUTO_CIRCUIT_THRESHOLD_OHM
+
+    def _is_uncalibrated(self, impedance: complex) -> bool:
+        range_ohm = _RANGE_CODE_TO_OHM.get(self.range_code)
+        if range_ohm is None:
+            return False
+        magnitude = abs(impedance)
+        if self.range_code != "R1" and magnitude < range_ohm / 10.0:
+            return True
+        return self.range_code != "R7" and magnitude > range_ohm * 10.0
+
+    def _format_display_c(self) -> str:
+        if self.display_c_code == "BIR":
+            bias_voltage_v = 0.0 if self._bias_readback_zeroed else self.bias_voltage_v
+            return f"V{bias_voltage_v:+06.2f}"
+        if self.display_c_code == "OLR":
+            return f"V{self.osc_level_v:+06.3f}"
+        return f"K{self.frequency_hz / 1000.0:+014.6f}"
+
+
+def _format_display_field(function_code: str, value: float, status_code: str = "N") -> str:
+    if not math.isfinite(value) or abs(value) >= _DISPLAY_OVERFLOW_LIMIT:
+        return f"O{function_code}N+9999.9E+09"
+    return f"{status_code}{function_code}N{_format_display_value(value)}"
+
+
+def _format_display_value(value: float) -> str:
+    # Engineering notation with five significant digits, the way the front
+    # panel shows it: mantissa in [1, 1000) and an exponent that is a
+    # multiple of 3.
+    if value == 0.0:
+        return "+0.0000E+00"
+    exponent = int(math.floor(math.log10(abs(value)) / 3.0)) * 3
+    mantissa = value / 10.0**exponent
+    if round(abs(mantissa), 2) >= 1000.0:
+        exponent += 3
+        mantissa /= 1000.0
+    decimals = 4 - int(math.floor(math.log10(abs(mantissa))))
+    return f"{mantissa:+.{decimals}f}E{exponent:+03d}"
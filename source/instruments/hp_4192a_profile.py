@@ -0,0 +1,184 @@
+"""
+Per-phase timing profile for the HP 4192A driver.
+
+`HP4192A.profile()` collects one `HP4192AProfile` while its ``with`` block
+runs. The driver reports wall time for five phases:
+
+- ``write``: device writes, per program code
+- ``settle``: deliberate sleeps, per driver constant that caused them
+- ``read``: device reads
+- ``parse``: output-string parsing
+- ``verify``: `configure()` verification logic
+
+Phases nest (verification reads snapshots, a snapshot writes and reads), so
+each phase records only its own time, not the time of phases inside it. The
+time not covered by any phase is reported as ``other``.
+
+`percentile()` is the percentile definition used here and by the benchmark
+scripts, so their p50/p95 columns can be compared.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+
+
+HP4192A_PROFILE_PHASES = ("write", "settle", "read", "parse", "verify")
+
+
+class HP4192AProfile:
+    """
+    Wall time per phase and per command code.
+
+    Use `phases()` and `entries()` for the numbers, or print the profile for a
+    readable report.
+    """
+
+    def __init__(self):
+        self._samples: dict[tuple[str, str], list[float]] = {}
+        self._stack: list[list] = []
+        self._started_at: float | None = None
+        self._wall_s = 0.0
+
+    @property
+    def wall_s(self) -> float:
+        """
+        Wall time of the profiled block so far.
+        """
+
+        if self._started_at is not None:
+            return self._wall_s + time.perf_counter() - self._started_at
+        return self._wall_s
+
+    def start(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def stop(self) -> None:
+        if self._started_at is not None:
+            self._wall_s += time.perf_counter() - self._started_at
+            self._started_at = None
+
+    def phase(self, phase: str, code: str) -> "_PhaseTimer":
+        """
+        Return a context manager that times one `phase` for `code`.
+        """
+
+        return _PhaseTimer(self, phase, code)
+
+    def phases(self) -> dict[str, dict[str, float]]:
+        """
+        Return total time, count, and share of wall time per phase.
+
+        The ``other`` entry is wall time outside every phase.
+        """
+
+        wall_s = self.wall_s
+        totals = {phase: {"total_s": 0.0, "count": 0} for phase in HP4192A_PROFILE_PHASES}
+        for (phase, _code), samples in self._samples.items():
+            totals[phase]["total_s"] += sum(samples)
+            totals[phase]["count"] += len(samples)
+
+        covered_s = sum(values["total_s"] for values in totals.values())
+        totals["other"] = {"total_s": max(0.0, wall_s - covered_s), "count": 0}
+        for values in totals.values():
+            values["share"] = values["total_s"] / wall_s if wall_s > 0.0 else 0.0
+        return totals
+
+    def entries(self) -> list[dict[str, object]]:
+        """
+        Return one entry per phase and command code, largest total first.
+
+        Each entry has `phase`, `code`, `count`, `total_s`, `share`, `mean_s`,
+        `p50_s`, `p95_s`, and `max_s`.
+        """
+
+        wall_s = self.wall_s
+        entries: list[dict[str, object]] = []
+        for (phase, code), samples in self._samples.items():
+            ordered = sorted(samples)
+            total_s = sum(ordered)
+            entries.append(
+                {
+                    "phase": phase,
+                    "code": code,
+                    "count": len(ordered),
+                    "total_s": total_s,
+                    "share": total_s / wall_s if wall_s > 0.0 else 0.0,
+                    "mean_s": total_s / len(ordered),
+                    "p50_s": percentile(ordered, 0.50),
+                    "p95_s": percentile(ordered, 0.95),
+                    "max_s": ordered[-1],
+                }
+            )
+        entries.sort(key=lambda entry: entry["total_s"], reverse=True)
+        return entries
+
+    def to_text(self) -> str:
+        lines = [f"HP 4192A profile: {self.wall_s:.3f} s wall", ""]
+        lines.append(f"{'phase':<8} {'total s':>9} {'share':>7} {'count':>7}")
+        for phase, values in self.phases().items():
+            lines.append(
+                f"{phase:<8} {values['total_s']:>9.3f} {values['share']:>7.1%} "
+                f"{values['count']:>7}"
+            )
+
+        entries = self.entries()
+        if entries:
+            lines.append("")
+            lines.append(
+                f"{'phase':<8} {'code':<34} {'total s':>9} {'share':>7} {'count':>7} "
+                f"{'p50 ms':>8} {'p95 ms':>8}"
+            )
+            for entry in entries:
+                lines.append(
+                    f"{entry['phase']:<8} {entry['code']:<34} {entry['total_s']:>9.3f} "
+                    f"{entry['share']:>7.1%} {entry['count']:>7} "
+                    f"{1000.0 * entry['p50_s']:>8.2f} {1000.0 * entry['p95_s']:>8.2f}"
+                )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.to_text()
+
+    def _begin(self, phase: str, code: str) -> None:
+        self._stack.append([phase, code, time.perf_counter(), 0.0])
+
+    def _end(self) -> None:
+        phase, code, started_at, nested_s = self._stack.pop()
+        duration_s = time.perf_counter() - started_at
+        self._samples.setdefault((phase, code), []).append(duration_s - nested_s)
+        if self._stack:
+            self._stack[-1][3] += duration_s
+
+
+class _PhaseTimer:
+    __slots__ = ("_profile", "_phase", "_code")
+
+    def __init__(self, profile: HP4192AProfile, phase: str, code: str):
+        self._profile = profile
+        self._phase = phase
+        self._code = code
+
+    def __enter__(self) -> None:
+        self._profile._begin(self._phase, self._code)
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._profile._end()
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """
+    Return the nearest-rank percentile of already sorted values.
+
+    `fraction` is between 0 and 1, for example ``0.95`` for p95. The result
+    is the smallest value with at least that fraction of the values at or
+    below it, so it is always one of the samples. Returns ``nan`` for no
+    values.
+    """
+
+    if not sorted_values:
+        return math.nan
+    # Rounding first keeps products such as 0.07 * 100 on their integer rank.
+    rank = math.ceil(round(fraction * len(sorted_values), 9))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
@@ -0,0 +1,174 @@
+"""
+Adaptive settle timing for the HP 4192A driver.
+
+The driver waits after `EX` and after a configure batch before it reads the
+instrument back. The fixed waits in `hp_4192a.py` are tuned by hand for the
+worst case. This module learns, per command class, how short a wait has
+worked without producing empty or stale readbacks, and persists that profile
+per instrument so the next session starts already tuned.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+
+
+@dataclass(slots=True)
+class _SettleClassState:
+    default_s: float
+    settle_s: float
+    known_bad_s: float = 0.0
+    successes: int = 0
+    failures: int = 0
+
+
+class HP4192ASettleTiming:
+    """
+    Per-command-class settle times learned from readback outcomes.
+
+    Rules
+    -----
+    - every class starts at its default settle time
+    - after a successful readback, the next settle is shortened by
+      `shrink_factor`, but never below `safety_margin` times the longest
+      settle that has failed, and never below `min_settle_s`
+    - after an empty or unparsable readback, the failing settle is recorded
+      as known-bad and the next settle backs off by `backoff_factor`, capped
+      at `max_scale` times the default
+    """
+
+    def __init__(
+        self,
+        defaults: dict[str, float],
+        *,
+        min_settle_s: float = 0.005,
+        shrink_factor: float = 0.8,
+        backoff_factor: float = 2.0,
+        safety_margin: float = 1.25,
+        max_scale: float = 4.0,
+    ):
+        self.min_settle_s = min_settle_s
+        self.shrink_factor = shrink_factor
+        self.backoff_factor = backoff_factor
+        self.safety_margin = safety_margin
+        self.max_scale = max_scale
+        self._classes: dict[str, _SettleClassState] = {
+            name: _SettleClassState(default_s=value, settle_s=value)
+            for name, value in defaults.items()
+        }
+
+    def settle_s(self, command_class: str) -> float:
+        """
+        Return the settle time to use for the next command of this class.
+        """
+
+        return self._classes[command_class].settle_s
+
+    def record_success(self, command_class: str, settle_s: float) -> None:
+        """
+        Record that a readback after `settle_s` came back valid.
+        """
+
+        state = self._classes[command_class]
+        state.successes += 1
+        state.settle_s = max(
+            self.min_settle_s,
+            state.known_bad_s * self.safety_margin,
+            min(state.settle_s, settle_s * self.shrink_factor),
+        )
+
+    def record_failure(self, command_class: str, settle_s: float) -> None:
+        """
+        Record that a readback after `settle_s` came back empty or stale.
+        """
+
+        state = self._classes[command_class]
+        state.failures += 1
+        state.known_bad_s = max(state.known_bad_s, settle_s)
+        state.settle_s = min(
+            state.default_s * self.max_scale,
+            max(
+                settle_s * self.backoff_factor,
+                state.known_bad_s * self.safety_margin,
+                self.min_settle_s,
+            ),
+        )
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """
+        Return the learned profile as plain data.
+        """
+
+        return {
+            name: {
+                "settle_s": state.settle_s,
+                "known_bad_s": state.known_bad_s,
+                "successes": state.successes,
+                "failures": state.failures,
+            }
+            for name, state in self._classes.items()
+        }
+
+    def update_from_dict(self, profile: dict[str, dict[str, float]]) -> None:
+        """
+        Load learned values for the classes this controller knows about.
+
+        Unknown classes are ignored, and loaded settle times are clamped to the
+        same limits the learning rules use.
+        """
+
+        for name, values in profile.items():
+            state = self._classes.get(name)
+            if state is None:
+                continue
+            state.known_bad_s = max(0.0, float(values.get("known_bad_s", 0.0)))
+            state.successes = int(values.get("successes", 0))
+            state.failures = int(values.get("failures", 0))
+            state.settle_s = min(
+                state.default_s * self.max_scale,
+                max(
+                    self.min_settle_s,
+                    state.known_bad_s * self.safety_margin,
+                    float(values.get("settle_s", state.default_s)),
+                ),
+            )
+
+    def load(self, path: str | Path, instrument_key: str) -> bool:
+        """
+        Load the profile stored for `instrument_key` in a JSON profile file.
+
+        Return `True` when a stored profile was found.
+        """
+
+        profiles = _read_profile_file(Path(path))
+        profile = profiles.get(instrument_key)
+        if profile is None:
+            return False
+        self.update_from_dict(profile)
+        return True
+
+    def save(self, path: str | Path, instrument_key: str) -> None:
+        """
+        Store this profile under `instrument_key` in a JSON profile file.
+
+        Profiles of other instruments in the same file are kept.
+        """
+
+        path = Path(path)
+        profiles = _read_profile_file(path)
+        profiles[instrument_key] = self.as_dict()
+        path.write_text(json.dumps(profiles, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _read_profile_file(path: Path) -> dict[str, dict[str, dict[str, float]]]:
+    if not path.exists():
+        return {}
+    try:
+        profiles = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise RuntimeError(f"settle timing profile {path} is not valid JSON") from exc
+    if not isinstance(profiles, dict):
+        raise RuntimeError(f"settle timing profile {path} must contain a JSON object")
+    return profiles
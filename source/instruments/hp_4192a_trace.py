@@ -0,0 +1,315 @@
+"""
+Bounded in-memory trace of HP 4192A driver I/O.
+
+The driver records one compact event per trace call: time, category, program
+code, and the message template with its arguments. Text is only built when the
+log is read, so tracing can stay on for long runs. The buffer keeps the newest
+`capacity` events and counts the ones it dropped.
+
+Besides these instant events the driver records spans: ``CONFIG`` around one
+`configure()`, ``VERIFY`` around its verification, ``SNAPSHOT`` around one
+output snapshot, ``READTRY`` around one readback attempt, and ``WRITE``,
+``READ``, and ``SLEEP`` around device I/O and settle sleeps. Spans nest by
+time and are left out of the text log. A write or read that raises is
+followed by an instant event ``<error Type: message>`` in its category. `to_chrome_trace()` and
+`write_jsonl()` export both kinds for a timeline viewer such as Perfetto or
+``chrome://tracing``.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import asdict, dataclass
+import json
+import os
+import time
+from typing import Iterable, TextIO
+
+
+HP4192A_TRACE_CATEGORIES = frozenset(
+    {
+        "BATCH",
+        "BLOCK",
+        "CONFIG",
+        "READ",
+        "READTRY",
+        "SKIP",
+        "SLEEP",
+        "SNAPSHOT",
+        "STABLE",
+        "SWEEP",
+        "TIMING",
+        "VERIFY",
+        "WRITE",
+    }
+)
+DEFAULT_TRACE_CAPACITY = 10_000
+
+# (start time, duration or None for instant events, category, code,
+# %-template, template args)
+_RawTraceEvent = tuple[float, "float | None", str, "str | None", str, tuple]
+
+
+@dataclass(frozen=True)
+class HP4192ATraceEvent:
+    """
+    One trace event.
+
+    `time_s` is seconds since the trace was started or cleared. `code` is the
+    program code the event belongs to, when there is one. Spans have a
+    `duration_s`; instant events have `None`.
+    """
+
+    time_s: float
+    category: str
+    code: str | None
+    message: str
+    duration_s: float | None = None
+
+    def __str__(self) -> str:
+        return f"[{self.time_s:8.3f} s] {self.category:<8} {self.message}"
+
+
+class HP4192ATraceBuffer:
+    """
+    Fixed-capacity ring buffer of HP 4192A trace events.
+
+    `categories` limits recording to those categories; `None` records all.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_TRACE_CAPACITY,
+        categories: Iterable[str] | None = None,
+    ):
+        if capacity < 1:
+            raise ValueError("trace capacity must be at least 1")
+        self._events: deque[_RawTraceEvent] = deque(maxlen=capacity)
+        self._categories = _validate_trace_categories(categories)
+        self._recorded = 0
+        self._started_at = time.perf_counter()
+        self._stream: TextIO | None = None
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen
+
+    @property
+    def categories(self) -> frozenset[str] | None:
+        return self._categories
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of events pushed out of the buffer since the last `clear()`.
+        """
+
+        return self._recorded - len(self._events)
+
+    @property
+    def started_at(self) -> float:
+        """
+        `time.perf_counter()` value that event times are relative to.
+        """
+
+        return self._started_at
+
+    def set_categories(self, categories: Iterable[str] | None) -> None:
+        self._categories = _validate_trace_categories(categories)
+
+    def set_stream(self, stream: TextIO | None) -> None:
+        """
+        Also write every new event to `stream` as one JSON line.
+
+        Streaming keeps a complete record of runs longer than the buffer.
+        `None` stops streaming.
+        """
+
+        self._stream = stream
+
+    def accepts(self, category: str) -> bool:
+        return self._categories is None or category in self._categories
+
+    def record(
+        self,
+        category: str,
+        message: str,
+        args: tuple = (),
+        *,
+        code: str | None = None,
+    ) -> None:
+        """
+        Store one event. `message` is a ``%``-style template for `args`.
+        """
+
+        self._append((time.perf_counter(), None, category, code, message, args))
+
+    def span(
+        self,
+        category: str,
+        message: str,
+        args: tuple = (),
+        *,
+        code: str | None = None,
+    ) -> "_TraceSpan":
+        """
+        Return a context manager that records one span around its block.
+        """
+
+        return _TraceSpan(self, category, code, message, args)
+
+    def clear(self) -> None:
+        self._events.clear()
+        self._recorded = 0
+        self._started_at = time.perf_counter()
+
+    def last(self) -> HP4192ATraceEvent | None:
+        if not self._events:
+            return None
+        return self._build_event(self._events[-1])
+
+    def events(self) -> list[HP4192ATraceEvent]:
+        """
+        Return instant events and spans, in the order they were recorded.
+
+        A span is recorded when it ends, so it follows the events inside it.
+        """
+
+        return [self._build_event(raw_event) for raw_event in self._events]
+
+    def lines(self) -> list[str]:
+        return [
+            str(self._build_event(raw_event))
+            for raw_event in self._events
+            if raw_event[1] is None
+        ]
+
+    def to_chrome_trace(self, *, process_name: str = "HP 4192A") -> dict[str, object]:
+        """
+        Return the buffer in Chrome trace event format.
+
+        Spans become complete (``"X"``) events and instant events become
+        ``"i"`` events, all on one thread of one process named
+        `process_name`.
+        """
+
+        trace_events: list[dict[str, object]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"name": process_name},
+            }
+        ]
+        for event in self.events():
+            trace_events.append(_chrome_trace_event(event))
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | os.PathLike, *, process_name: str = "HP 4192A") -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.to_chrome_trace(process_name=process_name), file)
+
+    def write_jsonl(self, file: TextIO) -> None:
+        """
+        Write one JSON object per event to `file`, oldest first.
+        """
+
+        for raw_event in self._events:
+            file.write(_event_json(self._build_event(raw_event)) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def _append(self, raw_event: _RawTraceEvent) -> None:
+        self._events.append(raw_event)
+        self._recorded += 1
+        if self._stream is not None:
+            self._stream.write(_event_json(self._build_event(raw_event)) + "\n")
+
+    def _build_event(self, raw_event: _RawTraceEvent) -> HP4192ATraceEvent:
+        timestamp, duration_s, category, code, message, args = raw_event
+        return HP4192ATraceEvent(
+            time_s=timestamp - self._started_at,
+            category=category,
+            code=code,
+            message=message % args if args else message,
+            duration_s=duration_s,
+        )
+
+
+class _TraceSpan:
+    __slots__ = ("_buffer", "_category", "_code", "_message", "_args", "_started_at")
+
+    def __init__(
+        self,
+        buffer: HP4192ATraceBuffer,
+        category: str,
+        code: str | None,
+        message: str,
+        args: tuple,
+    ):
+        self._buffer = buffer
+        self._category = category
+        self._code = code
+        self._message = message
+        self._args = args
+
+    def __enter__(self) -> None:
+        self._started_at = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        started_at = self._started_at
+        self._buffer._append(
+            (
+                started_at,
+                time.perf_counter() - started_at,
+                self._category,
+                self._code,
+                self._message,
+                self._args,
+            )
+        )
+
+
+def _chrome_trace_event(event: HP4192ATraceEvent) -> dict[str, object]:
+    args: dict[str, object] = {"message": event.message}
+    if event.code is not None:
+        args["code"] = event.code
+
+    chrome_event: dict[str, object] = {
+        "cat": event.category,
+        "pid": os.getpid(),
+        "tid": 0,
+        "ts": 1e6 * event.time_s,
+        "args": args,
+    }
+    if event.duration_s is None:
+        chrome_event["name"] = event.category
+        chrome_event["ph"] = "i"
+        chrome_event["s"] = "t"
+    else:
+        chrome_event["name"] = f"{event.category} {event.message}" if event.message else event.category
+        chrome_event["ph"] = "X"
+        chrome_event["dur"] = 1e6 * event.duration_s
+    return chrome_event
+
+
+def _event_json(event: HP4192ATraceEvent) -> str:
+    return json.dumps(asdict(event), separators=(",", ":"))
+
+
+def _validate_trace_categories(categories: Iterable[str] | None) -> frozenset[str] | None:
+    if categories is None:
+        return None
+    if isinstance(categories, str):
+        raise TypeError("trace categories must be an iterable of category names, not a string")
+
+    normalized = frozenset(category.upper() for category in categories)
+    unknown = sorted(normalized - HP4192A_TRACE_CATEGORIES)
+    if unknown:
+        raise ValueError(
+            f"Unsupported trace categories: {unknown}. "
+            f"Supported: {sorted(HP4192A_TRACE_CATEGORIES)}"
+        )
+    return normalized
@@ -7,6 +7,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import re
+from typing import Protocol
 
 
 @dataclass(slots=True)
@@ -90,6 +91,27 @@ def parse_visa_resource_name(resource_name: str) -> ConnectionInfo:
     )
 
 
+class InstrumentDevice(Protocol):
+    """
+    Message-based transport an instrument driver talks through.
+
+    `VisaDevice`, `SocketDevice`, `Vxi11Device`, the recording and replay
+    devices, and `HP4192AEmulator` all provide it.
+    """
+
+    resource_name: str
+
+    def write(self, message: str) -> None: ...
+
+    def read(self) -> str: ...
+
+    def clear(self) -> None: ...
+
+    def read_stb(self) -> int | None: ...
+
+    def close(self) -> None: ...
+
+
 @dataclass(slots=True)
 class InstrumentReport:
     """
@@ -0,0 +1,360 @@
+"""
+Record-and-replay transport for VISA-like devices.
+
+`RecordingDevice` wraps any device with the `VisaDevice` interface and records
+every write, read, clear, status-byte read, and I/O error, with its start time
+and duration, to a compact JSON Lines file (gzip-compressed when the path ends
+in ``.gz``). `ReplayDevice` plays such a file back: it checks that the driver
+writes what was recorded and answers reads with the recorded responses,
+including recorded timeouts and connection errors.
+
+Typical use:
+
+    meter = HP4192A(RecordingDevice(VisaDevice(resource), "session.jsonl.gz"))
+    ...
+    meter = HP4192A(ReplayDevice("session.jsonl.gz", timing="recorded"))
+
+File format: the first line is a header object. Every further line is one
+event ``[start_s, op, duration_s, payload]``, where `op` is ``w`` (write),
+``r`` (read), ``c`` (clear), ``s`` (read_stb), or ``e`` (failed operation;
+`payload` is ``[failed_op, exception_type, message]``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import json
+import os
+from pathlib import Path
+import time
+from typing import IO, Iterable, Literal, Mapping, TypeAlias
+
+from .instrument import InstrumentDevice
+
+
+ReplayTiming: TypeAlias = Literal["fast", "recorded"]
+
+_RECORDING_FORMAT = "instrument-recording"
+_RECORDING_VERSION = 1
+_REPLAY_RESOURCE_NAME = "REPLAY::INSTR"
+
+# Exception types a replay re-raises as themselves. Anything else is replayed
+# as RuntimeError, so a recording never names an arbitrary class to create.
+_REPLAYABLE_EXCEPTIONS: dict[str, type[Exception]] = {
+    "ConnectionError": ConnectionError,
+    "ConnectionResetError": ConnectionResetError,
+    "OSError": OSError,
+    "RuntimeError": RuntimeError,
+    "TimeoutError": TimeoutError,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _RecordedEvent:
+    start_s: float
+    op: str
+    duration_s: float
+    payload: object
+
+
+class RecordingDevice:
+    """
+    Pass-through device that records all I/O of `device` to `path`.
+
+    Events are written as they happen, so a crashed session still leaves a
+    usable recording up to the crash. `close()` closes both the file and the
+    wrapped device.
+    """
+
+    def __init__(self, device: InstrumentDevice, path: str | os.PathLike):
+        self._device = device
+        self.resource_name = device.resource_name
+        self.path = Path(path)
+        self._file = _open_recording(self.path, "w")
+        self._started_at = time.perf_counter()
+        self._write_line(
+            {
+                "format": _RECORDING_FORMAT,
+                "version": _RECORDING_VERSION,
+                "resource_name": self.resource_name,
+                "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            }
+        )
+
+    @property
+    def timeout(self):
+        return getattr(self._device, "timeout", None)
+
+    @timeout.setter
+    def timeout(self, value) -> None:
+        self._device.timeout = value
+
+    def write(self, message: str) -> None:
+        self._call("w", lambda: self._device.write(message), message, record_result=False)
+
+    def read(self) -> str:
+        return self._call("r", self._device.read, None, record_result=True)
+
+    def query(self, message: str) -> str:
+        # Recorded as a write and a read, so a replay does not depend on
+        # whether the driver uses query() or write()/read().
+        self.write(message)
+        return self.read()
+
+    def clear(self) -> None:
+        self._call("c", self._device.clear, None, record_result=False)
+
+    def read_stb(self) -> int | None:
+        return self._call("s", self._device.read_stb, None, record_result=True)
+
+    def close(self) -> None:
+        try:
+            self._device.close()
+        finally:
+            if not self._file.closed:
+                self._file.close()
+
+    def _call(self, op: str, function, payload: object, *, record_result: bool):
+        started_at = time.perf_counter()
+        try:
+            result = function()
+        except Exception as exc:
+            self._write_event(
+                started_at,
+                "e",
+                [op, type(exc).__name__, str(exc)],
+            )
+            raise
+        self._write_event(started_at, op, result if record_result else payload)
+        return result
+
+    def _write_event(self, started_at: float, op: str, payload: object) -> None:
+        duration_s = time.perf_counter() - started_at
+        self._write_line(
+            [
+                round(started_at - self._started_at, 6),
+                op,
+                round(duration_s, 6),
+                payload,
+            ]
+        )
+
+    def _write_line(self, value: object) -> None:
+        self._file.write(json.dumps(value, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+
+class ReplayDevice:
+    """
+    Device that plays back a `RecordingDevice` file.
+
+    - `timing="fast"` answers at once; `timing="recorded"` makes each write
+      and read take as long as it did when recorded. The driver's own
+      settle sleeps still run, so driver changes show up in replay timing.
+    - With `strict=True` (default) a write that differs from the recording
+      raises `RuntimeError`, so a driver change that alters the command
+      stream is caught instead of silently replaying mismatched responses.
+    - Reading past the end of the recording raises `RuntimeError`.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        timing: ReplayTiming = "fast",
+        strict: bool = True,
+    ):
+        header, events = _load_recording(Path(path))
+        self._setup(
+            events,
+            resource_name=str(header.get("resource_name", _REPLAY_RESOURCE_NAME)),
+            timing=timing,
+            strict=strict,
+        )
+
+    @classmethod
+    def from_trace_events(
+        cls,
+        events: Iterable[object],
+        *,
+        timing: ReplayTiming = "fast",
+        strict: bool = True,
+        resource_name: str | None = None,
+    ) -> "ReplayDevice":
+        """
+        Build a replay from HP 4192A driver trace events.
+
+        `events` are `HP4192ATraceEvent` records from
+        `HP4192A.get_trace_events()`, or the objects of a JSON Lines trace
+        export (`HP4192A.export_trace(path, format="jsonl")`) parsed with
+        `json.loads`. The trace must include the ``WRITE`` and ``READ``
+        categories. Trace buffers are bounded, so a long trace can start
+        mid-session.
+
+        A write or read that raised is replayed as the same error, like a
+        recorded `e` event.
+        """
+
+        recorded: list[_RecordedEvent] = []
+        pending_read: _RecordedEvent | None = None
+        for event in events:
+            category = _trace_event_field(event, "category")
+            duration_s = _trace_event_field(event, "duration_s")
+            message = _trace_event_field(event, "message")
+            time_s = _trace_event_field(event, "time_s")
+            error = _parse_trace_error(message) if duration_s is None else None
+
+            if category == "WRITE" and duration_s is not None:
+                recorded.append(_RecordedEvent(time_s, "w", duration_s, message))
+            elif category == "WRITE" and error is not None and recorded and recorded[-1].op == "w":
+                # The error line follows the span of the write that failed.
+                failed = recorded[-1]
+                recorded[-1] = _RecordedEvent(failed.start_s, "e", failed.duration_s, ["w", *error])
+            elif category == "READ" and duration_s is not None:
+                pending_read = _RecordedEvent(time_s, "r", duration_s, None)
+            elif category == "READ" and pending_read is not None:
+                # The READ span ends before the READ line that holds the
+                # stripped response, or the error the read raised.
+                if error is not None:
+                    op, payload = "e", ["r", *error]
+                else:
+                    op, payload = "r", "" if message == "<empty>" else message
+                recorded.append(
+                    _RecordedEvent(pending_read.start_s, op, pending_read.duration_s, payload)
+                )
+                pending_read = None
+
+        device = cls.__new__(cls)
+        device._setup(
+            recorded,
+            resource_name=resource_name or _REPLAY_RESOURCE_NAME,
+            timing=timing,
+            strict=strict,
+        )
+        return device
+
+    @property
+    def remaining(self) -> int:
+        """
+        Number of recorded events not replayed yet.
+        """
+
+        return len(self._events) - self._position
+
+    def _setup(
+        self,
+        events: list[_RecordedEvent],
+        *,
+        resource_name: str,
+        timing: ReplayTiming,
+        strict: bool,
+    ) -> None:
+        if timing not in ("fast", "recorded"):
+            raise ValueError(f"Unsupported replay timing: {timing!r}. Supported: ['fast', 'recorded']")
+        self.resource_name = resource_name
+        self.timeout = 5000
+        self._timing = timing
+        self._strict = strict
+        self._events = events
+        self._position = 0
+
+    def write(self, message: str) -> None:
+        event = self._next_event("w")
+        if self._strict and event.op == "w" and event.payload != message:
+            raise RuntimeError(
+                f"replay diverged at event {self._position}: "
+                f"recorded write {event.payload!r}, got {message!r}"
+            )
+        self._finish(event)
+
+    def read(self) -> str:
+        return self._finish(self._next_event("r"))
+
+    def query(self, message: str) -> str:
+        self.write(message)
+        return self.read()
+
+    def clear(self) -> None:
+        self._finish(self._next_event("c"))
+
+    def read_stb(self) -> int | None:
+        return self._finish(self._next_event("s"))
+
+    def close(self) -> None:
+        return None
+
+    def _next_event(self, op: str) -> _RecordedEvent:
+        if self._position >= len(self._events):
+            raise RuntimeError(f"replay recording exhausted at {_OP_NAMES[op]}")
+
+        event = self._events[self._position]
+        recorded_op = event.payload[0] if event.op == "e" else event.op
+        if recorded_op != op:
+            raise RuntimeError(
+                f"replay diverged at event {self._position + 1}: "
+                f"recorded {_OP_NAMES[recorded_op]}, got {_OP_NAMES[op]}"
+            )
+        self._position += 1
+        return event
+
+    def _finish(self, event: _RecordedEvent):
+        if self._timing == "recorded" and event.duration_s > 0.0:
+            time.sleep(event.duration_s)
+
+        if event.op == "e":
+            _op, exception_type, message = event.payload
+            raise _REPLAYABLE_EXCEPTIONS.get(exception_type, RuntimeError)(message)
+        if event.op == "w":
+            return None
+        return event.payload
+
+
+_OP_NAMES = {
+    "w": "write",
+    "r": "read",
+    "c": "clear",
+    "s": "read_stb",
+}
+
+
+def _trace_event_field(event: object, name: str):
+    if isinstance(event, Mapping):
+        return event[name]
+    return getattr(event, name)
+
+
+def _parse_trace_error(message: str) -> list[str] | None:
+    # Driver trace lines for failed I/O read ``<error TimeoutError: message>``.
+    if not (message.startswith("<error ") and message.endswith(">")):
+        return None
+    exception_type, _separator, text = message[len("<error ") : -1].partition(": ")
+    return [exception_type, text]
+
+
+def _open_recording(path: Path, mode: Literal["r", "w"]) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _load_recording(path: Path) -> tuple[dict[str, object], list[_RecordedEvent]]:
+    with _open_recording(path, "r") as file:
+        lines = [line for line in file if line.strip()]
+
+    if not lines:
+        raise ValueError(f"{path} is empty, not an instrument recording")
+    header = json.loads(lines[0])
+    if not isinstance(header, dict) or header.get("format") != _RECORDING_FORMAT:
+        raise ValueError(f"{path} is not an instrument recording")
+    if header.get("version") != _RECORDING_VERSION:
+        raise ValueError(f"Unsupported recording version in {path}: {header.get('version')!r}")
+
+    events: list[_RecordedEvent] = []
+    for line_number, line in enumerate(lines[1:], start=2):
+        try:
+            start_s, op, duration_s, payload = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"{path}:{line_number}: malformed recording event") from exc
+        events.append(_RecordedEvent(float(start_s), op, float(duration_s), payload))
+    return header, events
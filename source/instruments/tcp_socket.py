@@ -0,0 +1,281 @@
+"""
+Raw TCP socket transport with the same interface as `VisaDevice`.
+
+Some instruments and LAN/GPIB gateways expose a plain TCP socket port, for
+example ``TCPIP0::192.168.1.50::1234::SOCKET``. `SocketDevice` talks to that
+port directly, without PyVISA or a VISA backend. `AsyncSocketDevice` is the
+asyncio variant for code that runs on an event loop.
+
+A read timeout or connection error can leave a late reply in flight, so both
+devices close the connection instead of reading on from it. The next call
+opens a fresh connection to the same address.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+
+from .instrument import parse_visa_resource_name
+
+
+_DEFAULT_TERMINATION = "\n"
+_DEFAULT_CHUNK_SIZE = 4096
+_ENCODING = "ascii"
+
+
+class SocketDevice:
+    """
+    VISA-like device on a raw TCP socket.
+
+    - `write()` appends `write_termination` and sends the message in one
+      `sendall()`
+    - `read()` returns one message up to `read_termination`; received bytes
+      are buffered, so several messages that arrive in one TCP segment cost
+      one `recv()`
+    - `TCP_NODELAY` is enabled by default, so short program codes are sent at
+      once instead of waiting for Nagle's algorithm
+    - after a timeout or connection error the next call reconnects
+    """
+
+    def __init__(
+        self,
+        resource_name: str,
+        *,
+        timeout_ms: int = 5000,
+        read_termination: str = _DEFAULT_TERMINATION,
+        write_termination: str = _DEFAULT_TERMINATION,
+        nodelay: bool = True,
+        chunk_size: int = _DEFAULT_CHUNK_SIZE,
+        sock: socket.socket | None = None,
+    ):
+        self.resource_name = resource_name
+        self._read_termination = read_termination.encode(_ENCODING)
+        self._write_termination = write_termination.encode(_ENCODING)
+        self._chunk_size = chunk_size
+        self._nodelay = nodelay
+        self._buffer = bytearray()
+        self._timeout_ms = timeout_ms
+
+        if sock is None:
+            self._address = _socket_address(resource_name)
+            sock = self._connect()
+        else:
+            self._address = sock.getpeername()
+            if nodelay:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket: socket.socket | None = sock
+        self.timeout = timeout_ms
+
+    @property
+    def timeout(self) -> int:
+        return self._timeout_ms
+
+    @timeout.setter
+    def timeout(self, timeout_ms: int) -> None:
+        self._timeout_ms = timeout_ms
+        if self._socket is not None:
+            self._socket.settimeout(timeout_ms / 1000.0)
+
+    def write(self, message: str) -> None:
+        sock = self._ensure_socket()
+        try:
+            sock.sendall(message.encode(_ENCODING) + self._write_termination)
+        except OSError:
+            self._discard()
+            raise
+
+    def read(self) -> str:
+        termination = self._read_termination
+        while True:
+            index = self._buffer.find(termination)
+            if index >= 0:
+                data = bytes(self._buffer[:index])
+                del self._buffer[: index + len(termination)]
+                return data.decode(_ENCODING).strip()
+
+            sock = self._ensure_socket()
+            try:
+                chunk = sock.recv(self._chunk_size)
+            except socket.timeout as exc:
+                self._discard()
+                raise TimeoutError(
+                    f"{self.resource_name}: read timed out after {self._timeout_ms} ms"
+                ) from exc
+            except OSError:
+                self._discard()
+                raise
+            if not chunk:
+                self._discard()
+                raise ConnectionError(f"{self.resource_name}: connection closed by peer")
+            self._buffer += chunk
+
+    def query(self, message: str) -> str:
+        self.write(message)
+        return self.read()
+
+    def clear(self) -> None:
+        """
+        Drop buffered input. A raw socket has no device-clear message.
+        """
+
+        self._buffer.clear()
+
+    def read_stb(self) -> int | None:
+        return None
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _connect(self) -> socket.socket:
+        sock = socket.create_connection(self._address, timeout=self._timeout_ms / 1000.0)
+        if self._nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+    def _ensure_socket(self) -> socket.socket:
+        if self._socket is None:
+            self._socket = self._connect()
+        return self._socket
+
+    def _discard(self) -> None:
+        # A late reply may still arrive on this connection, and bytes already
+        # buffered belong to the failed exchange.
+        self._socket.close()
+        self._socket = None
+        self._buffer.clear()
+
+
+class AsyncSocketDevice:
+    """
+    Asyncio variant of `SocketDevice`.
+
+    Open it with ``await AsyncSocketDevice.open(resource_name)``. `write()`,
+    `read()`, and `query()` are coroutines; the timeout applies to each read.
+    As with `SocketDevice`, the next call after a timeout or connection error
+    reconnects.
+    """
+
+    def __init__(
+        self,
+        resource_name: str,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        *,
+        timeout_ms: int = 5000,
+        read_termination: str = _DEFAULT_TERMINATION,
+        write_termination: str = _DEFAULT_TERMINATION,
+    ):
+        self.resource_name = resource_name
+        self.timeout = timeout_ms
+        self._reader: asyncio.StreamReader | None = reader
+        self._writer: asyncio.StreamWriter | None = writer
+        self._address = writer.get_extra_info("peername")
+        self._nodelay = _has_nodelay(writer)
+        self._read_termination = read_termination.encode(_ENCODING)
+        self._write_termination = write_termination.encode(_ENCODING)
+
+    @classmethod
+    async def open(
+        cls,
+        resource_name: str,
+        *,
+        timeout_ms: int = 5000,
+        read_termination: str = _DEFAULT_TERMINATION,
+        write_termination: str = _DEFAULT_TERMINATION,
+        nodelay: bool = True,
+    ) -> "AsyncSocketDevice":
+        reader, writer = await _open_stream(_socket_address(resource_name), timeout_ms, nodelay)
+        return cls(
+            resource_name,
+            reader,
+            writer,
+            timeout_ms=timeout_ms,
+            read_termination=read_termination,
+            write_termination=write_termination,
+        )
+
+    async def write(self, message: str) -> None:
+        await self._ensure_stream()
+        try:
+            self._writer.write(message.encode(_ENCODING) + self._write_termination)
+            await self._writer.drain()
+        except OSError:
+            self._discard()
+            raise
+
+    async def read(self) -> str:
+        await self._ensure_stream()
+        try:
+            data = await asyncio.wait_for(
+                self._reader.readuntil(self._read_termination),
+                self.timeout / 1000.0,
+            )
+        except asyncio.TimeoutError as exc:
+            self._discard()
+            raise TimeoutError(
+                f"{self.resource_name}: read timed out after {self.timeout} ms"
+            ) from exc
+        except asyncio.IncompleteReadError as exc:
+            self._discard()
+            raise ConnectionError(f"{self.resource_name}: connection closed by peer") from exc
+        except OSError:
+            self._discard()
+            raise
+        return data[: -len(self._read_termination)].decode(_ENCODING).strip()
+
+    async def query(self, message: str) -> str:
+        await self.write(message)
+        return await self.read()
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            writer = self._writer
+            self._discard()
+            await writer.wait_closed()
+
+    async def _ensure_stream(self) -> None:
+        if self._writer is None:
+            self._reader, self._writer = await _open_stream(
+                self._address,
+                self.timeout,
+                self._nodelay,
+            )
+
+    def _discard(self) -> None:
+        self._writer.close()
+        self._reader = None
+        self._writer = None
+
+
+async def _open_stream(
+    address: tuple[str, int],
+    timeout_ms: int,
+    nodelay: bool,
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(*address[:2]),
+        timeout_ms / 1000.0,
+    )
+    if nodelay:
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return reader, writer
+
+
+def _has_nodelay(writer: asyncio.StreamWriter) -> bool:
+    sock = writer.get_extra_info("socket")
+    return sock is not None and bool(sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+
+
+def _socket_address(resource_name: str) -> tuple[str, int]:
+    info = parse_visa_resource_name(resource_name)
+    if info.host is None or info.socket_port is None:
+        raise ValueError(
+            f"{resource_name!r} is not a socket resource. "
+            "Expected TCPIP0::<host>::<port>::SOCKET"
+        )
+    return info.host, info.socket_port
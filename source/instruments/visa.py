@@ -1,13 +1,189 @@
 """
-PyVISA access and a minimal mock device.
+PyVISA access, a shared resource-manager pool, and a minimal mock device.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+import atexit
+import threading
+
+
+@dataclass(slots=True)
+class _PooledResourceManager:
+    resource_manager: object
+    users: int = 0
+    closed: bool = False
+
+
+# Process-wide VISA resource managers, keyed by backend (`None` is the default
+# backend). Opening a resource manager initializes the whole VISA backend, so
+# managers are shared between devices and kept open while idle until
+# `close_resource_managers()`, a `release_resource_manager(close=True)` by the
+# last user, or interpreter exit.
+_RESOURCE_MANAGER_POOL: dict[str | None, _PooledResourceManager] = {}
+# Every open manager by identity, with its users from the pool and from
+# private `VisaDevice` managers. PyVISA returns the same `ResourceManager`
+# object for every request on one VISA library, so a "private" manager is
+# usually the pooled one, and neither side may close it under the other.
+_OPEN_RESOURCE_MANAGERS: dict[int, _PooledResourceManager] = {}
+# Backends whose shared manager `close_resource_managers(force=True)` closed
+# while it still had users. Their later releases are no-ops.
+_FORCE_CLOSED_BACKENDS: set[str | None] = set()
+_RESOURCE_MANAGER_POOL_LOCK = threading.Lock()
+
+
+def acquire_resource_manager(backend: str | None = None) -> object:
+    """
+    Return the shared VISA resource manager for `backend` and count one user.
+
+    Every call must be paired with `release_resource_manager(backend)`.
+    """
+
+    return _acquire_shared_resource_manager(backend).resource_manager
+
+
+def release_resource_manager(backend: str | None = None, *, close: bool = False) -> None:
+    """
+    Drop one user of the shared VISA resource manager for `backend`.
+
+    By default the manager stays open while idle, so the next device opens
+    without re-initializing the backend. With `close=True` it is closed as
+    soon as this was its last user, for deterministic shutdown.
+
+    After `close_resource_managers(force=True)` closed the manager under its
+    users, their releases are no-ops instead of errors.
+    """
+
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        pooled = _RESOURCE_MANAGER_POOL.get(backend)
+        if pooled is None or pooled.users == 0:
+            if backend in _FORCE_CLOSED_BACKENDS:
+                return
+            raise RuntimeError(f"VISA resource manager {backend or 'default'!r} was not acquired")
+        _drop_pooled_user(pooled, close=close)
+
+
+def close_resource_managers(*, force: bool = False) -> None:
+    """
+    Close shared VISA resource managers that have no users left.
+
+    With `force=True`, close every shared manager, including ones still in use.
+    Devices still open on a force-closed manager count as released, so their
+    `close()` only closes the resource. This also runs automatically at
+    interpreter exit.
+    """
+
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        for backend, pooled in list(_RESOURCE_MANAGER_POOL.items()):
+            if pooled.users and not force:
+                continue
+            if pooled.users:
+                _FORCE_CLOSED_BACKENDS.add(backend)
+            if not pooled.closed:
+                _close_tracked_resource_manager(pooled)
+
+
+atexit.register(close_resource_managers, force=True)
+
+
+def _acquire_shared_resource_manager(backend: str | None) -> _PooledResourceManager:
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        pooled = _RESOURCE_MANAGER_POOL.get(backend)
+        if pooled is None:
+            pooled = _track_resource_manager(_open_resource_manager(backend))
+            _RESOURCE_MANAGER_POOL[backend] = pooled
+        pooled.users += 1
+        return pooled
+
+
+def _release_shared_resource_manager(pooled: _PooledResourceManager, *, close: bool) -> None:
+    # Releases the entry the device acquired, not whatever the pool holds for
+    # its backend now, so a force-closed and reopened manager keeps its count.
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        if not pooled.closed:
+            _drop_pooled_user(pooled, close=close)
+
+
+def _drop_pooled_user(pooled: _PooledResourceManager, *, close: bool) -> None:
+    # Called with the pool lock held.
+    pooled.users -= 1
+    if close and pooled.users == 0:
+        _close_tracked_resource_manager(pooled)
+
+
+def _acquire_private_resource_manager(backend: str | None) -> _PooledResourceManager:
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        tracked = _track_resource_manager(_open_resource_manager(backend))
+        tracked.users += 1
+        return tracked
+
+
+def _release_private_resource_manager(tracked: _PooledResourceManager) -> None:
+    with _RESOURCE_MANAGER_POOL_LOCK:
+        if tracked.closed:
+            return
+        tracked.users -= 1
+        if tracked.users == 0:
+            _close_tracked_resource_manager(tracked)
+
+
+def _track_resource_manager(resource_manager: object) -> _PooledResourceManager:
+    # Called with the pool lock held.
+    tracked = _OPEN_RESOURCE_MANAGERS.get(id(resource_manager))
+    if tracked is None or tracked.resource_manager is not resource_manager:
+        tracked = _PooledResourceManager(resource_manager)
+        _OPEN_RESOURCE_MANAGERS[id(resource_manager)] = tracked
+    return tracked
+
+
+def _close_tracked_resource_manager(tracked: _PooledResourceManager) -> None:
+    # Called with the pool lock held. Drops every reference to the manager,
+    # including pool entries of other backends that resolved to it, and marks
+    # the entry closed so its remaining users release nothing.
+    tracked.closed = True
+    for backend, pooled in list(_RESOURCE_MANAGER_POOL.items()):
+        if pooled is tracked:
+            del _RESOURCE_MANAGER_POOL[backend]
+    _OPEN_RESOURCE_MANAGERS.pop(id(tracked.resource_manager), None)
+    if hasattr(tracked.resource_manager, "close"):
+        tracked.resource_manager.close()
+
+
+def _open_resource_manager(backend: str | None) -> object:
+    try:
+        import pyvisa
+    except ImportError as exc:
+        raise ImportError(
+            "pyvisa is required for VisaDevice. Install with: pip install pyvisa"
+        ) from exc
+
+    try:
+        if backend is None:
+            return pyvisa.ResourceManager()
+        return pyvisa.ResourceManager(backend)
+    except Exception as exc:
+        raise RuntimeError(
+            "Could not open a VISA resource manager. "
+            "Check that a VISA backend is installed and working."
+        ) from exc
+
 
 class VisaDevice:
     """
     Thin wrapper around a VISA resource.
+
+    Without an explicit `resource_manager`, the device uses the shared
+    resource manager for its backend (see `acquire_resource_manager()`).
+    With `close_idle_resource_manager=True`, `close()` closes that manager when
+    this device was its last user instead of keeping it open while idle.
+
+    `share_resource_manager=False` opens the manager with
+    `pyvisa.ResourceManager()` instead of taking it from the pool. PyVISA
+    returns one manager object per VISA library, so this is only a separate
+    library session when `backend` names a different library than the other
+    devices use. Either way, a manager that other devices still use is never
+    closed by this device.
     """
 
     def __init__(
@@ -20,37 +196,34 @@ class VisaDevice:
         resource: object | None = None,
         read_termination: str | None = None,
         write_termination: str | None = None,
+        share_resource_manager: bool = True,
+        close_idle_resource_manager: bool = False,
     ):
+        # Pool entry of the manager this device acquired and must release.
+        self._shared_resource_manager: _PooledResourceManager | None = None
+        self._private_resource_manager: _PooledResourceManager | None = None
+        self._backend = backend
+        self._close_idle_resource_manager = close_idle_resource_manager
+
         if resource is not None:
             self._resource_manager = resource_manager
             self._resource = resource
-            self._owns_resource_manager = False
             self.resource_name = getattr(resource, "resource_name", resource_name)
         else:
-            try:
-                import pyvisa
-            except ImportError as exc:
-                raise ImportError(
-                    "pyvisa is required for VisaDevice. Install with: pip install pyvisa"
-                ) from exc
-
             if resource_manager is None:
-                try:
-                    if backend is None:
-                        resource_manager = pyvisa.ResourceManager()
-                    else:
-                        resource_manager = pyvisa.ResourceManager(backend)
-                except Exception as exc:
-                    raise RuntimeError(
-                        "Could not open a VISA resource manager. "
-                        "Check that a VISA backend is installed and working."
-                    ) from exc
-                self._owns_resource_manager = True
-            else:
-                self._owns_resource_manager = False
+                if share_resource_manager:
+                    self._shared_resource_manager = _acquire_shared_resource_manager(backend)
+                    resource_manager = self._shared_resource_manager.resource_manager
+                else:
+                    self._private_resource_manager = _acquire_private_resource_manager(backend)
+                    resource_manager = self._private_resource_manager.resource_manager
 
             self._resource_manager = resource_manager
-            self._resource = self._resource_manager.open_resource(resource_name)
+            try:
+                self._resource = self._resource_manager.open_resource(resource_name)
+            except Exception:
+                self._release_resource_manager()
+                raise
             self.resource_name = resource_name
 
         self._resource.timeout = timeout_ms
@@ -78,9 +251,20 @@ class VisaDevice:
         return None
 
     def close(self) -> None:
-        self._resource.close()
-        if self._owns_resource_manager and hasattr(self._resource_manager, "close"):
-            self._resource_manager.close()
+        try:
+            self._resource.close()
+        finally:
+            self._release_resource_manager()
+
+    def _release_resource_manager(self) -> None:
+        if self._shared_resource_manager is not None:
+            pooled = self._shared_resource_manager
+            self._shared_resource_manager = None
+            _release_shared_resource_manager(pooled, close=self._close_idle_resource_manager)
+        elif self._private_resource_manager is not None:
+            tracked = self._private_resource_manager
+            self._private_resource_manager = None
+            _release_private_resource_manager(tracked)
 
 
 class MockVisaDevice:
@@ -0,0 +1,593 @@
+"""
+Pure-Python VXI-11 client transport with the same interface as `VisaDevice`.
+
+LAN/GPIB gateways such as the Keysight E5810 expose GPIB instruments as
+``TCPIP0::<ip>::gpib0,<addr>::INSTR`` resources. Those are VXI-11 links: ONC
+RPC calls to the gateway's core channel. `Vxi11Device` makes those calls
+directly, so no vendor VISA install is needed.
+
+Implemented core-channel calls:
+
+- ``create_link`` / ``destroy_link``
+- ``device_write`` / ``device_read``
+- ``device_trigger``, ``device_clear``, ``device_readstb``
+
+All links to the same gateway share one TCP connection to its core channel.
+Opening a rack of instruments behind one gateway therefore costs one portmapper
+lookup and one TCP handshake, not one per instrument. Calls on that connection
+are serialized, so analyzers behind one gateway take turns on it: while one
+link waits in ``device_read`` for a slow measurement, the others wait too.
+Code that drives several analyzers concurrently (such as `AsyncHP4192A`)
+passes ``share_connection=False`` to give each link its own connection.
+
+A timeout or connection error in the middle of a call can leave a late reply
+on the connection, so the connection is closed and dropped instead. Every link
+on it reconnects and creates its link again on its next call.
+
+The abort channel and the interrupt channel are not implemented.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import socket
+import struct
+import threading
+
+
+_PORTMAPPER_PORT = 111
+_PORTMAPPER_PROGRAM = 100000
+_PORTMAPPER_VERSION = 2
+_PORTMAPPER_GETPORT = 3
+_IPPROTO_TCP = 6
+
+_CORE_PROGRAM = 0x0607AF
+_CORE_VERSION = 1
+_CREATE_LINK = 10
+_DEVICE_WRITE = 11
+_DEVICE_READ = 12
+_DEVICE_READSTB = 13
+_DEVICE_TRIGGER = 14
+_DEVICE_CLEAR = 15
+_DESTROY_LINK = 23
+
+_FLAG_WAITLOCK = 0x01
+_FLAG_END = 0x08
+_FLAG_TERMCHRSET = 0x80
+
+_READ_REASON_REQCNT = 0x01
+_READ_REASON_CHR = 0x02
+_READ_REASON_END = 0x04
+
+_RPC_VERSION = 2
+_MSG_CALL = 0
+_MSG_REPLY = 1
+_REPLY_ACCEPTED = 0
+_ACCEPT_SUCCESS = 0
+_LAST_FRAGMENT = 0x80000000
+
+_DEFAULT_READ_SIZE = 0x10000
+# PyVISA's default for message-based resources, so `transport="vxi11"` sends
+# the same bytes as `VisaDevice`.
+_DEFAULT_WRITE_TERMINATION = "\r\n"
+_ENCODING = "ascii"
+
+# VXI-11 specification, table B.2.
+_DEVICE_ERROR_MESSAGES = {
+    1: "syntax error",
+    3: "device not accessible",
+    4: "invalid link identifier",
+    5: "parameter error",
+    6: "channel not established",
+    8: "operation not supported",
+    9: "out of resources",
+    11: "device locked by another link",
+    12: "no lock held by this link",
+    15: "I/O timeout",
+    17: "I/O error",
+    21: "invalid address",
+    23: "abort",
+    29: "channel already established",
+}
+_DEVICE_ERROR_IO_TIMEOUT = 15
+
+
+class Vxi11Error(RuntimeError):
+    """
+    Raised when the gateway answers a VXI-11 call with a device error code.
+    """
+
+    def __init__(self, call_name: str, error_code: int):
+        self.error_code = error_code
+        description = _DEVICE_ERROR_MESSAGES.get(error_code, "unknown error")
+        super().__init__(f"VXI-11 {call_name} failed: {description} (error {error_code})")
+
+
+class Vxi11Device:
+    """
+    VISA-like device on one VXI-11 link.
+
+    `resource_name` is a VISA-style name such as
+    ``TCPIP0::192.168.1.244::gpib0,5::INSTR``. Without a device part
+    (``TCPIP0::<ip>::INSTR``) the link goes to ``inst0``.
+
+    `write()` appends `write_termination` (CR LF by default, as PyVISA does)
+    and sends END with the last byte. `read()` reads until the instrument
+    signals END (EOI on GPIB) or, when `read_termination` is set, until that
+    character.
+
+    `core_port` skips the portmapper lookup and connects to that core-channel
+    port directly, for example on a local stand-in server.
+
+    `share_connection=False` opens a core-channel connection for this link
+    alone instead of sharing the gateway's, so its calls do not wait behind
+    calls on other links. Each connection uses one of the gateway's client
+    slots.
+    """
+
+    def __init__(
+        self,
+        resource_name: str,
+        *,
+        timeout_ms: int = 5000,
+        lock_timeout_ms: int = 0,
+        read_termination: str | None = None,
+        write_termination: str = _DEFAULT_WRITE_TERMINATION,
+        core_port: int | None = None,
+        share_connection: bool = True,
+    ):
+        host, device_name = _parse_vxi11_resource_name(resource_name)
+        self.resource_name = resource_name
+        self.timeout = timeout_ms
+        self._host = host
+        self._device_name = device_name
+        self._core_port = core_port
+        self._share_connection = share_connection
+        self._lock_timeout_ms = lock_timeout_ms
+        self._read_termination = read_termination
+        self._write_termination = write_termination.encode(_ENCODING)
+        self._link_id: int | None = None
+        self._max_receive_size = 0
+        self._connection = _acquire_connection(host, core_port, timeout_ms, shared=share_connection)
+        try:
+            self._ensure_link()
+        except Exception:
+            _release_connection(self._connection)
+            raise
+        self._closed = False
+
+    def write(self, message: str) -> None:
+        self._ensure_link()
+        data = message.encode(_ENCODING) + self._write_termination
+        chunk_size = self._max_receive_size or len(data) or 1
+        offset = 0
+        while True:
+            chunk = data[offset : offset + chunk_size]
+            offset += len(chunk)
+            is_last = offset >= len(data)
+            self._connection.device_write(
+                self._link_id,
+                chunk,
+                io_timeout_ms=self.timeout,
+                lock_timeout_ms=self._lock_timeout_ms,
+                flags=_FLAG_END if is_last else 0,
+            )
+            if is_last:
+                return
+
+    def read(self) -> str:
+        self._ensure_link()
+        flags = 0
+        term_char = 0
+        if self._read_termination:
+            flags |= _FLAG_TERMCHRSET
+            term_char = ord(self._read_termination[-1])
+
+        parts: list[bytes] = []
+        while True:
+            reason, data = self._connection.device_read(
+                self._link_id,
+                request_size=_DEFAULT_READ_SIZE,
+                io_timeout_ms=self.timeout,
+                lock_timeout_ms=self._lock_timeout_ms,
+                flags=flags,
+                term_char=term_char,
+            )
+            parts.append(data)
+            if reason & (_READ_REASON_END | _READ_REASON_CHR):
+                return b"".join(parts).decode(_ENCODING).strip()
+
+    def query(self, message: str) -> str:
+        self.write(message)
+        return self.read()
+
+    def trigger(self) -> None:
+        """
+        Send a GPIB group execute trigger (``device_trigger``).
+        """
+
+        self._ensure_link()
+        self._connection.device_generic(
+            _DEVICE_TRIGGER,
+            "device_trigger",
+            self._link_id,
+            io_timeout_ms=self.timeout,
+            lock_timeout_ms=self._lock_timeout_ms,
+        )
+
+    def clear(self) -> None:
+        self._ensure_link()
+        self._connection.device_generic(
+            _DEVICE_CLEAR,
+            "device_clear",
+            self._link_id,
+            io_timeout_ms=self.timeout,
+            lock_timeout_ms=self._lock_timeout_ms,
+        )
+
+    def read_stb(self) -> int | None:
+        self._ensure_link()
+        unpacker = self._connection.device_generic(
+            _DEVICE_READSTB,
+            "device_readstb",
+            self._link_id,
+            io_timeout_ms=self.timeout,
+            lock_timeout_ms=self._lock_timeout_ms,
+        )
+        return unpacker.unpack_uint() & 0xFF
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._link_id is not None and not self._connection.broken:
+                self._connection.destroy_link(self._link_id)
+        finally:
+            _release_connection(self._connection)
+
+    def _ensure_link(self) -> None:
+        if self._connection.broken:
+            # The gateway drops the links of a closed connection, so this link
+            # is created again on a fresh one.
+            connection = _acquire_connection(
+                self._host,
+                self._core_port,
+                self.timeout,
+                shared=self._share_connection,
+            )
+            _release_connection(self._connection)
+            self._connection = connection
+            self._link_id = None
+        if self._link_id is None:
+            self._link_id, self._max_receive_size = self._connection.create_link(
+                self._device_name,
+                lock_timeout_ms=self._lock_timeout_ms,
+            )
+
+
+class _Vxi11Connection:
+    """
+    One TCP connection to a gateway's VXI-11 core channel, shared by every
+    link to that gateway unless a link opened its own. Calls are serialized
+    by a lock.
+
+    A call that fails on the socket (timeout, connection error, or a reply
+    for another call) marks the connection `broken`, closes it, and drops it
+    from the shared connections, because a late reply may still arrive on it.
+    """
+
+    def __init__(self, host: str, port: int | None, timeout_ms: int):
+        self.key = (host, port)
+        self.users = 0
+        self.broken = False
+        self._lock = threading.Lock()
+        self._xids = itertools.count(1)
+        self._client_ids = itertools.count(1)
+        if port is None:
+            port = _get_core_channel_port(host, timeout_ms)
+        self._socket = socket.create_connection((host, port), timeout=timeout_ms / 1000.0)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def create_link(self, device_name: str, *, lock_timeout_ms: int) -> tuple[int, int]:
+        packer = _XdrPacker()
+        packer.pack_int(next(self._client_ids))
+        packer.pack_bool(False)
+        packer.pack_uint(lock_timeout_ms)
+        packer.pack_string(device_name.encode(_ENCODING))
+        unpacker = self._call(_CREATE_LINK, packer)
+        _check_device_error("create_link", unpacker.unpack_int())
+        link_id = unpacker.unpack_int()
+        unpacker.unpack_uint()  # abort port, unused
+        max_receive_size = unpacker.unpack_uint()
+        return link_id, max_receive_size
+
+    def device_write(
+        self,
+        link_id: int,
+        data: bytes,
+        *,
+        io_timeout_ms: int,
+        lock_timeout_ms: int,
+        flags: int,
+    ) -> None:
+        packer = _XdrPacker()
+        packer.pack_int(link_id)
+        packer.pack_uint(io_timeout_ms)
+        packer.pack_uint(lock_timeout_ms)
+        packer.pack_int(flags | (_FLAG_WAITLOCK if lock_timeout_ms else 0))
+        packer.pack_opaque(data)
+        unpacker = self._call(_DEVICE_WRITE, packer, io_timeout_ms=io_timeout_ms)
+        _check_device_error("device_write", unpacker.unpack_int())
+        unpacker.unpack_uint()  # bytes written
+
+    def device_read(
+        self,
+        link_id: int,
+        *,
+        request_size: int,
+        io_timeout_ms: int,
+        lock_timeout_ms: int,
+        flags: int,
+        term_char: int,
+    ) -> tuple[int, bytes]:
+        packer = _XdrPacker()
+        packer.pack_int(link_id)
+        packer.pack_uint(request_size)
+        packer.pack_uint(io_timeout_ms)
+        packer.pack_uint(lock_timeout_ms)
+        packer.pack_int(flags | (_FLAG_WAITLOCK if lock_timeout_ms else 0))
+        packer.pack_int(term_char)
+        unpacker = self._call(_DEVICE_READ, packer, io_timeout_ms=io_timeout_ms)
+        _check_device_error("device_read", unpacker.unpack_int())
+        reason = unpacker.unpack_int()
+        return reason, unpacker.unpack_opaque()
+
+    def device_generic(
+        self,
+        procedure: int,
+        call_name: str,
+        link_id: int,
+        *,
+        io_timeout_ms: int,
+        lock_timeout_ms: int,
+    ) -> "_XdrUnpacker":
+        packer = _XdrPacker()
+        packer.pack_int(link_id)
+        packer.pack_int(_FLAG_WAITLOCK if lock_timeout_ms else 0)
+        packer.pack_uint(lock_timeout_ms)
+        packer.pack_uint(io_timeout_ms)
+        unpacker = self._call(procedure, packer, io_timeout_ms=io_timeout_ms)
+        _check_device_error(call_name, unpacker.unpack_int())
+        return unpacker
+
+    def destroy_link(self, link_id: int) -> None:
+        packer = _XdrPacker()
+        packer.pack_int(link_id)
+        unpacker = self._call(_DESTROY_LINK, packer)
+        _check_device_error("destroy_link", unpacker.unpack_int())
+
+    def close(self) -> None:
+        self._socket.close()
+
+    def _call(
+        self,
+        procedure: int,
+        arguments: "_XdrPacker",
+        *,
+        io_timeout_ms: int = 0,
+    ) -> "_XdrUnpacker":
+        with self._lock:
+            if self.broken:
+                raise ConnectionError(
+                    f"VXI-11 connection to {self.key[0]} was closed after an earlier error"
+                )
+            # The gateway may legitimately hold a read for the full I/O timeout
+            # before answering, so the socket waits a little longer than that.
+            self._socket.settimeout(max(io_timeout_ms / 1000.0 + 1.0, 5.0))
+            try:
+                return _rpc_call(
+                    self._socket,
+                    next(self._xids),
+                    _CORE_PROGRAM,
+                    _CORE_VERSION,
+                    procedure,
+                    arguments,
+                )
+            except OSError:
+                self._discard()
+                raise
+
+    def _discard(self) -> None:
+        self.broken = True
+        self._socket.close()
+        with _CONNECTIONS_LOCK:
+            if _CONNECTIONS.get(self.key) is self:
+                del _CONNECTIONS[self.key]
+
+
+# Shared core-channel connections keyed by (host, core port). A connection is
+# closed when its last link is destroyed. Unshared connections are not listed.
+_CONNECTIONS: dict[tuple[str, int | None], _Vxi11Connection] = {}
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _acquire_connection(
+    host: str,
+    port: int | None,
+    timeout_ms: int,
+    *,
+    shared: bool = True,
+) -> _Vxi11Connection:
+    if not shared:
+        connection = _Vxi11Connection(host, port, timeout_ms)
+        connection.users = 1
+        return connection
+    with _CONNECTIONS_LOCK:
+        connection = _CONNECTIONS.get((host, port))
+        if connection is None:
+            connection = _Vxi11Connection(host, port, timeout_ms)
+            _CONNECTIONS[(host, port)] = connection
+        connection.users += 1
+        return connection
+
+
+def _release_connection(connection: _Vxi11Connection) -> None:
+    with _CONNECTIONS_LOCK:
+        connection.users -= 1
+        if connection.users > 0:
+            return
+        if _CONNECTIONS.get(connection.key) is connection:
+            del _CONNECTIONS[connection.key]
+    connection.close()
+
+
+def _get_core_channel_port(host: str, timeout_ms: int) -> int:
+    packer = _XdrPacker()
+    packer.pack_uint(_CORE_PROGRAM)
+    packer.pack_uint(_CORE_VERSION)
+    packer.pack_uint(_IPPROTO_TCP)
+    packer.pack_uint(0)
+    with socket.create_connection((host, _PORTMAPPER_PORT), timeout=timeout_ms / 1000.0) as sock:
+        unpacker = _rpc_call(
+            sock,
+            1,
+            _PORTMAPPER_PROGRAM,
+            _PORTMAPPER_VERSION,
+            _PORTMAPPER_GETPORT,
+            packer,
+        )
+    port = unpacker.unpack_uint()
+    if port == 0:
+        raise RuntimeError(f"{host} does not offer a VXI-11 core channel")
+    return port
+
+
+def _rpc_call(
+    sock: socket.socket,
+    xid: int,
+    program: int,
+    version: int,
+    procedure: int,
+    arguments: "_XdrPacker",
+) -> "_XdrUnpacker":
+    header = _XdrPacker()
+    for value in (xid, _MSG_CALL, _RPC_VERSION, program, version, procedure):
+        header.pack_uint(value)
+    # AUTH_NULL credentials and verifier.
+    for value in (0, 0, 0, 0):
+        header.pack_uint(value)
+    message = header.get_buffer() + arguments.get_buffer()
+    sock.sendall(struct.pack(">I", _LAST_FRAGMENT | len(message)) + message)
+
+    unpacker = _XdrUnpacker(_receive_record(sock))
+    if unpacker.unpack_uint() != xid:
+        # A late reply to an earlier call: the stream is out of step.
+        raise ConnectionError("VXI-11 reply did not match the request")
+    if unpacker.unpack_uint() != _MSG_REPLY:
+        raise RuntimeError("VXI-11 peer did not send an RPC reply")
+    if unpacker.unpack_uint() != _REPLY_ACCEPTED:
+        raise RuntimeError(f"VXI-11 RPC call {procedure} was rejected")
+    unpacker.unpack_uint()  # verifier flavor
+    unpacker.unpack_opaque()  # verifier body
+    accept_status = unpacker.unpack_uint()
+    if accept_status != _ACCEPT_SUCCESS:
+        raise RuntimeError(f"VXI-11 RPC call {procedure} failed with accept status {accept_status}")
+    return unpacker
+
+
+def _receive_record(sock: socket.socket) -> bytes:
+    fragments: list[bytes] = []
+    while True:
+        (marker,) = struct.unpack(">I", _receive_exactly(sock, 4))
+        fragments.append(_receive_exactly(sock, marker & ~_LAST_FRAGMENT))
+        if marker & _LAST_FRAGMENT:
+            return b"".join(fragments)
+
+
+def _receive_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        try:
+            chunk = sock.recv(size - len(data))
+        except socket.timeout as exc:
+            raise TimeoutError("VXI-11 gateway did not answer in time") from exc
+        if not chunk:
+            raise ConnectionError("VXI-11 connection closed by gateway")
+        data += chunk
+    return bytes(data)
+
+
+def _check_device_error(call_name: str, error_code: int) -> None:
+    if error_code == 0:
+        return
+    if error_code == _DEVICE_ERROR_IO_TIMEOUT:
+        raise TimeoutError(str(Vxi11Error(call_name, error_code)))
+    raise Vxi11Error(call_name, error_code)
+
+
+def _parse_vxi11_resource_name(resource_name: str) -> tuple[str, str]:
+    parts = resource_name.strip().split("::")
+    if len(parts) < 3 or not re.fullmatch(r"TCPIP\d*", parts[0], re.IGNORECASE):
+        raise ValueError(
+            f"{resource_name!r} is not a VXI-11 resource. "
+            "Expected TCPIP0::<host>::<device>::INSTR"
+        )
+    if parts[-1].upper() != "INSTR":
+        raise ValueError(f"{resource_name!r} is not an INSTR resource")
+    device_name = parts[2] if len(parts) >= 4 else "inst0"
+    return parts[1], device_name
+
+
+class _XdrPacker:
+    def __init__(self):
+        self._parts: list[bytes] = []
+
+    def pack_uint(self, value: int) -> None:
+        self._append(struct.pack(">I", value & 0xFFFFFFFF))
+
+    def pack_int(self, value: int) -> None:
+        self._append(struct.pack(">i", value))
+
+    def pack_bool(self, value: bool) -> None:
+        self.pack_uint(1 if value else 0)
+
+    def pack_opaque(self, data: bytes) -> None:
+        self.pack_uint(len(data))
+        self._append(data + b"\0" * (-len(data) % 4))
+
+    def pack_string(self, data: bytes) -> None:
+        self.pack_opaque(data)
+
+    def get_buffer(self) -> bytes:
+        return b"".join(self._parts)
+
+    def _append(self, data: bytes) -> None:
+        self._parts.append(data)
+
+
+class _XdrUnpacker:
+    def __init__(self, data: bytes):
+        self._data = data
+        self._position = 0
+
+    def unpack_uint(self) -> int:
+        return struct.unpack(">I", self._take(4))[0]
+
+    def unpack_int(self) -> int:
+        return struct.unpack(">i", self._take(4))[0]
+
+    def unpack_opaque(self) -> bytes:
+        size = self.unpack_uint()
+        data = self._take(size)
+        self._take(-size % 4)
+        return data
+
+    def _take(self, size: int) -> bytes:
+        end = self._position + size
+        if end > len(self._data):
+            raise RuntimeError("VXI-11 reply was shorter than expected")
+        data = self._data[self._position : end]
+        self._position = end
+        return data